@@ -0,0 +1,12 @@
+"""Package `api`: servidor HTTP/JSON local sobre GymController.
+
+Uso desde la raíz del proyecto::
+
+    python -m api --db gimnasio.db --port 8080 --readers 8
+"""
+
+from .routes import Ruta, RUTAS
+from .server import GymAPI, GymAPIServer, serve
+from .sessions import SessionStore
+
+__all__ = ['Ruta', 'RUTAS', 'GymAPI', 'GymAPIServer', 'serve', 'SessionStore']
@@ -0,0 +1,34 @@
+"""Línea de comandos del servidor: ``python -m api --help``."""
+
+import argparse
+import logging
+import sys
+
+from .server import serve
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m api',
+                                     description="API HTTP/JSON de GymForTheMoment")
+    parser.add_argument('--db', default='gimnasio.db', help="Archivo de base de datos")
+    parser.add_argument('--host', default='127.0.0.1', help="Dirección en la que escuchar")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--readers', type=int, default=4, help="Conexiones de lectura en paralelo")
+    parser.add_argument('--profile', default='balanced', help="Perfil de rendimiento de Database")
+    parser.add_argument('--session-ttl', type=float, default=8 * 3600,
+                        help="Segundos de inactividad tras los que caduca una sesión")
+    parser.add_argument('--log-level', default='WARNING',
+                        choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'))
+    args = parser.parse_args(argv)
+
+    # El controlador configura INFO al importarse; en el servidor cada
+    # operación de los servicios lo registraría
+    logging.getLogger().setLevel(args.log_level)
+    logging.getLogger('api').setLevel(logging.INFO)
+    serve(args.db, host=args.host, port=args.port, readers=args.readers,
+          profile=args.profile, session_ttl=args.session_ttl)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
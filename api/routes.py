@@ -0,0 +1,128 @@
+"""Tabla de rutas de la API: cada ruta es una operación de ``GymController``.
+
+Los segmentos ``{nombre}`` de la ruta se pasan como argumentos enteros; el
+resto de argumentos llegan en la query string (GET) o en el cuerpo JSON
+(POST, PUT, DELETE). Los nombres de los argumentos son los de los métodos
+del controlador.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Nivel de sesión que exige una ruta
+PUBLICA = 'publica'
+SESION = 'sesion'
+ADMIN = 'admin'
+
+
+@dataclass(frozen=True)
+class Ruta:
+    """Operación expuesta por la API.
+
+    Attributes:
+        metodo: Método HTTP
+        patron: Ruta con segmentos ``{nombre}`` para los identificadores
+        accion: Método de ``GymController`` que la atiende
+        escritura: Si modifica la base de datos (se serializa en el escritor)
+        acceso: PUBLICA, SESION o ADMIN
+        propietario: Recurso ('reservas', 'recibos', 'notificaciones') del
+            argumento de la ruta; solo su cliente o un admin pueden usarla
+    """
+    metodo: str
+    patron: str
+    accion: str
+    escritura: bool = False
+    acceso: str = SESION
+    propietario: Optional[str] = None
+    regex: Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        regex = re.sub(r'\{(\w+)\}', r'(?P<\1>[0-9]+)', self.patron)
+        object.__setattr__(self, 'regex', re.compile(f'^{regex}$'))
+
+    def match(self, ruta: str) -> Optional[Dict[str, int]]:
+        """Argumentos de la ruta si ``ruta`` encaja con el patrón."""
+        encontrado = self.regex.match(ruta)
+        if encontrado is None:
+            return None
+        return {nombre: int(valor) for nombre, valor in encontrado.groupdict().items()}
+
+
+R = Ruta
+
+RUTAS: List[Ruta] = [
+    # Cuenta
+    R('POST', '/api/registro', 'registrar_usuario', escritura=True, acceso=PUBLICA),
+
+    # Clientes
+    R('GET', '/api/clientes', 'obtener_pagina_clientes', acceso=ADMIN),
+    R('POST', '/api/clientes', 'crear_cliente_admin', escritura=True, acceso=ADMIN),
+    R('DELETE', '/api/clientes/{id_cliente}', 'eliminar_cliente_admin', escritura=True, acceso=ADMIN),
+
+    # Aparatos
+    R('GET', '/api/aparatos', 'obtener_aparatos'),
+    R('POST', '/api/aparatos', 'crear_aparato', escritura=True, acceso=ADMIN),
+    R('DELETE', '/api/aparatos/{id_aparato}', 'eliminar_aparato', escritura=True, acceso=ADMIN),
+    R('GET', '/api/aparatos/{id_aparato}/horarios', 'obtener_horarios_libres'),
+    R('GET', '/api/aparatos/{id_aparato}/disponibilidad', 'verificar_disponibilidad'),
+
+    # Reservas
+    R('GET', '/api/reservas', 'obtener_pagina_reservas', acceso=ADMIN),
+    R('GET', '/api/reservas/mias', 'obtener_mis_reservas'),
+    R('GET', '/api/reservas/pendientes', 'obtener_pagina_reservas_pendientes', acceso=ADMIN),
+    R('GET', '/api/reservas/por-estado', 'obtener_pagina_reservas_por_estado', acceso=ADMIN),
+    R('GET', '/api/reservas/ocupacion', 'obtener_ocupacion_dia'),
+    R('POST', '/api/reservas', 'crear_reserva', escritura=True),
+    R('POST', '/api/reservas/admin', 'crear_reserva_admin', escritura=True, acceso=ADMIN),
+    R('DELETE', '/api/reservas/{id_reserva}', 'eliminar_reserva', escritura=True, propietario='reservas'),
+    R('POST', '/api/reservas/{id_reserva}/aceptar', 'aceptar_reserva', escritura=True, acceso=ADMIN),
+    R('POST', '/api/reservas/{id_reserva}/rechazar', 'rechazar_reserva', escritura=True, acceso=ADMIN),
+    R('POST', '/api/reservas/aceptar', 'aceptar_reservas', escritura=True, acceso=ADMIN),
+    R('POST', '/api/reservas/rechazar', 'rechazar_reservas', escritura=True, acceso=ADMIN),
+
+    # Notificaciones
+    R('GET', '/api/notificaciones', 'obtener_mis_notificaciones'),
+    R('GET', '/api/notificaciones/no-leidas', 'obtener_notificaciones_no_leidas'),
+    R('POST', '/api/notificaciones/{id_notificacion}/leida', 'marcar_notificacion_leida', escritura=True,
+      propietario='notificaciones'),
+    R('DELETE', '/api/notificaciones/{id_notificacion}', 'eliminar_notificacion', escritura=True,
+      propietario='notificaciones'),
+
+    # Recibos y pagos
+    R('GET', '/api/recibos', 'obtener_pagina_recibos', acceso=ADMIN),
+    R('GET', '/api/recibos/mios', 'obtener_mis_recibos'),
+    R('GET', '/api/recibos/mios/pendientes', 'obtener_mis_recibos_pendientes'),
+    R('POST', '/api/recibos', 'crear_recibo_manual', escritura=True, acceso=ADMIN),
+    R('POST', '/api/recibos/{id_recibo}/pagar', 'pagar_recibo', escritura=True, propietario='recibos'),
+    R('POST', '/api/recibos/{id_recibo}/pagar-admin', 'pagar_recibo_admin', escritura=True, acceso=ADMIN),
+    R('POST', '/api/recibos/generar', 'generar_recibos_mes', escritura=True, acceso=ADMIN),
+    R('POST', '/api/recibos/generar-rango', 'generar_recibos_rango', escritura=True, acceso=ADMIN),
+    R('GET', '/api/morosos', 'obtener_pagina_morosos', acceso=ADMIN),
+
+    # Estadísticas y diagnóstico
+    R('GET', '/api/estadisticas', 'obtener_estadisticas_generales', acceso=ADMIN),
+    R('GET', '/api/estadisticas/financieras', 'obtener_estadisticas_financieras', acceso=ADMIN),
+    R('GET', '/api/estadisticas/resumen-mensual', 'obtener_resumen_mensual', acceso=ADMIN),
+    R('POST', '/api/estadisticas/resumen-mensual/reconstruir', 'reconstruir_resumen_financiero',
+      escritura=True, acceso=ADMIN),
+    R('GET', '/api/diagnostico/cache', 'obtener_estadisticas_cache', acceso=ADMIN),
+    R('GET', '/api/diagnostico/sql', 'obtener_estadisticas_sql', acceso=ADMIN),
+]
+
+
+def resolver(metodo: str, ruta: str, rutas: List[Ruta] = RUTAS) -> Tuple[Optional[Ruta], Dict[str, int], bool]:
+    """Busca la ruta que atiende una petición.
+
+    Returns:
+        (ruta o None, argumentos de la ruta, si la ruta existe con otro método)
+    """
+    otro_metodo = False
+    for candidata in rutas:
+        argumentos = candidata.match(ruta)
+        if argumentos is None:
+            continue
+        if candidata.metodo == metodo:
+            return candidata, argumentos, False
+        otro_metodo = True
+    return None, {}, otro_metodo
@@ -0,0 +1,319 @@
+"""Servidor HTTP/JSON sin interfaz sobre ``GymController``.
+
+Un único proceso atiende a muchos clientes ligeros en lugar de que cada
+terminal abra el archivo SQLite por la red:
+
+- Las lecturas se atienden en paralelo (un hilo por conexión HTTP) sobre un
+  controlador lector cuyo pool tiene ``readers`` conexiones.
+- Las escrituras se serializan con un candado sobre un controlador escritor
+  con una sola conexión, de modo que nunca compiten por el bloqueo de
+  escritura de SQLite dentro del proceso.
+- Lector y escritor comparten caché, índice de disponibilidad y monitor de
+  cambios: cada escritura actualiza directamente lo que leerá el lector, y
+  ``comprobar_cambios`` solo reacciona a lo que escriban otros terminales
+  de escritorio sobre el mismo archivo. Se comprueba antes de cada lectura
+  y de cada escritura.
+- Las sesiones son tokens opacos (``Authorization: Bearer <token>``); cada
+  petición se atiende con ``GymController.sesion`` usando el usuario de su
+  token, sin tocar la sesión de otras peticiones concurrentes.
+
+Todas las respuestas tienen la forma de ``ResponseDTO``:
+``{"exito", "mensaje", "datos", "error_code"}``.
+"""
+
+import inspect
+import json
+import threading
+from dataclasses import asdict, is_dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+from urllib.parse import parse_qs, urlsplit
+import logging
+
+from core.controller.gym_controller import GymController
+from core.models import Database
+from infrastructure.dtos import ResponseDTO
+from .routes import ADMIN, PUBLICA, Ruta, resolver
+from .sessions import SessionStore
+
+logger = logging.getLogger(__name__)
+
+# Tamaño máximo del cuerpo de una petición
+MAX_CUERPO = 1024 * 1024
+
+Respuesta = Tuple[int, Dict]
+
+
+def _respuesta(status: int, exito: bool, mensaje: str, datos: Any = None,
+               error_code: Optional[str] = None) -> Respuesta:
+    return status, asdict(ResponseDTO(exito, mensaje, datos, error_code))
+
+
+def _a_json(valor: Any) -> Any:
+    """Conversión de los tipos que ``json`` no serializa."""
+    if is_dataclass(valor):
+        return asdict(valor)
+    if isinstance(valor, (set, frozenset)):
+        return sorted(valor)
+    return str(valor)
+
+
+def _convertir(valor: str, tipo: Any) -> Any:
+    """Convierte un parámetro de la query string al tipo anotado en el controlador."""
+    if get_origin(tipo) is Union:
+        tipos = [t for t in get_args(tipo) if t is not type(None)]
+        tipo = tipos[0] if len(tipos) == 1 else str
+    if tipo is int:
+        return int(valor)
+    if tipo is float:
+        return float(valor)
+    if tipo is bool:
+        return valor.lower() in ('1', 'true', 'si', 'sí')
+    return valor
+
+
+class GymAPI:
+    """Despacha peticiones a los controladores lector y escritor."""
+
+    def __init__(self, db_name: str = "gimnasio.db", readers: int = 4,
+                 profile: str = 'balanced', session_ttl: float = 8 * 3600):
+        """Abre los dos controladores sobre la misma base de datos.
+
+        Args:
+            db_name: Archivo de base de datos
+            readers: Conexiones del pool de lectura (lecturas en paralelo)
+            profile: Perfil de rendimiento de ``Database``
+            session_ttl: Segundos de inactividad tras los que caduca una sesión
+        """
+        self.db_name = db_name
+        self.readers = readers
+        self.lector = GymController(Database(db_name, pool_size=readers, profile=profile))
+        self.escritor = GymController(Database(db_name, pool_size=1, profile=profile),
+                                      compartido=self.lector)
+        self.sesiones = SessionStore(ttl=session_ttl)
+        self._escritura = threading.Lock()
+        self._cambios = threading.Lock()
+
+    def close(self) -> None:
+        """Detiene los hilos de los controladores y cierra sus conexiones."""
+        self.lector.change_monitor.close()
+        for controlador in (self.lector, self.escritor):
+            controlador.event_bus.close()
+            controlador.db.close()
+
+    # Peticiones
+    def handle(self, metodo: str, ruta: str, parametros: Dict[str, str],
+               cuerpo: Dict[str, Any], token: Optional[str]) -> Respuesta:
+        """Atiende una petición.
+
+        Args:
+            metodo: Método HTTP
+            ruta: Ruta sin query string
+            parametros: Query string (un valor por nombre)
+            cuerpo: Cuerpo JSON ya decodificado
+            token: Token de sesión, si la petición lo incluye
+
+        Returns:
+            (código HTTP, cuerpo de la respuesta)
+        """
+        try:
+            if ruta == '/api/sesion':
+                return self._sesion(metodo, cuerpo, token)
+            if ruta == '/api/estado' and metodo == 'GET':
+                return self._estado()
+
+            definicion, argumentos, otro_metodo = resolver(metodo, ruta)
+            if definicion is None:
+                if otro_metodo:
+                    return _respuesta(405, False, f"Método {metodo} no permitido en {ruta}", None, 'metodo')
+                return _respuesta(404, False, f"Ruta desconocida: {ruta}", None, 'ruta')
+
+            usuario = self.sesiones.get(token) if token else None
+            if definicion.acceso != PUBLICA and usuario is None:
+                return _respuesta(401, False, "Debe iniciar sesión", None, 'sin_sesion')
+            if definicion.acceso == ADMIN and usuario.get('tipo') != 'admin':
+                return _respuesta(403, False, "Se requieren permisos de administrador", None, 'sin_permisos')
+            if definicion.propietario and usuario.get('tipo') != 'admin':
+                id_recurso = next(iter(argumentos.values()))
+                id_cliente = self._id_cliente(definicion.propietario, id_recurso)
+                if id_cliente is None:
+                    return _respuesta(404, False, f"No existe el recurso {id_recurso}", None, 'no_encontrado')
+                if id_cliente != usuario.get('id'):
+                    return _respuesta(403, False, "El recurso pertenece a otro cliente", None, 'sin_permisos')
+
+            return self._ejecutar(definicion, usuario, {**parametros, **cuerpo}, argumentos,
+                                  desde_query=set(parametros) - set(cuerpo))
+        except Exception as e:
+            logger.error(f"Error al atender {metodo} {ruta}: {e}")
+            return _respuesta(500, False, "Error interno del servidor", None, 'error_interno')
+
+    def _id_cliente(self, recurso: str, id_recurso: int) -> Optional[int]:
+        """Cliente dueño de una reserva, recibo o notificación (None si no existe)."""
+        if recurso == 'reservas':
+            return self.lector.reserva_model.obtener_id_cliente_por_reserva(id_recurso)
+        if recurso == 'notificaciones':
+            return self.lector.notificacion_model.obtener_id_cliente_por_notificacion(id_recurso)
+        if recurso == 'recibos':
+            recibo = self.lector.recibo_model.obtener_por_id(id_recurso)
+            return recibo['id_cliente'] if recibo else None
+        raise ValueError(f"Recurso sin propietario: {recurso}")
+
+    def _ejecutar(self, definicion: Ruta, usuario: Optional[Dict], valores: Dict[str, Any],
+                  argumentos: Dict[str, int], desde_query: set) -> Respuesta:
+        controlador = self.escritor if definicion.escritura else self.lector
+        accion = getattr(controlador, definicion.accion)
+        try:
+            tipos = get_type_hints(accion)
+            kwargs = {
+                nombre: _convertir(valor, tipos.get(nombre, str)) if nombre in desde_query else valor
+                for nombre, valor in valores.items()
+            }
+            kwargs.update(argumentos)
+            inspect.signature(accion).bind(**kwargs)
+        except (TypeError, ValueError) as e:
+            return _respuesta(400, False, f"Parámetros inválidos: {e}", None, 'parametros')
+
+        if definicion.escritura:
+            with self._escritura:
+                # Escrituras de otros terminales (índice de disponibilidad, caché)
+                self._sincronizar()
+                with self.escritor.sesion(usuario):
+                    resultado = accion(**kwargs)
+        else:
+            self._sincronizar()
+            with self.lector.sesion(usuario):
+                resultado = accion(**kwargs)
+        return self._resultado(resultado)
+
+    def _sincronizar(self) -> None:
+        """Aplica los cambios de otros terminales a la caché y al índice compartidos.
+
+        El candado garantiza que, cuando retorna, la invalidación de un
+        cambio detectado por otro hilo ya se ha completado.
+        """
+        with self._cambios:
+            self.lector.comprobar_cambios()
+
+    @staticmethod
+    def _resultado(resultado: Any) -> Respuesta:
+        """Adapta los retornos del controlador a ``ResponseDTO``.
+
+        Las tuplas (éxito, mensaje[, datos]) conservan su mensaje; un fracaso
+        de negocio (validación, franja ocupada...) responde 400.
+        """
+        if isinstance(resultado, tuple) and resultado and isinstance(resultado[0], bool):
+            exito, mensaje, *resto = resultado
+            datos = resto[0] if resto else None
+            if exito:
+                return _respuesta(200, True, mensaje, datos)
+            return _respuesta(400, False, mensaje, datos, 'rechazada')
+        return _respuesta(200, True, "OK", resultado)
+
+    def _sesion(self, metodo: str, cuerpo: Dict[str, Any], token: Optional[str]) -> Respuesta:
+        """POST abre sesión (dni, password), GET la consulta y DELETE la cierra."""
+        if metodo == 'POST':
+            with self.lector.sesion(None):
+                exito, mensaje, usuario = self.lector.login(str(cuerpo.get('dni', '')),
+                                                            str(cuerpo.get('password', '')))
+            if not exito:
+                return _respuesta(401, False, mensaje, None, 'credenciales')
+            return _respuesta(200, True, mensaje, {'token': self.sesiones.create(usuario), 'usuario': usuario})
+
+        if metodo == 'GET':
+            usuario = self.sesiones.get(token) if token else None
+            if usuario is None:
+                return _respuesta(401, False, "Debe iniciar sesión", None, 'sin_sesion')
+            return _respuesta(200, True, "OK", usuario)
+
+        if metodo == 'DELETE':
+            if token and self.sesiones.delete(token):
+                return _respuesta(200, True, "Sesión cerrada")
+            return _respuesta(401, False, "Debe iniciar sesión", None, 'sin_sesion')
+
+        return _respuesta(405, False, f"Método {metodo} no permitido en /api/sesion", None, 'metodo')
+
+    def _estado(self) -> Respuesta:
+        return _respuesta(200, True, "OK", {
+            'db': self.db_name,
+            'esquema': self.lector.db.schema_version(),
+            'lectores': self.readers,
+            'sesiones': len(self.sesiones),
+        })
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Traduce HTTP a ``GymAPI.handle`` (conexiones persistentes HTTP/1.1)."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'GymForTheMoment'
+
+    def do_GET(self):
+        self._atender('GET')
+
+    def do_POST(self):
+        self._atender('POST')
+
+    def do_PUT(self):
+        self._atender('PUT')
+
+    def do_DELETE(self):
+        self._atender('DELETE')
+
+    def _atender(self, metodo: str) -> None:
+        url = urlsplit(self.path)
+        parametros = {nombre: valores[-1] for nombre, valores in parse_qs(url.query).items()}
+
+        longitud = int(self.headers.get('Content-Length') or 0)
+        if longitud > MAX_CUERPO:
+            self.close_connection = True
+            self._enviar(*_respuesta(413, False, "Cuerpo demasiado grande", None, 'parametros'))
+            return
+        crudo = self.rfile.read(longitud) if longitud else b''
+        try:
+            cuerpo = json.loads(crudo) if crudo else {}
+        except ValueError:
+            cuerpo = None
+        if not isinstance(cuerpo, dict):
+            self._enviar(*_respuesta(400, False, "El cuerpo debe ser un objeto JSON", None, 'parametros'))
+            return
+
+        autorizacion = self.headers.get('Authorization', '')
+        token = autorizacion[7:].strip() if autorizacion.startswith('Bearer ') else None
+
+        self._enviar(*self.server.api.handle(metodo, url.path, parametros, cuerpo, token))
+
+    def _enviar(self, status: int, respuesta: Dict) -> None:
+        datos = json.dumps(respuesta, ensure_ascii=False, default=_a_json).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class GymAPIServer(ThreadingHTTPServer):
+    """``ThreadingHTTPServer`` con la ``GymAPI`` que atiende las peticiones."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: GymAPI):
+        super().__init__(address, _Handler)
+        self.api = api
+
+
+def serve(db_name: str = "gimnasio.db", host: str = '127.0.0.1', port: int = 8080,
+          readers: int = 4, profile: str = 'balanced', session_ttl: float = 8 * 3600) -> None:
+    """Atiende peticiones hasta Ctrl+C."""
+    api = GymAPI(db_name, readers=readers, profile=profile, session_ttl=session_ttl)
+    servidor = GymAPIServer((host, port), api)
+    logger.info(f"API de GymForTheMoment en http://{host}:{servidor.server_port} ({db_name})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        api.close()
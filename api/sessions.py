@@ -0,0 +1,57 @@
+"""Sesiones de la API: token opaco -> usuario autenticado."""
+
+import secrets
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class SessionStore:
+    """Sesiones en memoria con caducidad por inactividad (seguro entre hilos)."""
+
+    def __init__(self, ttl: float = 8 * 3600):
+        """Inicializa el almacén.
+
+        Args:
+            ttl: Segundos sin peticiones tras los que caduca una sesión
+        """
+        self.ttl = ttl
+        self._sesiones: Dict[str, Tuple[Dict, float]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, usuario: Dict) -> str:
+        """Abre una sesión para ``usuario`` y devuelve su token."""
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._purgar(time.monotonic())
+            self._sesiones[token] = (usuario, time.monotonic())
+        return token
+
+    def get(self, token: str) -> Optional[Dict]:
+        """Usuario de la sesión (renueva su caducidad) o None si no existe o caducó."""
+        ahora = time.monotonic()
+        with self._lock:
+            sesion = self._sesiones.get(token)
+            if sesion is None:
+                return None
+            usuario, ultimo_uso = sesion
+            if ahora - ultimo_uso > self.ttl:
+                del self._sesiones[token]
+                return None
+            self._sesiones[token] = (usuario, ahora)
+            return usuario
+
+    def delete(self, token: str) -> bool:
+        """Cierra una sesión; devuelve si existía."""
+        with self._lock:
+            return self._sesiones.pop(token, None) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sesiones)
+
+    def _purgar(self, ahora: float) -> None:
+        caducadas = [token for token, (_, ultimo_uso) in self._sesiones.items()
+                     if ahora - ultimo_uso > self.ttl]
+        for token in caducadas:
+            del self._sesiones[token]
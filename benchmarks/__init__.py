@@ -0,0 +1,22 @@
+"""Package `benchmarks`: mediciones de rendimiento sobre datos sintéticos.
+
+Uso desde la raíz del proyecto::
+
+    python -m benchmarks build bench.db --size medium
+    python -m benchmarks run bench.db --output antes.json
+    python -m benchmarks compare antes.json despues.json
+    python -m benchmarks load bench.db --threads 8 --processes 2
+    python -m benchmarks plans
+"""
+
+from .fixtures import FixtureSize, FIXTURE_SIZES, build_fixture
+from .load import LoadConfig, run_load, find_double_bookings
+from .query_plans import plan_cases, check_plans, load_allowlist, write_allowlist
+from .suite import BenchmarkCase, BenchmarkContext, default_cases, run_suite, compare_results
+
+__all__ = [
+    'FixtureSize', 'FIXTURE_SIZES', 'build_fixture',
+    'LoadConfig', 'run_load', 'find_double_bookings',
+    'plan_cases', 'check_plans', 'load_allowlist', 'write_allowlist',
+    'BenchmarkCase', 'BenchmarkContext', 'default_cases', 'run_suite', 'compare_results'
+]
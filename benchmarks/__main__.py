@@ -0,0 +1,242 @@
+"""Línea de comandos de las mediciones: ``python -m benchmarks --help``."""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from .fixtures import FIXTURE_SIZES, build_fixture
+from .load import MEZCLA_DEFECTO, LoadConfig, run_load
+from .query_plans import ALLOWLIST_PATH, check_plans, write_allowlist
+from .suite import compare_results, run_suite
+
+
+def _build(args) -> int:
+    resultado = build_fixture(args.db, args.size, overwrite=args.overwrite)
+    print(json.dumps(resultado, indent=2))
+    return 0
+
+
+def _imprimir_resultados(resultados: dict) -> None:
+    print(f"{'caso':<62} {'mediana':>10} {'p95':>10} {'filas':>8}", file=sys.stderr)
+    for nombre, datos in resultados['results'].items():
+        if 'error' in datos:
+            print(f"{nombre:<62} ERROR: {datos['error']}", file=sys.stderr)
+            continue
+        filas = '' if datos['rows'] is None else datos['rows']
+        print(f"{nombre:<62} {datos['median_ms']:>8.3f}ms {datos['p95_ms']:>8.3f}ms {filas:>8}",
+              file=sys.stderr)
+
+
+@contextmanager
+def _copia(db: str, usar_copia: bool):
+    """Ruta sobre la que escribir: una copia temporal de ``db`` o el propio archivo."""
+    if not usar_copia:
+        yield db
+        return
+    # Las escrituras no deben alterar la base de datos de referencia
+    carpeta = tempfile.mkdtemp(prefix='gym-bench-')
+    try:
+        ruta = os.path.join(carpeta, os.path.basename(db))
+        shutil.copyfile(db, ruta)
+        yield ruta
+    finally:
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+
+def _existe(db: str) -> bool:
+    if not os.path.exists(db):
+        print(f"No existe {db}; créalo con 'python -m benchmarks build'", file=sys.stderr)
+        return False
+    return True
+
+
+def _escribir(resultados: dict, output) -> None:
+    texto = json.dumps(resultados, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(texto)
+    else:
+        print(texto)
+
+
+def _run(args) -> int:
+    if not _existe(args.db):
+        return 2
+    with _copia(args.db, not args.read_only and not args.in_place) as db_path:
+        resultados = run_suite(db_path, repeat=args.repeat, include_writes=not args.read_only,
+                               only=args.only, profile=args.profile)
+    resultados['meta']['db_path'] = args.db
+
+    _imprimir_resultados(resultados)
+    _escribir(resultados, args.output)
+    return 0
+
+
+def _mezcla(texto: str) -> dict:
+    """'reservar=0.5,listar=0.5' -> {'reservar': 0.5, 'listar': 0.5}"""
+    try:
+        return {op.strip(): float(peso) for op, peso in
+                (parte.split('=') for parte in texto.split(',') if parte.strip())}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Mezcla inválida: {texto}")
+
+
+def _load(args) -> int:
+    if not _existe(args.db):
+        return 2
+    with _copia(args.db, not args.in_place) as db_path:
+        informe = run_load(LoadConfig(db_path, threads=args.threads, processes=args.processes,
+                                      duration=args.duration, mix=args.mix, seed=args.seed,
+                                      profile=args.profile))
+    informe['meta']['db_path'] = args.db
+
+    print(f"{'operación':<10} {'llamadas':>9} {'ops/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} "
+          f"{'ok':>7} {'rechaz.':>7} {'bloqueo':>7} {'error':>7}", file=sys.stderr)
+    for nombre, datos in [*informe['operations'].items(), ('total', informe['total'])]:
+        print(f"{nombre:<10} {datos['count']:>9} {datos['throughput_ops_s']:>9.1f} "
+              f"{datos.get('p50_ms', 0):>7.2f}ms {datos.get('p95_ms', 0):>7.2f}ms "
+              f"{datos.get('p99_ms', 0):>7.2f}ms {datos['ok']:>7} {datos['rechazada']:>7} "
+              f"{datos['bloqueo']:>7} {datos['error']:>7}", file=sys.stderr)
+    print(f"Franjas aceptadas dos veces: {len(informe['double_bookings'])}", file=sys.stderr)
+
+    _escribir(informe, args.output)
+    return 1 if informe['double_bookings'] else 0
+
+
+def _compare(args) -> int:
+    with open(args.base, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(args.new, encoding='utf-8') as f:
+        nuevo = json.load(f)
+
+    filas = compare_results(base, nuevo, metric=args.metric, threshold=args.threshold)
+    print(f"{'caso':<62} {'base':>10} {'nuevo':>10} {'ratio':>7}  estado")
+    for fila in filas:
+        antes = '-' if fila['base'] is None else f"{fila['base']:.3f}"
+        despues = '-' if fila['new'] is None else f"{fila['new']:.3f}"
+        ratio = '-' if fila['ratio'] is None else f"{fila['ratio']:.2f}"
+        print(f"{fila['name']:<62} {antes:>10} {despues:>10} {ratio:>7}  {fila['status']}")
+
+    if args.fail_on_regression and any(fila['status'] == 'slower' for fila in filas):
+        return 1
+    return 0
+
+
+@contextmanager
+def _base_plans(db, size: str):
+    """Copia de ``db`` o, si no se indica, una base de datos sintética temporal."""
+    if db:
+        with _copia(db, True) as ruta:
+            yield ruta
+        return
+    carpeta = tempfile.mkdtemp(prefix='gym-plans-')
+    try:
+        ruta = os.path.join(carpeta, 'gimnasio.db')
+        build_fixture(ruta, size)
+        yield ruta
+    finally:
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+
+def _plans(args) -> int:
+    if args.db and not _existe(args.db):
+        return 2
+    allowlist = None if args.no_allowlist else args.allowlist
+    with _base_plans(args.db, args.size) as db_path:
+        informe = check_plans(db_path, allowlist=allowlist, profile=args.profile)
+    informe['meta']['db_path'] = args.db or f"({args.size})"
+
+    for hallazgo in informe['violations']:
+        print(f"REGRESIÓN {hallazgo['fingerprint']} [{hallazgo['origin']}] {hallazgo['detail']}\n"
+              f"    {hallazgo['sql']}", file=sys.stderr)
+    for entrada in informe['stale']:
+        print(f"Entrada permitida sin uso: {entrada['fingerprint']} {entrada['detail']} "
+              f"[{entrada.get('origin', '')}]", file=sys.stderr)
+    for error in informe['errors']:
+        print(f"Sin plan {error['fingerprint']} [{error['origin']}]: {error['error']}", file=sys.stderr)
+    meta = informe['meta']
+    print(f"{meta['explained']} sentencias revisadas: {len(informe['violations'])} regresiones, "
+          f"{len(informe['allowed'])} permitidas", file=sys.stderr)
+
+    if args.update_allowlist:
+        total = write_allowlist(informe, args.allowlist)
+        print(f"{total} entradas escritas en {args.allowlist}", file=sys.stderr)
+        return 0
+    if args.output:
+        _escribir(informe, args.output)
+    return 1 if informe['violations'] else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Mediciones de rendimiento de GymForTheMoment")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help="Crea una base de datos sintética")
+    build.add_argument('db', help="Archivo a crear")
+    build.add_argument('--size', choices=sorted(FIXTURE_SIZES), default='small')
+    build.add_argument('--overwrite', action='store_true', help="Reemplaza el archivo si existe")
+    build.set_defaults(func=_build)
+
+    run = sub.add_parser('run', help="Mide los casos y emite JSON")
+    run.add_argument('db', help="Base de datos creada con 'build'")
+    run.add_argument('--repeat', type=int, default=10, help="Llamadas medidas por caso")
+    run.add_argument('--only', nargs='*', help="Solo casos cuyo nombre contenga alguna subcadena")
+    run.add_argument('--read-only', action='store_true', help="Omite los casos que escriben")
+    run.add_argument('--in-place', action='store_true',
+                     help="Escribe sobre el archivo en lugar de sobre una copia")
+    run.add_argument('--profile', default='balanced', help="Perfil de rendimiento de Database")
+    run.add_argument('--output', '-o', help="Archivo JSON de resultados (por defecto, salida estándar)")
+    run.set_defaults(func=_run)
+
+    load = sub.add_parser('load', help="Carga concurrente de reservas sobre varios terminales")
+    load.add_argument('db', help="Base de datos creada con 'build'")
+    load.add_argument('--threads', type=int, default=4, help="Terminales por proceso")
+    load.add_argument('--processes', type=int, default=1, help="Procesos")
+    load.add_argument('--duration', type=float, default=10.0, help="Segundos de carga")
+    load.add_argument('--mix', type=_mezcla, default=dict(MEZCLA_DEFECTO),
+                      help="Pesos por operación, p. ej. reservar=0.4,aceptar=0.2,cancelar=0.1,listar=0.3")
+    load.add_argument('--seed', type=int, default=1)
+    load.add_argument('--profile', default='balanced', help="Perfil de rendimiento de Database")
+    load.add_argument('--in-place', action='store_true',
+                      help="Escribe sobre el archivo en lugar de sobre una copia")
+    load.add_argument('--output', '-o', help="Archivo JSON del informe (por defecto, salida estándar)")
+    load.set_defaults(func=_load)
+
+    plans = sub.add_parser('plans', help="Revisa los planes de consulta de los modelos")
+    plans.add_argument('db', nargs='?',
+                       help="Base de datos creada con 'build' (por defecto, una temporal de --size)")
+    plans.add_argument('--size', choices=sorted(FIXTURE_SIZES), default='small')
+    plans.add_argument('--allowlist', default=ALLOWLIST_PATH, help="Archivo de problemas permitidos")
+    plans.add_argument('--no-allowlist', action='store_true', help="No permite ningún problema")
+    plans.add_argument('--update-allowlist', action='store_true',
+                       help="Escribe los problemas actuales como permitidos")
+    plans.add_argument('--profile', default='balanced', help="Perfil de rendimiento de Database")
+    plans.add_argument('--output', '-o', help="Archivo JSON del informe")
+    plans.set_defaults(func=_plans)
+
+    compare = sub.add_parser('compare', help="Compara dos archivos de resultados")
+    compare.add_argument('base')
+    compare.add_argument('new')
+    compare.add_argument('--metric', default='median_ms',
+                         choices=('min_ms', 'median_ms', 'mean_ms', 'p95_ms', 'max_ms'))
+    compare.add_argument('--threshold', type=float, default=0.1,
+                         help="Variación relativa que cuenta como cambio (0.1 = 10%%)")
+    compare.add_argument('--fail-on-regression', action='store_true',
+                         help="Sale con código 1 si algún caso es más lento")
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    # El controlador configura INFO al importarse; los avisos de negocio de
+    # los casos de escritura (p. ej. franja ocupada) son esperables
+    logging.getLogger().setLevel(logging.ERROR)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
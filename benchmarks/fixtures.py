@@ -0,0 +1,278 @@
+"""Generador de bases de datos sintéticas para las mediciones de rendimiento.
+
+``build_fixture`` crea un ``gimnasio.db`` con el esquema real (migraciones,
+índices y triggers incluidos) y lo llena con datos deterministas a partir de
+una semilla, de modo que dos ejecuciones con el mismo tamaño producen la
+misma base de datos y sus tiempos son comparables.
+"""
+
+import os
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+import logging
+
+from core.models import Database, PerformanceProfile
+
+logger = logging.getLogger(__name__)
+
+# Credenciales de los clientes generados: DNI = DNI_BASE + índice
+DNI_BASE = 10000000
+PASSWORD = 'bench'
+
+TIPOS_APARATO = ('Cardio', 'Fuerza', 'Funcional', 'Estiramiento')
+METODOS_PAGO = ('Efectivo', 'Tarjeta', 'Transferencia')
+FRANJAS = tuple(range(0, 1440, 30))
+LOTE = 50000
+
+# Solo para generar: un fallo a medias deja un archivo que se vuelve a crear
+CARGA_MASIVA = PerformanceProfile(
+    name='carga_masiva',
+    journal_mode='WAL',
+    synchronous='OFF',
+    cache_size=-64000,
+    temp_store='MEMORY',
+)
+
+
+@dataclass(frozen=True)
+class FixtureSize:
+    """Número de filas por tabla de una base de datos sintética.
+
+    Attributes:
+        name: Nombre del tamaño
+        clientes: Clientes (además del administrador por defecto)
+        aparatos: Aparatos
+        reservas: Reservas en cualquier estado
+        recibos: Recibos, repartidos en meses consecutivos hacia atrás
+        notificaciones: Notificaciones de reservas aceptadas o rechazadas
+        seed: Semilla del generador aleatorio
+    """
+    name: str
+    clientes: int
+    aparatos: int
+    reservas: int
+    recibos: int
+    notificaciones: int
+    seed: int = 20240101
+
+
+FIXTURE_SIZES: Dict[str, FixtureSize] = {
+    'small': FixtureSize('small', clientes=1000, aparatos=20, reservas=20000,
+                         recibos=12000, notificaciones=10000),
+    'medium': FixtureSize('medium', clientes=10000, aparatos=50, reservas=200000,
+                          recibos=120000, notificaciones=100000),
+    'production': FixtureSize('production', clientes=50000, aparatos=100, reservas=2000000,
+                              recibos=600000, notificaciones=500000),
+}
+
+
+def resolve_size(size: Union[str, FixtureSize]) -> FixtureSize:
+    """Devuelve el tamaño indicado por nombre o la propia instancia."""
+    if isinstance(size, FixtureSize):
+        return size
+    try:
+        return FIXTURE_SIZES[size]
+    except KeyError:
+        raise ValueError(
+            f"Tamaño desconocido: {size} (disponibles: {', '.join(FIXTURE_SIZES)})"
+        ) from None
+
+
+def _lotes(filas: Iterable[Tuple], tamano: int = LOTE) -> Iterator[List[Tuple]]:
+    lote = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) >= tamano:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _periodos(hasta: date, cantidad: int) -> List[Tuple[int, int]]:
+    """``cantidad`` pares (mes, anio) consecutivos que terminan en ``hasta``."""
+    periodos = []
+    mes, anio = hasta.month, hasta.year
+    for _ in range(cantidad):
+        periodos.append((mes, anio))
+        mes -= 1
+        if mes == 0:
+            mes, anio = 12, anio - 1
+    return periodos
+
+
+def build_fixture(path: str, size: Union[str, FixtureSize] = 'small',
+                  overwrite: bool = False) -> Dict:
+    """Crea una base de datos sintética.
+
+    Args:
+        path: Archivo a crear
+        size: Nombre en ``FIXTURE_SIZES`` o instancia de ``FixtureSize``
+        overwrite: Si se reemplaza un archivo existente
+
+    Returns:
+        Diccionario con el tamaño solicitado, las filas por tabla y los
+        segundos empleados
+
+    Raises:
+        FileExistsError: Si el archivo existe y no se pidió reemplazarlo
+    """
+    size = resolve_size(size)
+    if os.path.exists(path):
+        if not overwrite:
+            raise FileExistsError(f"Ya existe {path}")
+        for sufijo in ('', '-wal', '-shm'):
+            if os.path.exists(path + sufijo):
+                os.remove(path + sufijo)
+
+    inicio = time.perf_counter()
+    rng = random.Random(size.seed)
+    db = Database(path, profile=CARGA_MASIVA)
+    try:
+        with db.transaction() as conn:
+            id_admin = conn.execute(
+                "SELECT MAX(id_cliente) FROM clientes WHERE tipo_usuario = 'admin'"
+            ).fetchone()[0]
+            ids_clientes = _insertar_clientes(conn, size)
+            ids_aparatos = _insertar_aparatos(conn, size)
+            decididas = _insertar_reservas(conn, rng, size, ids_clientes, ids_aparatos)
+            _insertar_recibos(conn, rng, size, ids_clientes)
+            _insertar_notificaciones(conn, rng, size, decididas)
+            conn.execute("ANALYZE")
+
+            filas = {
+                tabla: conn.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+                for tabla in ('clientes', 'aparatos', 'reservas', 'recibos', 'pagos', 'notificaciones')
+            }
+    finally:
+        db.close()
+
+    resultado = {
+        'path': path,
+        'size': asdict(size),
+        'rows': filas,
+        'admin_id': id_admin,
+        'seconds': round(time.perf_counter() - inicio, 3),
+    }
+    logger.info(f"Base de datos sintética '{size.name}' creada en {resultado['seconds']} s: {filas}")
+    return resultado
+
+
+def _insertar_clientes(conn, size: FixtureSize) -> range:
+    primero = conn.execute("SELECT COALESCE(MAX(id_cliente), 0) + 1 FROM clientes").fetchone()[0]
+    filas = (
+        (primero + i, f"Nombre{i}", f"Apellido{i % 997}", str(DNI_BASE + i),
+         f"6{i:08d}", f"cliente{i}@gym.com", 'cliente', PASSWORD)
+        for i in range(size.clientes)
+    )
+    for lote in _lotes(filas):
+        conn.executemany('''
+            INSERT INTO clientes (id_cliente, nombre, apellido, dni, telefono, email,
+                                  tipo_usuario, password)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', lote)
+    return range(primero, primero + size.clientes)
+
+
+def _insertar_aparatos(conn, size: FixtureSize) -> range:
+    conn.executemany(
+        "INSERT INTO aparatos (id_aparato, nombre, tipo, descripcion) VALUES (?, ?, ?, ?)",
+        [(i + 1, f"Aparato {i + 1}", TIPOS_APARATO[i % len(TIPOS_APARATO)], "Generado")
+         for i in range(size.aparatos)]
+    )
+    return range(1, size.aparatos + 1)
+
+
+def _insertar_reservas(conn, rng: random.Random, size: FixtureSize,
+                       ids_clientes: range, ids_aparatos: range) -> List[Tuple[int, int, str]]:
+    """Inserta las reservas y devuelve (id_reserva, id_cliente, estado) de las decididas.
+
+    Solo una reserva por franja y aparato queda aceptada, como exige el
+    índice único parcial; el resto de solicitudes de esa franja se rechazan.
+    """
+    ocupadas = set()
+    decididas = []
+
+    def filas():
+        for id_reserva in range(1, size.reservas + 1):
+            id_cliente = rng.choice(ids_clientes)
+            id_aparato = rng.choice(ids_aparatos)
+            dia = rng.randint(1, 5)
+            inicio = rng.choice(FRANJAS)
+            sorteo = rng.random()
+            if sorteo < 0.2:
+                estado = 'pendiente'
+            elif sorteo < 0.6 and (id_aparato, dia, inicio) not in ocupadas:
+                ocupadas.add((id_aparato, dia, inicio))
+                estado = 'aceptada'
+            else:
+                estado = 'rechazada'
+            if estado != 'pendiente':
+                decididas.append((id_reserva, id_cliente, estado))
+            yield id_reserva, id_cliente, id_aparato, dia, inicio, inicio + 30, estado
+
+    for lote in _lotes(filas()):
+        conn.executemany('''
+            INSERT INTO reservas (id_reserva, id_cliente, id_aparato, dia, inicio_min, fin_min, estado)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', lote)
+    return decididas
+
+
+def _insertar_recibos(conn, rng: random.Random, size: FixtureSize, ids_clientes: range) -> None:
+    """Un recibo por cliente y mes, del mes actual hacia atrás.
+
+    Los meses anteriores están pagados en su mayoría y el actual en menos
+    de la mitad, de modo que los morosos se concentran en pocos meses.
+    """
+    if not ids_clientes:
+        return
+    meses = -(-size.recibos // len(ids_clientes))
+    pagos = []
+
+    def filas():
+        id_recibo = 0
+        for antiguedad, (mes, anio) in enumerate(_periodos(date.today(), meses)):
+            proporcion_pagados = 0.4 if antiguedad == 0 else 0.9
+            for id_cliente in ids_clientes:
+                if id_recibo >= size.recibos:
+                    return
+                id_recibo += 1
+                monto = 50.0
+                if rng.random() < proporcion_pagados:
+                    estado = 'pagado'
+                    fecha = f"{anio}-{mes:02d}-{rng.randint(1, 28):02d}"
+                    pagos.append((id_recibo, fecha, monto, rng.choice(METODOS_PAGO)))
+                else:
+                    estado = 'pendiente'
+                yield id_recibo, id_cliente, mes, anio, monto, estado
+
+    for lote in _lotes(filas()):
+        conn.executemany('''
+            INSERT INTO recibos (id_recibo, id_cliente, mes, anio, monto, estado)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', lote)
+    for lote in _lotes(pagos):
+        conn.executemany('''
+            INSERT INTO pagos (id_recibo, fecha_pago, monto, metodo_pago)
+            VALUES (?, ?, ?, ?)
+        ''', lote)
+
+
+def _insertar_notificaciones(conn, rng: random.Random, size: FixtureSize,
+                             decididas: List[Tuple[int, int, str]]) -> None:
+    elegidas = rng.sample(decididas, min(size.notificaciones, len(decididas)))
+    elegidas.sort()
+    filas = (
+        (id_cliente, id_reserva, estado, f"Tu reserva #{id_reserva} fue {estado}",
+         1 if rng.random() < 0.7 else 0)
+        for id_reserva, id_cliente, estado in elegidas
+    )
+    for lote in _lotes(filas):
+        conn.executemany('''
+            INSERT INTO notificaciones (id_cliente, id_reserva, tipo, mensaje, leida)
+            VALUES (?, ?, ?, ?, ?)
+        ''', lote)
@@ -0,0 +1,349 @@
+"""Generador de carga concurrente sobre ``ReservationService``.
+
+Simula N terminales que comparten el mismo archivo SQLite, repartidos en
+hilos y procesos. Cada terminal abre su propia ``Database`` (como un puesto
+de recepción más) y ejecuta una mezcla de operaciones a través del API de
+servicios:
+
+- ``reservar``: un cliente solicita una franja al azar
+- ``aceptar``: un administrador acepta una reserva de la lista de pendientes
+- ``cancelar``: un cliente elimina una de sus reservas
+- ``listar``: un cliente consulta sus reservas
+
+El informe incluye el rendimiento total, los percentiles de latencia por
+operación, los bloqueos de SQLite agotados (``database is locked``) y las
+franjas aceptadas dos veces, que nunca deberían aparecer.
+"""
+
+import logging
+import multiprocessing
+import random
+import sqlite3
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple
+
+from core.events import EventBus
+from core.models import Database, Cliente, Aparato, Reserva, Notificacion
+from core.services import ReservationService
+
+logger = logging.getLogger(__name__)
+
+OPERACIONES = ('reservar', 'aceptar', 'cancelar', 'listar')
+MEZCLA_DEFECTO = {'reservar': 0.4, 'aceptar': 0.2, 'cancelar': 0.1, 'listar': 0.3}
+
+# Resultado de cada llamada
+OK = 'ok'
+RECHAZADA = 'rechazada'   # regla de negocio: franja ocupada, ya no pendiente...
+BLOQUEO = 'bloqueo'       # se agotó la espera por el bloqueo de escritura
+ERROR = 'error'
+
+
+@dataclass
+class LoadConfig:
+    """Parámetros de una prueba de carga.
+
+    Attributes:
+        db_path: Base de datos compartida (ver ``fixtures.build_fixture``)
+        threads: Terminales (hilos) por proceso
+        processes: Procesos; el total de terminales es threads * processes
+        duration: Segundos de carga
+        mix: Peso relativo de cada operación de ``OPERACIONES``
+        seed: Semilla base; cada terminal deriva la suya
+        profile: Perfil de rendimiento de cada ``Database``
+    """
+    db_path: str
+    threads: int = 4
+    processes: int = 1
+    duration: float = 10.0
+    mix: Dict[str, float] = field(default_factory=lambda: dict(MEZCLA_DEFECTO))
+    seed: int = 1
+    profile: str = 'balanced'
+
+    def __post_init__(self):
+        desconocidas = set(self.mix) - set(OPERACIONES)
+        if desconocidas:
+            raise ValueError(f"Operaciones desconocidas: {', '.join(sorted(desconocidas))}")
+        if self.threads < 1 or self.processes < 1:
+            raise ValueError("threads y processes deben ser al menos 1")
+        if not any(peso > 0 for peso in self.mix.values()):
+            raise ValueError("La mezcla necesita al menos una operación con peso positivo")
+
+
+class _LockCounter(logging.Handler):
+    """Marca el hilo actual cuando un servicio registra un bloqueo agotado.
+
+    Los servicios convierten las excepciones en mensajes de log y valores
+    de retorno; este handler permite atribuir el bloqueo a la llamada en
+    curso sin cambiar su API.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self._local = threading.local()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if 'locked' in record.getMessage():
+            self._local.bloqueado = True
+
+    def reset(self) -> None:
+        self._local.bloqueado = False
+
+    def bloqueado(self) -> bool:
+        return getattr(self._local, 'bloqueado', False)
+
+
+class _Terminal:
+    """Un puesto: su propia base de datos, servicios y usuario cliente.
+
+    Las aceptaciones no necesitan usuario: el servicio no lo recibe.
+    """
+
+    def __init__(self, config: LoadConfig, usuario: Dict, aparatos: List[int], seed: int):
+        self.db = Database(config.db_path, pool_size=1, profile=config.profile)
+        self.event_bus = EventBus()
+        self.servicio = ReservationService(
+            Reserva(self.db), Aparato(self.db), Cliente(self.db), Notificacion(self.db),
+            event_bus=self.event_bus
+        )
+        self.usuario = usuario
+        self.aparatos = aparatos
+        self.rng = random.Random(seed)
+        self.pendientes: List[int] = []
+        self.mias: List[int] = []
+
+    def close(self) -> None:
+        self.event_bus.close()
+        self.db.close()
+
+    def reservar(self) -> Tuple[bool, str]:
+        hora = f"{self.rng.randrange(24):02d}:{self.rng.choice((0, 30)):02d}"
+        return self.servicio.crear_reserva(
+            self.usuario, self.rng.choice(self.aparatos), self.rng.choice(Reserva.DIAS_SEMANA), hora
+        )
+
+    def aceptar(self) -> Optional[Tuple[bool, str]]:
+        if not self.pendientes:
+            pagina = self.servicio.obtener_pagina_reservas_pendientes()
+            self.pendientes = [item['id'] for item in pagina['items']]
+            self.rng.shuffle(self.pendientes)
+        if not self.pendientes:
+            return None
+        return self.servicio.aceptar_reserva(self.pendientes.pop())
+
+    def cancelar(self) -> Optional[Tuple[bool, str]]:
+        if not self.mias:
+            self.listar()
+        if not self.mias:
+            return None
+        return self.servicio.eliminar_reserva(self.mias.pop(), self.usuario)
+
+    def listar(self) -> Tuple[bool, str]:
+        reservas = self.servicio.obtener_mis_reservas(self.usuario)
+        self.mias = [reserva['id'] for reserva in reservas]
+        self.rng.shuffle(self.mias)
+        return True, ''
+
+
+def _clasificar(resultado: Tuple[bool, str], bloqueado: bool) -> str:
+    exito, mensaje = resultado
+    if bloqueado or 'locked' in mensaje:
+        return BLOQUEO
+    if exito:
+        return OK
+    if mensaje.startswith('Error'):
+        return ERROR
+    return RECHAZADA
+
+
+def _silenciar_consola() -> None:
+    """Deja en la consola solo los errores: cada llamada registra INFO/WARNING."""
+    for handler in logging.getLogger().handlers:
+        handler.setLevel(logging.ERROR)
+
+
+def _ejecutar_proceso(config: LoadConfig, usuarios: List[Dict],
+                      aparatos: List[int], indice: int) -> Dict:
+    """Ejecuta ``len(usuarios)`` terminales en hilos y devuelve sus mediciones en bruto."""
+    _silenciar_consola()
+    contador = _LockCounter()
+    registro_core = logging.getLogger('core')
+    registro_core.addHandler(contador)
+    if registro_core.getEffectiveLevel() > logging.WARNING:
+        registro_core.setLevel(logging.WARNING)
+
+    operaciones = [op for op in OPERACIONES if config.mix.get(op, 0) > 0]
+    pesos = [config.mix[op] for op in operaciones]
+    latencias: Dict[str, List[float]] = {op: [] for op in OPERACIONES}
+    resultados: Dict[str, Counter] = {op: Counter() for op in OPERACIONES}
+    lock = threading.Lock()
+    fin = [0.0]
+    # Las terminales arrancan juntas una vez abiertas sus bases de datos
+    salida = threading.Barrier(
+        len(usuarios) + 1, action=lambda: fin.__setitem__(0, time.perf_counter() + config.duration)
+    )
+
+    def trabajar(posicion: int, usuario: Dict) -> None:
+        terminal = None
+        try:
+            semilla = config.seed * 1000003 + indice * 1009 + posicion
+            terminal = _Terminal(config, usuario, aparatos, semilla)
+            propias = {op: [] for op in OPERACIONES}
+            cuentas = {op: Counter() for op in OPERACIONES}
+            salida.wait()
+            while time.perf_counter() < fin[0]:
+                op = terminal.rng.choices(operaciones, pesos)[0]
+                contador.reset()
+                inicio = time.perf_counter()
+                try:
+                    resultado = getattr(terminal, op)()
+                except sqlite3.OperationalError as e:
+                    resultado = (False, f"Error: {e}")
+                except Exception as e:
+                    logger.error(f"Error en {op}: {e}")
+                    resultado = (False, f"Error: {e}")
+                transcurrido = time.perf_counter() - inicio
+                if resultado is None:
+                    continue  # nada que aceptar o cancelar todavía
+                propias[op].append(transcurrido * 1000)
+                cuentas[op][_clasificar(resultado, contador.bloqueado())] += 1
+            with lock:
+                for op in OPERACIONES:
+                    latencias[op].extend(propias[op])
+                    resultados[op].update(cuentas[op])
+        except threading.BrokenBarrierError:
+            pass
+        except Exception as e:
+            logger.error(f"No se pudo iniciar la terminal {indice}-{posicion}: {e}")
+            salida.abort()
+        finally:
+            if terminal is not None:
+                terminal.close()
+
+    hilos = [threading.Thread(target=trabajar, args=(i, usuario), name=f"terminal-{indice}-{i}")
+             for i, usuario in enumerate(usuarios)]
+    for hilo in hilos:
+        hilo.start()
+    try:
+        salida.wait()
+    except threading.BrokenBarrierError:
+        pass
+    for hilo in hilos:
+        hilo.join()
+    registro_core.removeHandler(contador)
+
+    return {'latencias': latencias, 'resultados': {op: dict(c) for op, c in resultados.items()}}
+
+
+def _usuarios(db_path: str, cantidad: int) -> Tuple[List[Dict], List[int]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        filas = conn.execute('''
+            SELECT id_cliente, nombre, apellido, dni, tipo_usuario FROM clientes
+            WHERE tipo_usuario = 'cliente' ORDER BY id_cliente LIMIT ?
+        ''', (cantidad,)).fetchall()
+        aparatos = [fila[0] for fila in conn.execute("SELECT id_aparato FROM aparatos")]
+    finally:
+        conn.close()
+    if len(filas) < cantidad:
+        raise ValueError(f"Se necesitan {cantidad} clientes y la base de datos tiene {len(filas)}")
+    if not aparatos:
+        raise ValueError("La base de datos no tiene aparatos")
+    como_dict = lambda f: {'id': f[0], 'nombre': f[1], 'apellido': f[2], 'dni': f[3], 'tipo': f[4]}
+    return [como_dict(f) for f in filas], aparatos
+
+
+def find_double_bookings(db_path: str) -> List[Dict]:
+    """Franjas (aparato, día, inicio) con más de una reserva aceptada."""
+    conn = sqlite3.connect(db_path)
+    try:
+        filas = conn.execute('''
+            SELECT id_aparato, dia, inicio_min, COUNT(*), GROUP_CONCAT(id_reserva)
+            FROM reservas
+            WHERE estado = 'aceptada'
+            GROUP BY id_aparato, dia, inicio_min
+            HAVING COUNT(*) > 1
+        ''').fetchall()
+    finally:
+        conn.close()
+    return [{'id_aparato': f[0], 'dia': f[1], 'inicio_min': f[2], 'aceptadas': f[3],
+             'reservas': [int(i) for i in f[4].split(',')]} for f in filas]
+
+
+def _percentil(ordenados: List[float], p: float) -> float:
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def _resumen(latencias: List[float], resultados: Dict[str, int], duracion: float) -> Dict:
+    ordenados = sorted(latencias)
+    resumen = {
+        'count': len(ordenados),
+        'throughput_ops_s': round(len(ordenados) / duracion, 2) if duracion else 0.0,
+        **{clase: resultados.get(clase, 0) for clase in (OK, RECHAZADA, BLOQUEO, ERROR)},
+    }
+    if ordenados:
+        resumen.update({
+            'p50_ms': round(_percentil(ordenados, 50), 3),
+            'p95_ms': round(_percentil(ordenados, 95), 3),
+            'p99_ms': round(_percentil(ordenados, 99), 3),
+            'max_ms': round(ordenados[-1], 3),
+            'mean_ms': round(statistics.fmean(ordenados), 3),
+        })
+    return resumen
+
+
+def run_load(config: LoadConfig) -> Dict:
+    """Ejecuta la prueba de carga y devuelve el informe.
+
+    Returns:
+        Diccionario serializable con 'meta', 'total', 'operations' (por
+        operación), 'lock_timeouts' y 'double_bookings'
+    """
+    terminales = config.threads * config.processes
+    usuarios, aparatos = _usuarios(config.db_path, terminales)
+    grupos = [usuarios[i * config.threads:(i + 1) * config.threads] for i in range(config.processes)]
+
+    inicio = time.perf_counter()
+    if config.processes == 1:
+        parciales = [_ejecutar_proceso(config, grupos[0], aparatos, 0)]
+    else:
+        contexto = multiprocessing.get_context('spawn')
+        with contexto.Pool(config.processes) as pool:
+            parciales = pool.starmap(
+                _ejecutar_proceso,
+                [(config, grupo, aparatos, i) for i, grupo in enumerate(grupos)]
+            )
+    transcurrido = time.perf_counter() - inicio
+
+    latencias = {op: [] for op in OPERACIONES}
+    resultados = {op: Counter() for op in OPERACIONES}
+    for parcial in parciales:
+        for op in OPERACIONES:
+            latencias[op].extend(parcial['latencias'][op])
+            resultados[op].update(parcial['resultados'][op])
+
+    operaciones = {op: _resumen(latencias[op], resultados[op], config.duration)
+                   for op in OPERACIONES if latencias[op]}
+    total = _resumen([l for op in OPERACIONES for l in latencias[op]],
+                     sum(resultados.values(), Counter()), config.duration)
+    dobles = find_double_bookings(config.db_path)
+    if dobles:
+        logger.error(f"{len(dobles)} franjas aceptadas más de una vez")
+
+    return {
+        'meta': {
+            **asdict(config),
+            'terminals': terminales,
+            'seconds': round(transcurrido, 3),
+            'sqlite': sqlite3.sqlite_version,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'total': total,
+        'operations': operaciones,
+        'lock_timeouts': total[BLOQUEO],
+        'double_bookings': dobles,
+    }
@@ -0,0 +1,293 @@
+"""Regresiones de planes de consulta de los modelos.
+
+``check_plans`` ejecuta los casos de ``plan_cases`` sobre una base de datos
+sintética, recoge cada sentencia SQL distinta que llega al pool a través de
+``SQLStats`` y pide a SQLite su ``EXPLAIN QUERY PLAN`` sobre esos mismos
+datos ya analizados.
+
+Se consideran problemas los pasos que recorren una tabla completa (``SCAN``,
+también en el orden de un índice: solo ``SEARCH`` acota las filas) y los que ordenan o agrupan en un B-tree temporal (``USE TEMP
+B-TREE``). Los aceptables (tablas pequeñas, listados completos por
+diseño...) se declaran con su motivo en ``query_plan_allowlist.json``; el
+resto son regresiones. Cada entrada se identifica por la huella de la
+sentencia normalizada y el paso del plan, de modo que cualquier cambio en
+el texto de una consulta obliga a revisarla de nuevo.
+
+Los parámetros se enlazan como NULL: los planes de los modelos no dependen
+de los valores concretos.
+
+``python -m benchmarks plans`` sale con código 1 ante cualquier regresión;
+el flujo ``.github/workflows/query-plans.yml`` lo ejecuta en cada push y
+pull request.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Set
+import logging
+
+from core.models import Database
+from .suite import BenchmarkCase, BenchmarkContext, default_cases
+
+logger = logging.getLogger(__name__)
+
+ALLOWLIST_PATH = os.path.join(os.path.dirname(__file__), 'query_plan_allowlist.json')
+ALLOWLIST_VERSION = 1
+
+# Sentencias sin plan de consulta que revisar
+SIN_PLAN = ('PRAGMA', 'BEGIN', 'COMMIT', 'END', 'ROLLBACK', 'SAVEPOINT', 'RELEASE',
+            'CREATE', 'DROP', 'ALTER', 'ANALYZE', 'EXPLAIN', 'VACUUM', 'REINDEX')
+
+_TABLA_ALIAS = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+
+
+def _segunda_pagina(pagina: Callable[[BenchmarkContext], Callable]) -> Callable[[BenchmarkContext], Dict]:
+    """Caso que pide la página siguiente a la primera (su consulta lleva cursor)."""
+    def llamar(ctx: BenchmarkContext) -> Dict:
+        primera = pagina(ctx)(None)
+        if primera.get('siguiente'):
+            return pagina(ctx)(primera['siguiente'])
+        return primera
+    return llamar
+
+
+def plan_cases() -> List[BenchmarkCase]:
+    """Casos de ``default_cases`` más las consultas de modelo que no mide.
+
+    Se añaden las páginas con cursor, los órdenes de morosos y los métodos
+    de escritura que la medición no llama.
+    """
+    c = BenchmarkCase
+    cliente = lambda ctx: ctx.controller.cliente_model
+    aparato = lambda ctx: ctx.controller.aparato_model
+    reserva = lambda ctx: ctx.controller.reserva_model
+    recibo = lambda ctx: ctx.controller.recibo_model
+    notificacion = lambda ctx: ctx.controller.notificacion_model
+
+    def morosos(orden: str) -> BenchmarkCase:
+        return c(f'models.Recibo.obtener_pagina_morosos[{orden},cursor]',
+                 _segunda_pagina(lambda ctx: lambda cursor: recibo(ctx).obtener_pagina_morosos(
+                     orden, cursor_pagina=cursor)))
+
+    def pendientes(ctx: BenchmarkContext) -> List[int]:
+        return [ctx.take('reservas_pendientes'), ctx.take('reservas_pendientes')]
+
+    return default_cases() + [
+        c('models.Cliente.obtener_pagina[cursor]', _segunda_pagina(lambda ctx: cliente(ctx).obtener_pagina)),
+        c('models.Reserva.obtener_pagina[cursor]', _segunda_pagina(lambda ctx: reserva(ctx).obtener_pagina)),
+        c('models.Reserva.obtener_pagina_pendientes[cursor]',
+          _segunda_pagina(lambda ctx: reserva(ctx).obtener_pagina_pendientes)),
+        c('models.Reserva.obtener_pagina_por_estado[cursor]',
+          _segunda_pagina(lambda ctx: lambda cursor: reserva(ctx).obtener_pagina_por_estado(
+              'aceptada', cursor))),
+        c('models.Recibo.obtener_pagina[cursor]', _segunda_pagina(lambda ctx: recibo(ctx).obtener_pagina)),
+        *[morosos(orden) for orden in ('deuda', 'recibos', 'antiguedad', 'apellido')],
+
+        c('models.Recibo.marcar_pagado',
+          lambda ctx: recibo(ctx).marcar_pagado(ctx.take('recibos_pendientes')), write=True),
+        c('models.Recibo.registrar_pago',
+          lambda ctx: recibo(ctx).registrar_pago(ctx.take('recibos_pendientes'), 50.0), write=True),
+        c('models.Recibo.generar_recibos_mes',
+          lambda ctx: recibo(ctx).generar_recibos_mes(time.localtime().tm_mon, time.localtime().tm_year),
+          write=True),
+        c('models.Recibo.reconstruir_resumen_financiero',
+          lambda ctx: recibo(ctx).reconstruir_resumen_financiero(), write=True),
+        c('models.Reserva.aceptar_reservas_lote',
+          lambda ctx: reserva(ctx).aceptar_reservas_lote(pendientes(ctx)), write=True),
+        c('models.Reserva.rechazar_reservas_lote',
+          lambda ctx: reserva(ctx).rechazar_reservas_lote(pendientes(ctx)), write=True),
+        c('models.Reserva.eliminar_reserva',
+          lambda ctx: reserva(ctx).eliminar_reserva(ctx.take('reservas')), write=True),
+        c('models.Notificacion.crear_notificacion',
+          lambda ctx: notificacion(ctx).crear_notificacion(
+              ctx.cliente['id'], ctx.pick('reservas'), 'aceptada', 'Revisión de planes'), write=True),
+        c('models.Notificacion.eliminar_notificacion',
+          lambda ctx: notificacion(ctx).eliminar_notificacion(ctx.take('notificaciones')), write=True),
+        c('models.Aparato.eliminar_aparato',
+          lambda ctx: aparato(ctx).eliminar_aparato(aparato(ctx).crear_aparato('Plan', 'Cardio')),
+          write=True),
+    ]
+
+
+def fingerprint(sql: str) -> str:
+    """Huella estable de una sentencia (sobre su texto normalizado)."""
+    return hashlib.sha1(' '.join(sql.split()).encode('utf-8')).hexdigest()[:12]
+
+
+def collect_statements(db: Database, cases: Optional[Sequence[BenchmarkCase]] = None) -> Dict[str, str]:
+    """Ejecuta cada caso una vez y devuelve las sentencias emitidas.
+
+    Args:
+        db: Base de datos instrumentada (``instrument=True``)
+        cases: Casos a ejecutar (por defecto ``plan_cases()``)
+
+    Returns:
+        Diccionario {sentencia normalizada: primer caso que la emitió}
+    """
+    if db.sql_stats is None:
+        raise ValueError("La base de datos debe crearse con instrument=True")
+    casos = sorted(cases if cases is not None else plan_cases(), key=lambda caso: caso.write)
+
+    ctx = BenchmarkContext(db)
+    origenes: Dict[str, str] = {}
+    try:
+        # Las consultas de muestra del contexto no son de los modelos
+        db.reset_sql_stats()
+        for caso in casos:
+            try:
+                if caso.setup is not None:
+                    caso.setup(ctx)
+                caso.call(ctx)
+            except Exception as e:
+                logger.error(f"Error en el caso {caso.name}: {e}")
+            for fila in db.sql_stats.snapshot():
+                origenes.setdefault(fila['sql'], caso.name)
+    finally:
+        ctx.controller.event_bus.close()
+        ctx.controller.change_monitor.close()
+    return origenes
+
+
+def _tablas(conn: sqlite3.Connection) -> Set[str]:
+    return {fila[0] for fila in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def plan_problems(sql: str, detalles: Sequence[str], tablas: Set[str]) -> List[str]:
+    """Pasos del plan de ``sql`` que recorren una tabla o usan un B-tree temporal.
+
+    Los ``SCAN`` de CTE, subconsultas materializadas y tablas virtuales
+    (``json_each``) no cuentan: sus recorridos sobre tablas aparecen como
+    pasos propios del plan. Un ``SCAN ... USING INDEX`` sí cuenta: recorre
+    todas las filas, aunque sea en orden (las páginas con LIMIT se permiten
+    explícitamente).
+    """
+    alias = {}
+    for tabla, nombre in _TABLA_ALIAS.findall(sql):
+        if tabla in tablas:
+            alias[tabla] = tabla
+            if nombre:
+                alias[nombre] = tabla
+
+    problemas = []
+    for detalle in detalles:
+        if detalle.startswith('USE TEMP B-TREE'):
+            problemas.append(detalle)
+        elif detalle.startswith('SCAN ') and detalle.split()[1] in alias:
+            problemas.append(detalle)
+    return problemas
+
+
+def explain(conn: sqlite3.Connection, sql: str) -> List[str]:
+    """Pasos de ``EXPLAIN QUERY PLAN`` de ``sql`` con todos sus parámetros a NULL."""
+    filas = conn.execute(f"EXPLAIN QUERY PLAN {sql}", (None,) * sql.count('?')).fetchall()
+    return [fila[3] for fila in filas]
+
+
+def load_allowlist(path: str = ALLOWLIST_PATH) -> List[Dict]:
+    """Entradas permitidas: {'fingerprint', 'detail', 'sql', 'origin', 'reason'}."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        datos = json.load(f)
+    entradas = datos.get('entries', [])
+    for entrada in entradas:
+        if not entrada.get('fingerprint') or not entrada.get('detail'):
+            raise ValueError(f"Entrada de {path} sin 'fingerprint' o 'detail': {entrada}")
+    return entradas
+
+
+def write_allowlist(informe: Dict, path: str = ALLOWLIST_PATH) -> int:
+    """Guarda como permitidos todos los problemas de ``informe``.
+
+    Conserva el motivo de las entradas que ya existían; las nuevas quedan
+    con el motivo vacío para que se documente al revisarlas.
+
+    Returns:
+        Número de entradas escritas
+    """
+    motivos = {(e['fingerprint'], e['detail']): e.get('reason', '') for e in load_allowlist(path)}
+    entradas = []
+    for hallazgo in informe['violations'] + informe['allowed']:
+        clave = (hallazgo['fingerprint'], hallazgo['detail'])
+        entradas.append({
+            'fingerprint': hallazgo['fingerprint'],
+            'detail': hallazgo['detail'],
+            'origin': hallazgo['origin'],
+            'sql': hallazgo['sql'],
+            'reason': motivos.get(clave, ''),
+        })
+    entradas.sort(key=lambda e: (e['origin'], e['fingerprint'], e['detail']))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': ALLOWLIST_VERSION, 'entries': entradas}, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return len(entradas)
+
+
+def check_plans(db_path: str, allowlist: Optional[str] = ALLOWLIST_PATH,
+                cases: Optional[Sequence[BenchmarkCase]] = None,
+                profile: str = 'balanced') -> Dict:
+    """Revisa el plan de cada sentencia que emiten los casos.
+
+    Args:
+        db_path: Base de datos sintética; los casos de escritura la modifican
+        allowlist: Archivo de problemas permitidos (None para no permitir ninguno)
+        cases: Casos a ejecutar (por defecto ``plan_cases()``)
+        profile: Perfil de rendimiento de ``Database``
+
+    Returns:
+        Diccionario serializable con 'meta', 'violations' (problemas no
+        permitidos), 'allowed', 'stale' (entradas permitidas que ya no
+        aparecen) y 'errors' (sentencias cuyo plan no se pudo obtener)
+    """
+    permitidas = load_allowlist(allowlist) if allowlist else []
+    claves_permitidas = {(e['fingerprint'], e['detail']) for e in permitidas}
+
+    inicio = time.perf_counter()
+    db = Database(db_path, profile=profile, instrument=True, slow_query_ms=None)
+    try:
+        origenes = collect_statements(db, cases)
+        violaciones, permitidos, errores = [], [], []
+        vistas = set()
+        revisadas = 0
+        with db.connection() as conn:
+            tablas = _tablas(conn)
+            for sql, origen in sorted(origenes.items(), key=lambda item: (item[1], item[0])):
+                if sql.split(None, 1)[0].upper() in SIN_PLAN:
+                    continue
+                huella = fingerprint(sql)
+                try:
+                    detalles = explain(conn, sql)
+                except sqlite3.Error as e:
+                    errores.append({'fingerprint': huella, 'origin': origen, 'sql': sql, 'error': str(e)})
+                    continue
+                revisadas += 1
+                for detalle in plan_problems(sql, detalles, tablas):
+                    hallazgo = {'fingerprint': huella, 'detail': detalle, 'origin': origen,
+                                'sql': sql, 'plan': detalles}
+                    if (huella, detalle) in claves_permitidas:
+                        permitidos.append(hallazgo)
+                        vistas.add((huella, detalle))
+                    else:
+                        violaciones.append(hallazgo)
+    finally:
+        db.close()
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'db_path': db_path,
+            'allowlist': allowlist,
+            'statements': len(origenes),
+            'explained': revisadas,
+            'sqlite': sqlite3.sqlite_version,
+            'seconds': round(time.perf_counter() - inicio, 3),
+        },
+        'violations': violaciones,
+        'allowed': permitidos,
+        'stale': [e for e in permitidas if (e['fingerprint'], e['detail']) not in vistas],
+        'errors': errores,
+    }
@@ -0,0 +1,419 @@
+"""Medición de los métodos de modelos, servicios y controlador.
+
+Cada ``BenchmarkCase`` es una llamada con argumentos tomados de la base de
+datos sintética. ``run_suite`` ejecuta cada caso ``repeat`` veces (tras una
+llamada de calentamiento) y devuelve un diccionario serializable a JSON con
+los percentiles por caso; ``compare_results`` contrasta dos ejecuciones.
+
+Los casos de escritura modifican la base de datos: se ejecutan después de
+todas las lecturas y conviene medir sobre una copia del archivo generado.
+"""
+
+import platform
+import random
+import sqlite3
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+import logging
+
+from core.controller.gym_controller import GymController
+from core.models import Database
+from .fixtures import DNI_BASE, PASSWORD
+
+logger = logging.getLogger(__name__)
+
+RESULTS_VERSION = 1
+
+
+class BenchmarkContext:
+    """Modelos, servicios y controlador sobre una base de datos, más los
+    identificadores de muestra que usan los casos."""
+
+    def __init__(self, db: Database, seed: int = 1, muestra: int = 1000):
+        """Inicializa el contexto.
+
+        Args:
+            db: Base de datos sintética
+            seed: Semilla para elegir los identificadores de muestra
+            muestra: Identificadores que se toman de cada tabla
+        """
+        self.db = db
+        self.controller = GymController(db)
+        self.rng = random.Random(seed)
+        self.admin = self._usuario("tipo_usuario = 'admin'")
+        self.cliente = self._usuario("dni = ?", (str(DNI_BASE),))
+        self.ids = {
+            'clientes': self._muestra("SELECT id_cliente FROM clientes WHERE tipo_usuario = 'cliente'", muestra),
+            'dnis': self._muestra("SELECT dni FROM clientes WHERE tipo_usuario = 'cliente'", muestra),
+            'aparatos': self._muestra("SELECT id_aparato FROM aparatos", muestra),
+            'reservas': self._muestra("SELECT id_reserva FROM reservas", muestra),
+            'reservas_pendientes': self._muestra(
+                "SELECT id_reserva FROM reservas WHERE estado = 'pendiente'", muestra),
+            'recibos': self._muestra("SELECT id_recibo FROM recibos", muestra),
+            'recibos_pendientes': self._muestra(
+                "SELECT id_recibo FROM recibos WHERE estado = 'pendiente'", muestra),
+            'notificaciones': self._muestra("SELECT id_notificacion FROM notificaciones", muestra),
+        }
+        self._consumidos: Dict[str, Iterator[int]] = {}
+        self._contador = 0
+
+    def _usuario(self, condicion: str, params: tuple = ()) -> Optional[Dict]:
+        with self.db.connection() as conn:
+            fila = conn.execute(
+                f"SELECT id_cliente, nombre, apellido, dni, tipo_usuario FROM clientes "
+                f"WHERE {condicion} ORDER BY id_cliente LIMIT 1", params
+            ).fetchone()
+        if fila is None:
+            return None
+        return {'id': fila['id_cliente'], 'nombre': fila['nombre'], 'apellido': fila['apellido'],
+                'dni': fila['dni'], 'tipo': fila['tipo_usuario']}
+
+    def _muestra(self, sql: str, cantidad: int) -> List[Any]:
+        with self.db.connection() as conn:
+            ids = [fila[0] for fila in conn.execute(sql)]
+        return self.rng.sample(ids, min(cantidad, len(ids)))
+
+    def pick(self, tabla: str) -> Any:
+        """Valor al azar de la muestra ``tabla`` (0 si está vacía)."""
+        ids = self.ids[tabla]
+        return self.rng.choice(ids) if ids else 0
+
+    def take(self, tabla: str) -> int:
+        """Identificador de la muestra que no se ha devuelto antes (para escrituras)."""
+        if tabla not in self._consumidos:
+            self._consumidos[tabla] = iter(self.ids[tabla])
+        return next(self._consumidos[tabla], 0)
+
+    def unique(self) -> int:
+        """Número distinto en cada llamada (DNIs y nombres nuevos)."""
+        self._contador += 1
+        return self._contador
+
+    def as_admin(self) -> None:
+        self.controller.usuario_actual = self.admin
+
+    def as_cliente(self) -> None:
+        self.controller.usuario_actual = self.cliente
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Llamada medida.
+
+    Attributes:
+        name: Identificador estable ('capa.Clase.metodo[variante]')
+        call: Recibe el contexto y hace la llamada
+        setup: Se ejecuta antes de cada llamada, fuera de la medición
+        write: Si modifica la base de datos
+    """
+    name: str
+    call: Callable[[BenchmarkContext], Any]
+    setup: Optional[Callable[[BenchmarkContext], None]] = None
+    write: bool = False
+
+
+def _dia(ctx: BenchmarkContext) -> str:
+    return ctx.rng.choice(ctx.controller.reserva_model.DIAS_SEMANA)
+
+
+def _hora(ctx: BenchmarkContext) -> str:
+    return f"{ctx.rng.randrange(24):02d}:{ctx.rng.choice((0, 30)):02d}"
+
+
+def _admin_sin_cache(ctx: BenchmarkContext) -> None:
+    ctx.as_admin()
+    ctx.controller.invalidar_cache()
+
+
+def _cliente_sin_cache(ctx: BenchmarkContext) -> None:
+    ctx.as_cliente()
+    ctx.controller.invalidar_cache()
+
+
+def default_cases() -> List[BenchmarkCase]:
+    """Casos de lectura y escritura de modelos, servicios y controlador."""
+    c = BenchmarkCase
+    cliente = lambda ctx: ctx.controller.cliente_model
+    aparato = lambda ctx: ctx.controller.aparato_model
+    reserva = lambda ctx: ctx.controller.reserva_model
+    recibo = lambda ctx: ctx.controller.recibo_model
+    notificacion = lambda ctx: ctx.controller.notificacion_model
+    estadisticas = lambda ctx: ctx.controller.estadisticas_model
+    ctl = lambda ctx: ctx.controller
+
+    return [
+        # Modelos: lecturas
+        c('models.Cliente.dni_existe', lambda ctx: cliente(ctx).dni_existe(ctx.pick('dnis'))),
+        c('models.Cliente.autenticar', lambda ctx: cliente(ctx).autenticar(str(DNI_BASE), PASSWORD)),
+        c('models.Cliente.obtener_todos', lambda ctx: cliente(ctx).obtener_todos()),
+        c('models.Cliente.obtener_pagina', lambda ctx: cliente(ctx).obtener_pagina()),
+        c('models.Cliente.obtener_por_id', lambda ctx: cliente(ctx).obtener_por_id(ctx.pick('clientes'))),
+        c('models.Aparato.obtener_todos', lambda ctx: aparato(ctx).obtener_todos()),
+        c('models.Aparato.obtener_por_id', lambda ctx: aparato(ctx).obtener_por_id(ctx.pick('aparatos'))),
+        c('models.Reserva.verificar_disponibilidad',
+          lambda ctx: reserva(ctx).verificar_disponibilidad(ctx.pick('aparatos'), _dia(ctx), _hora(ctx))),
+        c('models.Reserva.obtener_reservas_cliente',
+          lambda ctx: reserva(ctx).obtener_reservas_cliente(ctx.pick('clientes'))),
+        c('models.Reserva.obtener_ocupacion_dia', lambda ctx: reserva(ctx).obtener_ocupacion_dia(_dia(ctx))),
+        c('models.Reserva.obtener_todas', lambda ctx: reserva(ctx).obtener_todas()),
+        c('models.Reserva.obtener_pagina', lambda ctx: reserva(ctx).obtener_pagina()),
+        c('models.Reserva.obtener_por_id', lambda ctx: reserva(ctx).obtener_por_id(ctx.pick('reservas'))),
+        c('models.Reserva.obtener_franjas_aceptadas', lambda ctx: reserva(ctx).obtener_franjas_aceptadas()),
+        c('models.Reserva.obtener_reservas_por_aparato',
+          lambda ctx: reserva(ctx).obtener_reservas_por_aparato(ctx.pick('aparatos'))),
+        c('models.Reserva.obtener_reservas_pendientes', lambda ctx: reserva(ctx).obtener_reservas_pendientes()),
+        c('models.Reserva.obtener_pagina_pendientes', lambda ctx: reserva(ctx).obtener_pagina_pendientes()),
+        c('models.Reserva.obtener_pagina_por_estado',
+          lambda ctx: reserva(ctx).obtener_pagina_por_estado('aceptada')),
+        c('models.Reserva.obtener_id_cliente_por_reserva',
+          lambda ctx: reserva(ctx).obtener_id_cliente_por_reserva(ctx.pick('reservas'))),
+        c('models.Recibo.obtener_recibos_cliente',
+          lambda ctx: recibo(ctx).obtener_recibos_cliente(ctx.pick('clientes'))),
+        c('models.Recibo.obtener_por_id', lambda ctx: recibo(ctx).obtener_por_id(ctx.pick('recibos'))),
+        c('models.Recibo.obtener_totales_financieros', lambda ctx: recibo(ctx).obtener_totales_financieros()),
+        c('models.Recibo.obtener_resumen_mensual', lambda ctx: recibo(ctx).obtener_resumen_mensual()),
+        c('models.Recibo.obtener_morosos', lambda ctx: recibo(ctx).obtener_morosos()),
+        c('models.Recibo.obtener_pagina_morosos', lambda ctx: recibo(ctx).obtener_pagina_morosos()),
+        c('models.Recibo.obtener_todos_recibos', lambda ctx: recibo(ctx).obtener_todos_recibos()),
+        c('models.Recibo.obtener_pagina', lambda ctx: recibo(ctx).obtener_pagina()),
+        c('models.Notificacion.obtener_por_cliente',
+          lambda ctx: notificacion(ctx).obtener_por_cliente(ctx.pick('clientes'))),
+        c('models.Notificacion.contar_no_leidas',
+          lambda ctx: notificacion(ctx).contar_no_leidas(ctx.pick('clientes'))),
+        c('models.Estadisticas.resumen_general', lambda ctx: estadisticas(ctx).resumen_general()),
+
+        # Servicios: lecturas
+        c('services.ClientService.obtener_pagina_clientes',
+          lambda ctx: ctl(ctx).client_service.obtener_pagina_clientes()),
+        c('services.ApparatusService.obtener_aparatos', lambda ctx: ctl(ctx).apparatus_service.obtener_aparatos()),
+        c('services.ReservationService.obtener_mis_reservas',
+          lambda ctx: ctl(ctx).reservation_service.obtener_mis_reservas(ctx.cliente)),
+        c('services.ReservationService.obtener_pagina_reservas',
+          lambda ctx: ctl(ctx).reservation_service.obtener_pagina_reservas()),
+        c('services.ReservationService.obtener_ocupacion_dia',
+          lambda ctx: ctl(ctx).reservation_service.obtener_ocupacion_dia(_dia(ctx))),
+        c('services.ReservationService.verificar_disponibilidad',
+          lambda ctx: ctl(ctx).reservation_service.verificar_disponibilidad(
+              ctx.pick('aparatos'), _dia(ctx), _hora(ctx))),
+        c('services.ReservationService.obtener_horarios_libres',
+          lambda ctx: ctl(ctx).reservation_service.obtener_horarios_libres(ctx.pick('aparatos'), _dia(ctx))),
+        c('services.ReservationService.obtener_pagina_reservas_pendientes',
+          lambda ctx: ctl(ctx).reservation_service.obtener_pagina_reservas_pendientes()),
+        c('services.ReservationService.obtener_pagina_reservas_por_estado',
+          lambda ctx: ctl(ctx).reservation_service.obtener_pagina_reservas_por_estado('aceptada')),
+        c('services.ReservationService.reconstruir_indice_disponibilidad',
+          lambda ctx: ctl(ctx).reservation_service.reconstruir_indice_disponibilidad()),
+        c('services.PaymentService.obtener_mis_recibos',
+          lambda ctx: ctl(ctx).payment_service.obtener_mis_recibos(ctx.cliente)),
+        c('services.PaymentService.obtener_pagina_recibos',
+          lambda ctx: ctl(ctx).payment_service.obtener_pagina_recibos()),
+        c('services.PaymentService.obtener_pagina_morosos',
+          lambda ctx: ctl(ctx).payment_service.obtener_pagina_morosos()),
+        c('services.PaymentService.obtener_estadisticas_financieras',
+          lambda ctx: ctl(ctx).payment_service.obtener_estadisticas_financieras()),
+        c('services.PaymentService.obtener_resumen_mensual',
+          lambda ctx: ctl(ctx).payment_service.obtener_resumen_mensual()),
+        c('services.StatisticsService.obtener_estadisticas_generales',
+          lambda ctx: ctl(ctx).statistics_service.obtener_estadisticas_generales()),
+
+        # Controlador: llamadas de los paneles, con la caché vacía y llena
+        c('controller.obtener_estadisticas_generales',
+          lambda ctx: ctl(ctx).obtener_estadisticas_generales(), _admin_sin_cache),
+        c('controller.obtener_estadisticas_generales[cache]',
+          lambda ctx: ctl(ctx).obtener_estadisticas_generales(), lambda ctx: ctx.as_admin()),
+        c('controller.obtener_estadisticas_financieras',
+          lambda ctx: ctl(ctx).obtener_estadisticas_financieras(), _admin_sin_cache),
+        c('controller.obtener_pagina_clientes', lambda ctx: ctl(ctx).obtener_pagina_clientes(), _admin_sin_cache),
+        c('controller.obtener_pagina_reservas', lambda ctx: ctl(ctx).obtener_pagina_reservas(), _admin_sin_cache),
+        c('controller.obtener_pagina_reservas_pendientes',
+          lambda ctx: ctl(ctx).obtener_pagina_reservas_pendientes(), _admin_sin_cache),
+        c('controller.obtener_pagina_reservas_por_estado',
+          lambda ctx: ctl(ctx).obtener_pagina_reservas_por_estado('aceptada'), _admin_sin_cache),
+        c('controller.obtener_pagina_recibos', lambda ctx: ctl(ctx).obtener_pagina_recibos(), _admin_sin_cache),
+        c('controller.obtener_pagina_morosos', lambda ctx: ctl(ctx).obtener_pagina_morosos(), _admin_sin_cache),
+        c('controller.obtener_mis_reservas', lambda ctx: ctl(ctx).obtener_mis_reservas(), _cliente_sin_cache),
+        c('controller.obtener_mis_recibos', lambda ctx: ctl(ctx).obtener_mis_recibos(), _cliente_sin_cache),
+        c('controller.obtener_mis_notificaciones',
+          lambda ctx: ctl(ctx).obtener_mis_notificaciones(), lambda ctx: ctx.as_cliente()),
+        c('controller.obtener_notificaciones_no_leidas',
+          lambda ctx: ctl(ctx).obtener_notificaciones_no_leidas(), lambda ctx: ctx.as_cliente()),
+        c('controller.comprobar_cambios', lambda ctx: ctl(ctx).comprobar_cambios()),
+
+        # Escrituras (al final: modifican la base de datos)
+        c('models.Cliente.crear_cliente',
+          lambda ctx: cliente(ctx).crear_cliente('Bench', 'Nuevo', f"B{ctx.unique():09d}", '600000000',
+                                                 'bench@gym.com', PASSWORD), write=True),
+        c('models.Aparato.crear_aparato',
+          lambda ctx: aparato(ctx).crear_aparato(f"Bench {ctx.unique()}", 'Cardio'), write=True),
+        c('models.Reserva.crear_reserva',
+          lambda ctx: reserva(ctx).crear_reserva(ctx.pick('clientes'), ctx.pick('aparatos'),
+                                                 _dia(ctx), _hora(ctx)), write=True),
+        c('models.Notificacion.marcar_como_leida',
+          lambda ctx: notificacion(ctx).marcar_como_leida(ctx.take('notificaciones')), write=True),
+        c('models.Recibo.registrar_pago',
+          lambda ctx: recibo(ctx).registrar_pago(ctx.take('recibos_pendientes'), 50.0), write=True),
+        c('services.ReservationService.crear_reserva',
+          lambda ctx: ctl(ctx).reservation_service.crear_reserva(
+              ctx.cliente, ctx.pick('aparatos'), _dia(ctx), _hora(ctx)), write=True),
+        c('services.ReservationService.aceptar_reserva',
+          lambda ctx: ctl(ctx).reservation_service.aceptar_reserva(ctx.take('reservas_pendientes')),
+          write=True),
+        c('services.ReservationService.rechazar_reserva',
+          lambda ctx: ctl(ctx).reservation_service.rechazar_reserva(ctx.take('reservas_pendientes')),
+          write=True),
+        c('services.PaymentService.pagar_recibo',
+          lambda ctx: ctl(ctx).payment_service.pagar_recibo(ctx.take('recibos_pendientes')), write=True),
+        c('controller.crear_reserva',
+          lambda ctx: ctl(ctx).crear_reserva(ctx.pick('aparatos'), _dia(ctx), _hora(ctx)),
+          lambda ctx: ctx.as_cliente(), write=True),
+    ]
+
+
+def _filas(resultado: Any) -> Optional[int]:
+    """Filas devueltas por una llamada, si se puede saber."""
+    if isinstance(resultado, list):
+        return len(resultado)
+    if isinstance(resultado, dict) and isinstance(resultado.get('items'), list):
+        return len(resultado['items'])
+    return None
+
+
+def _percentil(valores: Sequence[float], p: float) -> float:
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def _medir(ctx: BenchmarkContext, caso: BenchmarkCase, repeat: int) -> Dict:
+    tiempos = []
+    filas = None
+    for i in range(repeat + 1):
+        if caso.setup is not None:
+            caso.setup(ctx)
+        inicio = time.perf_counter()
+        resultado = caso.call(ctx)
+        transcurrido = time.perf_counter() - inicio
+        if i == 0:
+            continue  # calentamiento
+        tiempos.append(transcurrido)
+        filas = _filas(resultado)
+
+    ms = [t * 1000 for t in tiempos]
+    return {
+        'calls': len(ms),
+        'min_ms': round(min(ms), 4),
+        'median_ms': round(statistics.median(ms), 4),
+        'mean_ms': round(statistics.fmean(ms), 4),
+        'p95_ms': round(_percentil(ms, 95), 4),
+        'max_ms': round(max(ms), 4),
+        'rows': filas,
+        'write': caso.write,
+    }
+
+
+def run_suite(db_path: str, repeat: int = 10, include_writes: bool = True,
+              only: Optional[Sequence[str]] = None,
+              cases: Optional[Sequence[BenchmarkCase]] = None,
+              profile: str = 'balanced') -> Dict:
+    """Mide todos los casos sobre una base de datos.
+
+    Args:
+        db_path: Base de datos sintética (ver ``fixtures.build_fixture``)
+        repeat: Llamadas medidas por caso (más una de calentamiento)
+        include_writes: Si se ejecutan los casos que escriben
+        only: Subcadenas; solo se miden los casos cuyo nombre contiene alguna
+        cases: Casos a medir (por defecto ``default_cases()``)
+        profile: Perfil de rendimiento de ``Database``
+
+    Returns:
+        Diccionario serializable con 'meta', 'results' (por nombre de caso) y
+        'sql' (las 50 sentencias más costosas de toda la ejecución)
+    """
+    if repeat < 1:
+        raise ValueError("repeat debe ser al menos 1")
+    casos = list(cases if cases is not None else default_cases())
+    if not include_writes:
+        casos = [caso for caso in casos if not caso.write]
+    if only:
+        casos = [caso for caso in casos if any(patron in caso.name for patron in only)]
+    # Lecturas primero para que midan el estado generado
+    casos.sort(key=lambda caso: caso.write)
+
+    db = Database(db_path, profile=profile)
+    inicio = time.perf_counter()
+    try:
+        ctx = BenchmarkContext(db)
+        with db.connection() as conn:
+            filas = {
+                tabla: conn.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+                for tabla in ('clientes', 'aparatos', 'reservas', 'recibos', 'pagos', 'notificaciones')
+            }
+
+        resultados = {}
+        for caso in casos:
+            try:
+                resultados[caso.name] = _medir(ctx, caso, repeat)
+            except Exception as e:
+                logger.error(f"Error en el caso {caso.name}: {e}")
+                resultados[caso.name] = {'error': str(e), 'write': caso.write}
+        sql = db.sql_snapshot(limit=50)
+        ctx.controller.event_bus.close()
+        ctx.controller.change_monitor.close()
+    finally:
+        db.close()
+
+    return {
+        'meta': {
+            'version': RESULTS_VERSION,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'db_path': db_path,
+            'rows': filas,
+            'repeat': repeat,
+            'profile': profile,
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'seconds': round(time.perf_counter() - inicio, 3),
+        },
+        'results': resultados,
+        'sql': sql,
+    }
+
+
+def compare_results(base: Dict, nuevo: Dict, metric: str = 'median_ms',
+                    threshold: float = 0.1) -> List[Dict]:
+    """Compara dos ejecuciones de ``run_suite`` caso a caso.
+
+    Args:
+        base: Resultados de referencia
+        nuevo: Resultados a comparar
+        metric: Métrica de tiempo a comparar
+        threshold: Variación relativa a partir de la cual se marca el cambio
+
+    Returns:
+        Lista de {'name', 'base', 'new', 'ratio', 'status'} ordenada de peor
+        a mejor; status es 'slower', 'faster', 'same', 'added' o 'removed'
+    """
+    filas = []
+    anteriores = base.get('results', {})
+    actuales = nuevo.get('results', {})
+    for nombre in sorted(set(anteriores) | set(actuales)):
+        antes = anteriores.get(nombre, {}).get(metric)
+        despues = actuales.get(nombre, {}).get(metric)
+        if antes is None or despues is None:
+            estado = 'added' if antes is None else 'removed'
+            filas.append({'name': nombre, 'base': antes, 'new': despues, 'ratio': None, 'status': estado})
+            continue
+        ratio = despues / antes if antes else float('inf')
+        if ratio > 1 + threshold:
+            estado = 'slower'
+        elif ratio < 1 - threshold:
+            estado = 'faster'
+        else:
+            estado = 'same'
+        filas.append({'name': nombre, 'base': antes, 'new': despues,
+                      'ratio': round(ratio, 3), 'status': estado})
+    filas.sort(key=lambda fila: -(fila['ratio'] or 0))
+    return filas
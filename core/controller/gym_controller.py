@@ -1,14 +1,18 @@
-from typing import Optional, Dict, List, Tuple, Any
+from dataclasses import asdict
+from typing import Callable, ContextManager, Optional, Dict, FrozenSet, List, Tuple, Any
 from datetime import datetime
 import logging
 
 # Import models
-from core.models import Database, Cliente, Aparato, Reserva, Recibo, Notificacion
+from core.models import Database, Cliente, Aparato, Reserva, Recibo, Notificacion, Estadisticas
 
 # Import services
+from core.events import (
+    EventBus, EventoAparato, EventoCliente, EventoRecibo, EventoReserva, ReciboCreado, TablasModificadas
+)
 from core.services import (
     AuthService, ClientService, ApparatusService,
-    ReservationService, PaymentService
+    ReservationService, PaymentService, StatisticsService, ReadCache
 )
 
 # Import infrastructure exceptions (for controller-level checks)
@@ -38,24 +42,85 @@ class GymController:
         9: "Septiembre", 10: "Octubre", 11: "Noviembre", 12: "Diciembre"
     }
 
-    def __init__(self):
+    # Espacios de la caché de lectura que invalida una escritura en cada entidad
+    CACHE_DEPENDENCIAS = {
+        'aparatos': ('aparatos', 'reservas', 'estadisticas'),
+        'clientes': ('clientes', 'reservas', 'recibos', 'estadisticas'),
+        'reservas': ('reservas', 'estadisticas'),
+        'recibos': ('recibos', 'estadisticas'),
+    }
+
+    # Entidad de CACHE_DEPENDENCIAS afectada por cada tipo de evento de dominio
+    EVENTOS_ENTIDAD = {
+        EventoCliente: 'clientes',
+        EventoAparato: 'aparatos',
+        EventoReserva: 'reservas',
+        EventoRecibo: 'recibos',
+    }
+
+    # Entidad de CACHE_DEPENDENCIAS afectada por cada tabla vigilada
+    TABLAS_ENTIDAD = {
+        'clientes': 'clientes',
+        'aparatos': 'aparatos',
+        'reservas': 'reservas',
+        'recibos': 'recibos',
+        'pagos': 'recibos',
+    }
+
+    # Tablas que escribe directamente cada entidad de _escribir; sus
+    # cambios ya están aplicados en la caché y el índice de disponibilidad
+    TABLAS_ESCRITURA = {
+        'clientes': frozenset({'clientes'}),
+        'aparatos': frozenset({'aparatos'}),
+        'reservas': frozenset({'reservas'}),
+        'recibos': frozenset({'recibos', 'pagos'}),
+    }
+
+    def __init__(self, db: Optional[Database] = None, compartido: Optional['GymController'] = None):
+        """Inicializa modelos y servicios.
+
+        Args:
+            db: Base de datos a usar (por defecto ``gimnasio.db``)
+            compartido: Controlador sobre el mismo archivo con el que se
+                comparten la caché de lectura, el índice de disponibilidad y
+                el monitor de cambios (p. ej. lector y escritor de la API)
+        """
         try:
             # Inicializar base de datos y modelos
-            self.db = Database()
+            self.db = db or Database()
             self.cliente_model = Cliente(self.db)
             self.aparato_model = Aparato(self.db)
             self.reserva_model = Reserva(self.db)
             self.recibo_model = Recibo(self.db)
             self.notificacion_model = Notificacion(self.db)
+            self.estadisticas_model = Estadisticas(self.db)
 
-            # Inicializar servicios
+            # Inicializar servicios (comparten el bus de eventos de dominio)
+            self.event_bus = EventBus()
             self.auth_service = AuthService(self.cliente_model)
-            self.client_service = ClientService(self.cliente_model)
-            self.apparatus_service = ApparatusService(self.aparato_model, self.reserva_model)
+            self.client_service = ClientService(self.cliente_model, event_bus=self.event_bus)
+            self.apparatus_service = ApparatusService(
+                self.aparato_model, self.reserva_model, event_bus=self.event_bus
+            )
             self.reservation_service = ReservationService(
-                self.reserva_model, self.aparato_model, self.cliente_model, self.notificacion_model
+                self.reserva_model, self.aparato_model, self.cliente_model, self.notificacion_model,
+                availability_index=compartido.reservation_service.availability_index if compartido else None,
+                event_bus=self.event_bus
+            )
+            self.payment_service = PaymentService(
+                self.recibo_model, self.cliente_model, event_bus=self.event_bus
             )
-            self.payment_service = PaymentService(self.recibo_model, self.cliente_model)
+            self.statistics_service = StatisticsService(self.estadisticas_model)
+            self.cache = compartido.cache if compartido else ReadCache()
+            for tipo_evento in self.EVENTOS_ENTIDAD:
+                self.event_bus.subscribe(tipo_evento, self._al_escribir)
+
+            # Escrituras de otros terminales: se detectan con comprobar_cambios()
+            if compartido:
+                self.change_monitor = compartido.change_monitor
+            else:
+                self.change_monitor = self.db.change_monitor(on_change=self._publicar_cambios)
+                self.event_bus.subscribe(TablasModificadas, self._al_modificar_tablas)
 
             logger.info("GymController inicializado correctamente con todos los servicios")
         except Exception as e:
@@ -84,9 +149,13 @@ class GymController:
     def logout(self) -> None:
         self.auth_service.logout()
 
+    def sesion(self, usuario: Optional[Dict]) -> ContextManager[None]:
+        """Usa ``usuario`` como usuario actual solo en el hilo que llama (ver ``AuthService.sesion``)."""
+        return self.auth_service.sesion(usuario)
+
     def registrar_usuario(self, nombre: str, apellido: str, dni: str,
                          telefono: str, email: str, password: str) -> Tuple[bool, str]:
-        return self.client_service.registrar_usuario(nombre, apellido, dni, telefono, email, password)
+        return self._escribir('clientes', lambda: self.client_service.registrar_usuario(nombre, apellido, dni, telefono, email, password))
 
     def es_admin(self) -> bool:
         return self.auth_service.es_admin()
@@ -105,78 +174,135 @@ class GymController:
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_clientes requiere admin")
             return []
-        return self.client_service.obtener_clientes()
+        return self.cache.get_or_load('clientes', 'todos', self.client_service.obtener_clientes)
+
+    def obtener_pagina_clientes(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_clientes requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'clientes', ('pagina', cursor, tamano),
+            lambda: self.client_service.obtener_pagina_clientes(cursor, tamano))
 
     def crear_cliente_admin(self, nombre: str, apellido: str, dni: str, telefono: str, email: str, password: str, tipo: str = 'cliente') -> Tuple[bool, str]:
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.client_service.crear_cliente_admin(nombre, apellido, dni, telefono, email, password, tipo)
+        return self._escribir('clientes', lambda: self.client_service.crear_cliente_admin(nombre, apellido, dni, telefono, email, password, tipo))
 
     def eliminar_cliente_admin(self, id_cliente: int) -> Tuple[bool, str]:
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.client_service.eliminar_cliente(id_cliente)
+        return self._escribir('clientes', lambda: self.client_service.eliminar_cliente(id_cliente))
 
     # Apparatus
     def obtener_aparatos(self) -> List[Dict]:
-        return self.apparatus_service.obtener_aparatos()
+        return self.cache.get_or_load('aparatos', 'todos', self.apparatus_service.obtener_aparatos)
 
     def crear_aparato(self, nombre: str, tipo: str, descripcion: str = "") -> Tuple[bool, str]:
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.apparatus_service.crear_aparato(nombre, tipo, descripcion)
+        return self._escribir('aparatos', lambda: self.apparatus_service.crear_aparato(nombre, tipo, descripcion))
 
     def eliminar_aparato(self, id_aparato: int) -> Tuple[bool, str]:
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.apparatus_service.eliminar_aparato(id_aparato)
+        return self._escribir('aparatos', lambda: self.apparatus_service.eliminar_aparato(id_aparato))
 
     # Reservations
     def crear_reserva(self, id_aparato: int, dia_semana: str, hora_inicio: str) -> Tuple[bool, str]:
         usuario = self.obtener_usuario_actual()
         if not usuario:
             return False, "Debe iniciar sesión"
-        return self.reservation_service.crear_reserva(usuario, id_aparato, dia_semana, hora_inicio)
+        return self._escribir('reservas', lambda: self.reservation_service.crear_reserva(usuario, id_aparato, dia_semana, hora_inicio))
 
     def obtener_mis_reservas(self) -> List[Dict]:
         usuario = self.obtener_usuario_actual()
         if not usuario:
             return []
-        return self.reservation_service.obtener_mis_reservas(usuario)
+        return self.cache.get_or_load(
+            'reservas', ('cliente', usuario.get('id')),
+            lambda: self.reservation_service.obtener_mis_reservas(usuario))
 
     def obtener_todas_reservas(self) -> List[Dict]:
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_todas_reservas requiere admin")
             return []
-        return self.reservation_service.obtener_todas_reservas()
+        return self.cache.get_or_load('reservas', 'todas', self.reservation_service.obtener_todas_reservas)
+
+    def obtener_pagina_reservas(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_reservas requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'reservas', ('pagina', cursor, tamano),
+            lambda: self.reservation_service.obtener_pagina_reservas(cursor, tamano))
 
     def obtener_reservas_pendientes(self) -> List[Dict]:
         """Obtiene las reservas pendientes de aprobación"""
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_reservas_pendientes requiere admin")
             return []
-        return self.reservation_service.obtener_reservas_pendientes()
+        return self.cache.get_or_load('reservas', 'pendientes', self.reservation_service.obtener_reservas_pendientes)
+
+    def obtener_pagina_reservas_pendientes(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_reservas_pendientes requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'reservas', ('pagina_pendientes', cursor, tamano),
+            lambda: self.reservation_service.obtener_pagina_reservas_pendientes(cursor, tamano))
+
+    def obtener_pagina_reservas_por_estado(self, estado: str, cursor: Optional[str] = None,
+                                           tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_reservas_por_estado requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'reservas', ('pagina_estado', estado, cursor, tamano),
+            lambda: self.reservation_service.obtener_pagina_reservas_por_estado(estado, cursor, tamano))
 
     def aceptar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
         """Admin acepta una reserva pendiente"""
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.reservation_service.aceptar_reserva(id_reserva)
+        return self._escribir('reservas', lambda: self.reservation_service.aceptar_reserva(id_reserva))
 
     def rechazar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
         """Admin rechaza una reserva pendiente"""
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.reservation_service.rechazar_reserva(id_reserva)
+        return self._escribir('reservas', lambda: self.reservation_service.rechazar_reserva(id_reserva))
+
+    def aceptar_reservas(self, ids_reserva: List[int]) -> List[Dict]:
+        """Admin acepta varias reservas pendientes de una vez"""
+        if not self.es_admin():
+            return self._sin_permisos(ids_reserva)
+        return self._escribir('reservas', lambda: self.reservation_service.aceptar_reservas(ids_reserva))
+
+    def rechazar_reservas(self, ids_reserva: List[int]) -> List[Dict]:
+        """Admin rechaza varias reservas pendientes de una vez"""
+        if not self.es_admin():
+            return self._sin_permisos(ids_reserva)
+        return self._escribir('reservas', lambda: self.reservation_service.rechazar_reservas(ids_reserva))
+
+    @staticmethod
+    def _sin_permisos(ids_reserva: List[int]) -> List[Dict]:
+        return [
+            {'id': id_reserva, 'exito': False, 'mensaje': "Se requieren permisos de administrador",
+             'resultado': 'error', 'conflicto_con': None}
+            for id_reserva in ids_reserva
+        ]
 
     def obtener_ocupacion_dia(self, dia_semana: str) -> List[Dict]:
-        return self.reservation_service.obtener_ocupacion_dia(dia_semana)
+        return self.cache.get_or_load(
+            'reservas', ('ocupacion', dia_semana),
+            lambda: self.reservation_service.obtener_ocupacion_dia(dia_semana))
 
     def eliminar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
         usuario = self.obtener_usuario_actual()
         if not usuario:
             return False, "Debe iniciar sesión"
-        return self.reservation_service.eliminar_reserva(id_reserva, usuario)
+        return self._escribir('reservas', lambda: self.reservation_service.eliminar_reserva(id_reserva, usuario))
 
     def eliminar_reserva_admin(self, id_reserva: int) -> Tuple[bool, str]:
         """Admin puede eliminar cualquier reserva sin restricciones."""
@@ -184,7 +310,7 @@ class GymController:
             return False, "Se requieren permisos de administrador"
         # Crear un usuario fake para la eliminación (el admin está eliminando por eso)
         admin_user = self.obtener_usuario_actual()
-        return self.reservation_service.eliminar_reserva(id_reserva, admin_user)
+        return self._escribir('reservas', lambda: self.reservation_service.eliminar_reserva(id_reserva, admin_user))
 
     def crear_reserva_admin(self, id_cliente: int, id_aparato: int, dia_semana: str, hora_inicio: str) -> Tuple[bool, str]:
         """Admin puede crear reserva para cualquier cliente."""
@@ -204,7 +330,7 @@ class GymController:
                 'dni': cliente['dni']
             }
             
-            return self.reservation_service.crear_reserva(usuario_dict, id_aparato, dia_semana, hora_inicio)
+            return self._escribir('reservas', lambda: self.reservation_service.crear_reserva(usuario_dict, id_aparato, dia_semana, hora_inicio))
         except Exception as e:
             logger.error(f"Error al crear reserva para cliente: {e}")
             return False, str(e)
@@ -212,6 +338,10 @@ class GymController:
     def verificar_disponibilidad(self, id_aparato: int, dia_semana: str, hora_inicio: str) -> bool:
         return self.reservation_service.verificar_disponibilidad(id_aparato, dia_semana, hora_inicio)
 
+    def obtener_horarios_libres(self, id_aparato: int, dia_semana: str) -> List[str]:
+        """Horas de inicio sin reserva aceptada para un aparato y día."""
+        return self.reservation_service.obtener_horarios_libres(id_aparato, dia_semana)
+
     # Notificaciones
     def obtener_mis_notificaciones(self) -> List[Dict]:
         """Obtiene las notificaciones del usuario actual"""
@@ -264,13 +394,13 @@ class GymController:
         usuario = self.obtener_usuario_actual()
         if not usuario:
             return False, "Debe iniciar sesión"
-        return self.payment_service.pagar_recibo(id_recibo)
+        return self._escribir('recibos', lambda: self.payment_service.pagar_recibo(id_recibo))
 
     def pagar_recibo_admin(self, id_recibo: int) -> Tuple[bool, str]:
         """Admin puede marcar recibos como pagados sin restricciones."""
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.payment_service.pagar_recibo(id_recibo)
+        return self._escribir('recibos', lambda: self.payment_service.pagar_recibo(id_recibo))
 
     def crear_recibo_manual(self, id_cliente: int, concepto: str, monto: float, mes: int, anio: int, descripcion: str = "") -> Tuple[bool, str]:
         """Crea un recibo manual para un cliente (admin)."""
@@ -299,10 +429,11 @@ class GymController:
                 'fecha_creacion': datetime.now().isoformat()
             }
             
-            recibo_id = self.recibo_model.crear(nuevo_recibo)
+            recibo_id = self._escribir('recibos', lambda: self.recibo_model.crear(nuevo_recibo))
             
             if recibo_id:
                 logger.info(f"Recibo manual creado: {recibo_id} para cliente {id_cliente}")
+                self.event_bus.publish(ReciboCreado(recibo_id, id_cliente, mes, anio, monto))
                 return True, "Factura creada correctamente"
             else:
                 return False, "Error al crear la factura"
@@ -335,13 +466,21 @@ class GymController:
     def generar_recibos_mes(self, mes: int, anio: int) -> Tuple[bool, str]:
         if not self.es_admin():
             return False, "Se requieren permisos de administrador"
-        return self.payment_service.generar_recibos_mes(mes, anio)
+        return self._escribir('recibos', lambda: self.payment_service.generar_recibos_mes(mes, anio))
+
+    def generar_recibos_rango(self, mes_desde: int, anio_desde: int,
+                              mes_hasta: int, anio_hasta: int) -> Tuple[bool, str, Dict]:
+        if not self.es_admin():
+            return False, "Se requieren permisos de administrador", {'creados': 0, 'omitidos': 0, 'periodos': 0}
+        return self._escribir('recibos', lambda: self.payment_service.generar_recibos_rango(mes_desde, anio_desde, mes_hasta, anio_hasta))
 
     def obtener_mis_recibos(self) -> List[Dict]:
         usuario = self.obtener_usuario_actual()
         if not usuario:
             return []
-        return self.payment_service.obtener_mis_recibos(usuario)
+        return self.cache.get_or_load(
+            'recibos', ('cliente', usuario.get('id')),
+            lambda: self.payment_service.obtener_mis_recibos(usuario))
 
     def obtener_mis_recibos_pendientes(self) -> List[Dict]:
         """Obtiene los recibos pendientes del usuario actual."""
@@ -352,13 +491,35 @@ class GymController:
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_todos_recibos requiere admin")
             return []
-        return self.payment_service.obtener_todos_recibos()
+        return self.cache.get_or_load('recibos', 'todos', self.payment_service.obtener_todos_recibos)
+
+    def obtener_pagina_recibos(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_recibos requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'recibos', ('pagina', cursor, tamano),
+            lambda: self.payment_service.obtener_pagina_recibos(cursor, tamano))
 
     def obtener_estadisticas_financieras(self) -> Dict:
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_estadisticas_financieras requiere admin")
             return {}
-        return self.payment_service.obtener_estadisticas_financieras()
+        return self.cache.get_or_load(
+            'estadisticas', 'financieras', self.payment_service.obtener_estadisticas_financieras)
+
+    def obtener_resumen_mensual(self, anio: Optional[int] = None) -> List[Dict]:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_resumen_mensual requiere admin")
+            return []
+        return self.cache.get_or_load(
+            'recibos', ('resumen_mensual', anio),
+            lambda: self.payment_service.obtener_resumen_mensual(anio))
+
+    def reconstruir_resumen_financiero(self) -> Tuple[bool, str]:
+        if not self.es_admin():
+            return False, "Se requieren permisos de administrador"
+        return self._escribir('recibos', lambda: self.payment_service.reconstruir_resumen_financiero())
 
     def obtener_estadisticas_generales(self) -> Dict:
         """Obtiene estadísticas generales del gimnasio para el dashboard admin."""
@@ -366,77 +527,109 @@ class GymController:
             logger.warning("Acceso denegado: obtener_estadisticas_generales requiere admin")
             return {}
         
-        try:
-            clientes = self.obtener_clientes()
-            aparatos = self.obtener_aparatos()
-            todas_reservas = self.obtener_todas_reservas()
-            todos_recibos = self.obtener_todos_recibos()
-            
-            # Calcular estadísticas
-            total_clientes = len(clientes)
-            total_aparatos = len(aparatos)
-            total_reservas = len(todas_reservas)
-            total_recibos = len(todos_recibos)
-            
-            # Recibos por estado
-            recibos_pagados = len([r for r in todos_recibos if r.get('estado') == 'pagado'])
-            recibos_pendientes = len([r for r in todos_recibos if r.get('estado') == 'pendiente'])
-            
-            # Financiero
-            total_ingresos = sum(r.get('monto', 0) for r in todos_recibos if r.get('estado') == 'pagado')
-            deuda_total = sum(r.get('monto', 0) for r in todos_recibos if r.get('estado') == 'pendiente')
-            
-            # Clientes morosos
-            morosos = self.obtener_morosos()
-            total_morosos = len(morosos)
-            
-            return {
-                'total_clientes': total_clientes,
-                'total_aparatos': total_aparatos,
-                'total_reservas': total_reservas,
-                'total_recibos': total_recibos,
-                'recibos_pagados': recibos_pagados,
-                'recibos_pendientes': recibos_pendientes,
-                'total_morosos': total_morosos,
-                'total_ingresos': total_ingresos,
-                'deuda_total': deuda_total
-            }
-        except Exception as e:
-            logger.error(f"Error al obtener estadísticas generales: {e}")
-            return {}
+        estadisticas = self.cache.get_or_load(
+            'estadisticas', 'generales', self.statistics_service.obtener_estadisticas_generales)
+        return asdict(estadisticas) if estadisticas else {}
 
-    def obtener_morosos(self) -> List[Dict]:
+    def obtener_morosos(self, orden: str = 'deuda') -> List[Dict]:
         """Obtiene lista de clientes con recibos pendientes."""
         if not self.es_admin():
             logger.warning("Acceso denegado: obtener_morosos requiere admin")
             return []
-        
+        return self.cache.get_or_load(
+            'recibos', ('morosos', orden),
+            lambda: self.payment_service.obtener_morosos(orden))
+
+    def obtener_pagina_morosos(self, orden: str = 'deuda', cursor: Optional[str] = None,
+                               tamano: Optional[int] = None) -> Dict:
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_pagina_morosos requiere admin")
+            return {'items': [], 'siguiente': None}
+        return self.cache.get_or_load(
+            'recibos', ('pagina_morosos', orden, cursor, tamano),
+            lambda: self.payment_service.obtener_pagina_morosos(orden, cursor, tamano))
+
+    # Read cache
+    def _invalidar(self, entidad: str) -> None:
+        self.cache.invalidate(*self.CACHE_DEPENDENCIAS[entidad])
+
+    def _al_escribir(self, eventos: List) -> None:
+        """Suscriptor del bus: invalida la caché de las entidades escritas."""
+        entidades = {
+            entidad
+            for evento in eventos
+            for tipo_evento, entidad in self.EVENTOS_ENTIDAD.items()
+            if isinstance(evento, tipo_evento)
+        }
+        for entidad in entidades:
+            self._invalidar(entidad)
+
+    def _escribir(self, entidad: str, escritura: Callable[[], Any]) -> Any:
+        """Ejecuta una escritura propia y devuelve su resultado.
+
+        Antes se aplican los cambios pendientes de otros terminales
+        (``comprobar_cambios``); después la escritura se da por vista en el
+        monitor, para que no vuelva a invalidar la caché ni a reconstruir el
+        índice de disponibilidad. Así solo se da por visto lo que otra
+        conexión confirme mientras dura la propia escritura. La caché la
+        invalida ``_al_escribir`` con los eventos que publican los servicios.
+        """
+        self.change_monitor.poll()
         try:
-            clientes = self.obtener_clientes()
-            todos_recibos = self.obtener_todos_recibos()
-            
-            morosos = []
-            for cliente in clientes:
-                recibos_pendientes = [r for r in todos_recibos 
-                                     if r.get('id_cliente') == cliente['id'] and r.get('estado') == 'pendiente']
-                
-                if recibos_pendientes:
-                    deuda_total = sum(r.get('monto', 0) for r in recibos_pendientes)
-                    morosos.append({
-                        'id': cliente['id'],
-                        'nombre': cliente['nombre'],
-                        'apellido': cliente['apellido'],
-                        'dni': cliente['dni'],
-                        'telefono': cliente['telefono'],
-                        'email': cliente['email'],
-                        'recibos_pendientes': len(recibos_pendientes),
-                        'deuda_total': deuda_total
-                    })
-            
-            return morosos
-        except Exception as e:
-            logger.error(f"Error al obtener clientes morosos: {e}")
-            return []
+            return escritura()
+        finally:
+            self.change_monitor.acknowledge(self.TABLAS_ESCRITURA[entidad])
+
+    def obtener_estadisticas_cache(self) -> Dict[str, Dict[str, int]]:
+        """Aciertos, fallos, expulsiones e invalidaciones de la caché por espacio."""
+        return self.cache.stats()
+
+    def invalidar_cache(self) -> None:
+        """Descarta toda la caché de lectura (p. ej. tras cambios desde otro terminal)."""
+        self.cache.clear()
+
+    # SQL instrumentation
+    def obtener_estadisticas_sql(self, limite: Optional[int] = 20) -> Dict:
+        """Sentencias SQL más costosas y consultas lentas recientes (solo admin).
+
+        Returns:
+            Diccionario de ``Database.sql_snapshot`` ordenado por tiempo total
+        """
+        if not self.es_admin():
+            logger.warning("Acceso denegado: obtener_estadisticas_sql requiere admin")
+            return {}
+        return self.db.sql_snapshot(limit=limite)
+
+    def reiniciar_estadisticas_sql(self) -> None:
+        """Empieza de cero la medición de sentencias SQL (p. ej. antes de abrir una pantalla)."""
+        self.db.reset_sql_stats()
+
+    # Change detection
+    def comprobar_cambios(self) -> FrozenSet[str]:
+        """Comprueba si otra conexión ha modificado la base de datos.
+
+        Las escrituras de este controlador no cuentan: ``_escribir``
+        ya las ha aplicado. Sin cambios cuesta una lectura de
+        ``PRAGMA data_version``. Si los hay,
+        publica ``TablasModificadas`` en el bus de eventos, que invalida la
+        caché afectada antes de retornar.
+
+        Returns:
+            Tablas modificadas desde la comprobación anterior
+        """
+        return self.change_monitor.poll()
+
+    def _publicar_cambios(self, tablas: FrozenSet[str]) -> None:
+        self.event_bus.publish(TablasModificadas(tablas))
+
+    def _al_modificar_tablas(self, eventos: List[TablasModificadas]) -> None:
+        tablas = frozenset().union(*(evento.tablas for evento in eventos))
+        entidades = {self.TABLAS_ENTIDAD[t] for t in tablas if t in self.TABLAS_ENTIDAD}
+        for entidad in entidades:
+            self._invalidar(entidad)
+        if 'reservas' in tablas:
+            # Las aceptaciones de otro terminal no pasan por el índice local
+            self.reservation_service.reconstruir_indice_disponibilidad()
 
     # Utilities
     def generar_horarios_disponibles(self) -> List[str]:
@@ -0,0 +1,291 @@
+"""
+Bus de Eventos - Publicación de eventos de dominio dentro del proceso.
+Responsabilidad única: Desacoplar los efectos secundarios de las escrituras.
+
+Los servicios publican un evento tras cada escritura confirmada y los
+suscriptores (notificaciones, cachés, contadores, informes) reaccionan sin
+que el servicio los conozca. Los manejadores reciben siempre una lista de
+eventos: los síncronos, los publicados juntos en una misma llamada; los
+asíncronos, lotes acumulados en un hilo propio.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, List, Optional, Type
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Evento:
+    """Base de los eventos de dominio."""
+    ocurrido_en: float = field(default_factory=time.time, init=False, compare=False)
+
+
+# Reservas
+@dataclass(frozen=True)
+class EventoReserva(Evento):
+    """Base de los eventos de reservas."""
+
+
+@dataclass(frozen=True)
+class ReservaCreada(EventoReserva):
+    id_cliente: int
+    id_aparato: int
+    dia: str
+    hora_inicio: str
+
+
+@dataclass(frozen=True)
+class ReservaAceptada(EventoReserva):
+    id_reserva: int
+    id_cliente: int
+    id_aparato: int
+    aparato: str
+    dia: str
+    hora_inicio: str
+
+
+@dataclass(frozen=True)
+class ReservaRechazada(EventoReserva):
+    id_reserva: int
+    id_cliente: int
+    id_aparato: int
+    aparato: str
+    dia: str
+    hora_inicio: str
+
+
+@dataclass(frozen=True)
+class ReservaEliminada(EventoReserva):
+    id_reserva: int
+
+
+# Recibos
+@dataclass(frozen=True)
+class EventoRecibo(Evento):
+    """Base de los eventos de recibos."""
+
+
+@dataclass(frozen=True)
+class ReciboPagado(EventoRecibo):
+    id_recibo: int
+    id_cliente: int
+    mes: int
+    anio: int
+    monto: float
+
+
+@dataclass(frozen=True)
+class RecibosGenerados(EventoRecibo):
+    creados: int
+    omitidos: int
+    periodos: int
+
+
+@dataclass(frozen=True)
+class ReciboCreado(EventoRecibo):
+    id_recibo: int
+    id_cliente: int
+    mes: int
+    anio: int
+    monto: float
+
+
+@dataclass(frozen=True)
+class ResumenFinancieroReconstruido(EventoRecibo):
+    meses: int
+
+
+# Clientes
+@dataclass(frozen=True)
+class EventoCliente(Evento):
+    """Base de los eventos de clientes."""
+
+
+@dataclass(frozen=True)
+class ClienteCreado(EventoCliente):
+    dni: str
+    nombre: str
+    apellido: str
+    tipo: str
+
+
+# Aparatos
+@dataclass(frozen=True)
+class EventoAparato(Evento):
+    """Base de los eventos de aparatos."""
+
+
+@dataclass(frozen=True)
+class AparatoCreado(EventoAparato):
+    id_aparato: int
+    nombre: str
+    tipo: str
+
+
+@dataclass(frozen=True)
+class AparatoEliminado(EventoAparato):
+    id_aparato: int
+
+
+# Base de datos
+@dataclass(frozen=True)
+class TablasModificadas(Evento):
+    """Tablas cambiadas por otra conexión, detectadas por el monitor de cambios."""
+    tablas: FrozenSet[str]
+
+
+Handler = Callable[[List[Evento]], None]
+
+
+class _AsyncSubscription:
+    """Entrega eventos en lotes desde un hilo propio."""
+
+    def __init__(self, event_type: Type[Evento], handler: Handler,
+                 batch_size: int, max_delay: float):
+        self.event_type = event_type
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.queue: 'queue.Queue[Optional[Evento]]' = queue.Queue()
+        self.thread = threading.Thread(
+            target=self._run, name=f"eventos-{event_type.__name__}", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        activo = True
+        while activo:
+            evento = self.queue.get()
+            if evento is None:
+                self.queue.task_done()
+                break
+            lote = [evento]
+            limite = time.monotonic() + self.max_delay
+            while len(lote) < self.batch_size:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    siguiente = self.queue.get(timeout=restante)
+                except queue.Empty:
+                    break
+                if siguiente is None:
+                    activo = False
+                    break
+                lote.append(siguiente)
+
+            try:
+                self.handler(lote)
+            except Exception as e:
+                logger.error(f"Error en suscriptor asíncrono de {self.event_type.__name__}: {e}")
+            finally:
+                for _ in range(len(lote) + (0 if activo else 1)):
+                    self.queue.task_done()
+
+    def stop(self) -> None:
+        self.queue.put(None)
+
+
+class EventBus:
+    """Bus de eventos tipado con suscriptores síncronos y asíncronos.
+
+    Un suscriptor a una clase de evento recibe también sus subclases (por
+    ejemplo, ``EventoReserva`` recibe ``ReservaAceptada``). Los errores de
+    un manejador se registran y no afectan al publicador ni al resto de
+    suscriptores.
+    """
+
+    def __init__(self):
+        """Inicializa un bus sin suscriptores."""
+        self._sync: List[tuple] = []
+        self._async: List[_AsyncSubscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: Type[Evento], handler: Handler) -> Callable[[], None]:
+        """Registra un manejador que se ejecuta en el hilo del publicador.
+
+        Returns:
+            Función que cancela la suscripción
+        """
+        suscripcion = (event_type, handler)
+        with self._lock:
+            self._sync.append(suscripcion)
+
+        def cancelar() -> None:
+            with self._lock:
+                if suscripcion in self._sync:
+                    self._sync.remove(suscripcion)
+        return cancelar
+
+    def subscribe_async(self, event_type: Type[Evento], handler: Handler,
+                        batch_size: int = 100, max_delay: float = 0.2) -> Callable[[], None]:
+        """Registra un manejador que recibe lotes en un hilo propio.
+
+        Args:
+            event_type: Clase de evento (incluye subclases)
+            handler: Función que recibe la lista de eventos del lote
+            batch_size: Eventos como máximo por lote
+            max_delay: Segundos que se espera a completar un lote
+
+        Returns:
+            Función que cancela la suscripción (tras entregar lo pendiente)
+        """
+        suscripcion = _AsyncSubscription(event_type, handler, batch_size, max_delay)
+        with self._lock:
+            self._async.append(suscripcion)
+
+        def cancelar() -> None:
+            with self._lock:
+                if suscripcion not in self._async:
+                    return
+                self._async.remove(suscripcion)
+            suscripcion.stop()
+        return cancelar
+
+    def publish(self, *eventos: Evento) -> None:
+        """Publica uno o varios eventos.
+
+        Los suscriptores síncronos reciben, en una sola llamada, los eventos
+        de esta publicación que les corresponden; los asíncronos los reciben
+        en su siguiente lote.
+        """
+        if not eventos:
+            return
+        with self._lock:
+            sincronos = list(self._sync)
+            asincronos = list(self._async)
+
+        for event_type, handler in sincronos:
+            lote = [e for e in eventos if isinstance(e, event_type)]
+            if not lote:
+                continue
+            try:
+                handler(lote)
+            except Exception as e:
+                logger.error(f"Error en suscriptor de {event_type.__name__}: {e}")
+
+        for suscripcion in asincronos:
+            for evento in eventos:
+                if isinstance(evento, suscripcion.event_type):
+                    suscripcion.queue.put(evento)
+
+    def flush(self) -> None:
+        """Espera a que los suscriptores asíncronos procesen lo publicado."""
+        with self._lock:
+            asincronos = list(self._async)
+        for suscripcion in asincronos:
+            suscripcion.queue.join()
+
+    def close(self) -> None:
+        """Entrega lo pendiente y detiene los hilos de los suscriptores asíncronos."""
+        with self._lock:
+            asincronos, self._async = self._async, []
+        for suscripcion in asincronos:
+            suscripcion.stop()
+        for suscripcion in asincronos:
+            suscripcion.thread.join()
@@ -3,13 +3,16 @@
 Use `from core.models import Cliente, Reserva, ...` as before.
 """
 
-from .database import Database
+from .database import Database, ConnectionPool, PerformanceProfile, PERFORMANCE_PROFILES
 from .cliente import Cliente
 from .aparato import Aparato
 from .reserva import Reserva
 from .recibo import Recibo
 from .notificacion import Notificacion
+from .estadisticas import Estadisticas
+from .change_monitor import ChangeMonitor
+from .instrumentation import SQLStats
 
 __all__ = [
-    'Database', 'Cliente', 'Aparato', 'Reserva', 'Recibo', 'Notificacion'
+    'Database', 'ConnectionPool', 'PerformanceProfile', 'PERFORMANCE_PROFILES', 'Cliente', 'Aparato', 'Reserva', 'Recibo', 'Notificacion', 'Estadisticas', 'ChangeMonitor', 'SQLStats'
 ]
@@ -17,15 +17,13 @@ class Aparato:
 
     def crear_aparato(self, nombre: str, tipo: str, descripcion: str = "") -> int:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           INSERT INTO aparatos (nombre, tipo, descripcion)
-                           VALUES (?, ?, ?)
-                           ''', (nombre, tipo, descripcion))
-            id_aparato = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               INSERT INTO aparatos (nombre, tipo, descripcion)
+                               VALUES (?, ?, ?)
+                               ''', (nombre, tipo, descripcion))
+                id_aparato = cursor.lastrowid
             logger.info(f"Aparato creado: {nombre} (ID: {id_aparato})")
             return id_aparato
         except Exception as e:
@@ -34,22 +32,21 @@ class Aparato:
 
     def obtener_todos(self) -> List[Dict]:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           SELECT id_aparato, nombre, tipo, descripcion 
-                           FROM aparatos 
-                           ORDER BY tipo, nombre
-                           ''')
-            aparatos = []
-            for row in cursor.fetchall():
-                aparatos.append({
-                    'id': row[0],
-                    'nombre': row[1],
-                    'tipo': row[2],
-                    'descripcion': row[3]
-                })
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               SELECT id_aparato, nombre, tipo, descripcion 
+                               FROM aparatos 
+                               ORDER BY tipo, nombre
+                               ''')
+                aparatos = []
+                for row in cursor.fetchall():
+                    aparatos.append({
+                        'id': row[0],
+                        'nombre': row[1],
+                        'tipo': row[2],
+                        'descripcion': row[3]
+                    })
             return aparatos
         except Exception as e:
             logger.error(f"Error al obtener aparatos: {e}")
@@ -57,15 +54,14 @@ class Aparato:
 
     def obtener_por_id(self, id_aparato: int) -> Optional[Dict]:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           SELECT id_aparato, nombre, tipo, descripcion 
-                           FROM aparatos 
-                           WHERE id_aparato = ?
-                           ''', (id_aparato,))
-            result = cursor.fetchone()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               SELECT id_aparato, nombre, tipo, descripcion 
+                               FROM aparatos 
+                               WHERE id_aparato = ?
+                               ''', (id_aparato,))
+                result = cursor.fetchone()
 
             if result:
                 return {
@@ -81,11 +77,9 @@ class Aparato:
 
     def eliminar_aparato(self, id_aparato: int) -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM aparatos WHERE id_aparato = ?', (id_aparato,))
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM aparatos WHERE id_aparato = ?', (id_aparato,))
             logger.info(f"Aparato eliminado: ID {id_aparato}")
             return True
         except Exception as e:
@@ -0,0 +1,143 @@
+"""Detección de cambios hechos por otras conexiones o procesos.
+
+``PRAGMA data_version`` devuelve un número que cambia cuando otra conexión
+confirma una escritura en el archivo; leerlo no toca ninguna tabla. Solo
+cuando cambia se consulta ``cambios_tablas`` (una fila por tabla, mantenida
+por triggers) para saber qué tablas se modificaron.
+
+``data_version`` es propio de cada conexión y no refleja las escrituras de
+esa misma conexión, por eso el monitor usa una conexión dedicada y nunca
+escribe con ella: así detecta tanto a otros terminales como al propio
+proceso. Quien ya ha aplicado sus propias escrituras (caché, índices) las
+da por vistas con ``acknowledge`` para que ``poll`` solo notifique las
+ajenas.
+"""
+
+import sqlite3
+import threading
+from typing import Callable, Dict, FrozenSet, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+OnChange = Callable[[FrozenSet[str]], None]
+
+
+class ChangeMonitor:
+    """Sondeo ligero de ``data_version`` y de los contadores por tabla."""
+
+    def __init__(self, db_name: str, on_change: Optional[OnChange] = None,
+                 interval: float = 1.0, timeout: float = 10.0,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        """Inicializa el monitor y toma las versiones actuales como referencia.
+
+        Args:
+            db_name: Archivo de base de datos a vigilar
+            on_change: Recibe el conjunto de tablas cambiadas en cada sondeo
+                que detecta cambios
+            interval: Segundos entre sondeos del hilo de ``start()``
+            timeout: Espera máxima si la base de datos está bloqueada
+            on_connect: Configuración de la conexión dedicada (PRAGMAs)
+        """
+        self.db_name = db_name
+        self.on_change = on_change
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_name, timeout=timeout, check_same_thread=False)
+        if on_connect is not None:
+            on_connect(self._conn)
+        self._data_version = self._leer_data_version()
+        self._versiones = self._leer_versiones()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def _leer_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _leer_versiones(self) -> Dict[str, int]:
+        return dict(self._conn.execute("SELECT tabla, version FROM cambios_tablas"))
+
+    def versions(self) -> Dict[str, int]:
+        """Últimos contadores de cambios leídos, por tabla."""
+        with self._lock:
+            return dict(self._versiones)
+
+    def poll(self) -> FrozenSet[str]:
+        """Comprueba una vez si hubo cambios.
+
+        Cuesta una lectura de ``data_version`` si nada cambió. Si hay tablas
+        cambiadas, se notifican a ``on_change`` antes de retornar.
+
+        Returns:
+            Tablas modificadas desde el sondeo anterior
+        """
+        return self._comprobar(frozenset())
+
+    def acknowledge(self, tablas: FrozenSet[str]) -> FrozenSet[str]:
+        """Da por vistos los cambios en ``tablas`` hechos por el propio proceso.
+
+        Se llama justo después de una escritura propia cuyos efectos ya se
+        aplicaron localmente. Los cambios en otras tablas (p. ej. borrados
+        en cascada) se notifican como en ``poll``. Un cambio de otra conexión
+        en una de ``tablas`` desde el último sondeo también se da por visto,
+        así que hay que sondear justo antes de escribir (como hace
+        ``GymController._escribir``).
+
+        Returns:
+            Tablas modificadas notificadas (sin las de ``tablas``)
+        """
+        return self._comprobar(frozenset(tablas))
+
+    def _comprobar(self, propias: FrozenSet[str]) -> FrozenSet[str]:
+        with self._lock:
+            if self._conn is None:
+                return frozenset()
+            try:
+                data_version = self._leer_data_version()
+                if data_version == self._data_version:
+                    return frozenset()
+                versiones = self._leer_versiones()
+            except sqlite3.Error as e:
+                logger.warning(f"No se pudo comprobar cambios en {self.db_name}: {e}")
+                return frozenset()
+
+            cambiadas = frozenset(
+                tabla for tabla, version in versiones.items()
+                if self._versiones.get(tabla) != version and tabla not in propias
+            )
+            self._data_version = data_version
+            self._versiones = versiones
+
+        if cambiadas and self.on_change is not None:
+            try:
+                self.on_change(cambiadas)
+            except Exception as e:
+                logger.error(f"Error al notificar cambios en {', '.join(sorted(cambiadas))}: {e}")
+        return cambiadas
+
+    def start(self) -> None:
+        """Sondea en un hilo propio cada ``interval`` segundos."""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._run, name="monitor-cambios", daemon=True)
+        self._hilo.start()
+
+    def _run(self) -> None:
+        while not self._detener.wait(self.interval):
+            self.poll()
+
+    def stop(self) -> None:
+        """Detiene el hilo de sondeo, si está en marcha."""
+        self._detener.set()
+        if self._hilo is not None and self._hilo is not threading.current_thread():
+            self._hilo.join()
+        self._hilo = None
+
+    def close(self) -> None:
+        """Detiene el sondeo y cierra la conexión dedicada."""
+        self.stop()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -2,6 +2,8 @@ import sqlite3
 from typing import List, Dict, Optional
 import logging
 
+from .pagination import build_page, decode_cursor, page_size
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,14 +20,12 @@ class Cliente:
     def crear_cliente(self, nombre: str, apellido: str, dni: str, telefono: str,
                       email: str, password: str, tipo_usuario: str = 'cliente') -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           INSERT INTO clientes (nombre, apellido, dni, telefono, email, tipo_usuario, password)
-                           VALUES (?, ?, ?, ?, ?, ?, ?)
-                           ''', (nombre, apellido, dni, telefono, email, tipo_usuario, password))
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               INSERT INTO clientes (nombre, apellido, dni, telefono, email, tipo_usuario, password)
+                               VALUES (?, ?, ?, ?, ?, ?, ?)
+                               ''', (nombre, apellido, dni, telefono, email, tipo_usuario, password))
             logger.info(f"Cliente creado: {dni} ({tipo_usuario})")
             return True
         except sqlite3.IntegrityError as e:
@@ -37,28 +37,25 @@ class Cliente:
 
     def dni_existe(self, dni: str) -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM clientes WHERE dni = ?', (dni,))
-            existe = cursor.fetchone()[0] > 0
-            conn.close()
-            return existe
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM clientes WHERE dni = ?', (dni,))
+                return cursor.fetchone()[0] > 0
         except Exception as e:
             logger.error(f"Error al verificar DNI: {e}")
             return False
 
     def autenticar(self, dni: str, password: str) -> Optional[Dict]:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           SELECT id_cliente, nombre, apellido, dni, tipo_usuario
-                           FROM clientes
-                           WHERE dni = ?
-                             AND password = ?
-                           ''', (dni, password))
-            result = cursor.fetchone()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               SELECT id_cliente, nombre, apellido, dni, tipo_usuario
+                               FROM clientes
+                               WHERE dni = ?
+                                 AND password = ?
+                               ''', (dni, password))
+                result = cursor.fetchone()
 
             if result:
                 logger.info(f"Autenticación exitosa: {dni}")
@@ -76,51 +73,79 @@ class Cliente:
             logger.error(f"Error en autenticación: {e}")
             return None
 
+    _SQL_TODOS = '''
+                 SELECT id_cliente,
+                        nombre,
+                        apellido,
+                        dni,
+                        telefono,
+                        email,
+                        tipo_usuario,
+                        fecha_registro
+                 FROM clientes
+                 {where}
+                 ORDER BY apellido, nombre, id_cliente
+                 '''
+
+    @staticmethod
+    def _fila_cliente(row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'nombre': row[1],
+            'apellido': row[2],
+            'dni': row[3],
+            'telefono': row[4],
+            'email': row[5],
+            'tipo': row[6],
+            'fecha_registro': row[7]
+        }
+
     def obtener_todos(self) -> List[Dict]:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           SELECT id_cliente,
-                                  nombre,
-                                  apellido,
-                                  dni,
-                                  telefono,
-                                  email,
-                                  tipo_usuario,
-                                  fecha_registro
-                           FROM clientes
-                           ORDER BY apellido, nombre
-                           ''')
-            clientes = []
-            for row in cursor.fetchall():
-                clientes.append({
-                    'id': row[0],
-                    'nombre': row[1],
-                    'apellido': row[2],
-                    'dni': row[3],
-                    'telefono': row[4],
-                    'email': row[5],
-                    'tipo': row[6],
-                    'fecha_registro': row[7]
-                })
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(self._SQL_TODOS.format(where=''))
+                clientes = [self._fila_cliente(row) for row in cursor.fetchall()]
             return clientes
         except Exception as e:
             logger.error(f"Error al obtener clientes: {e}")
             return []
 
+    def obtener_pagina(self, cursor_pagina: Optional[str] = None,
+                       tamano: Optional[int] = None) -> Dict:
+        """Página de ``obtener_todos`` paginada por clave.
+
+        Recorre ``idx_clientes_apellido_nombre`` a partir de la clave
+        (apellido, nombre, id_cliente) de la última fila entregada.
+
+        Returns:
+            Diccionario con 'items' y 'siguiente'
+
+        Raises:
+            ValueError: Si el cursor es inválido
+        """
+        tamano = page_size(tamano)
+        where, params = '', []
+        if cursor_pagina:
+            where = 'WHERE (apellido, nombre, id_cliente) > (?, ?, ?)'
+            params = decode_cursor(cursor_pagina, 3)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_TODOS.format(where=where) + ' LIMIT ?', (*params, tamano + 1))
+            filas = cursor.fetchall()
+        return build_page(filas, tamano, lambda row: (row[2], row[1], row[0]), self._fila_cliente)
+
     def obtener_por_id(self, id_cliente: int) -> Optional[Dict]:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           SELECT id_cliente, nombre, apellido, dni, telefono, email, tipo_usuario
-                           FROM clientes
-                           WHERE id_cliente = ?
-                           ''', (id_cliente,))
-            result = cursor.fetchone()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               SELECT id_cliente, nombre, apellido, dni, telefono, email, tipo_usuario
+                               FROM clientes
+                               WHERE id_cliente = ?
+                               ''', (id_cliente,))
+                result = cursor.fetchone()
 
             if result:
                 return {
@@ -1,366 +1,510 @@
 import sqlite3
-from typing import Optional
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Optional, Iterator, Callable, Dict, List, Type, Union
 import logging
 
+from infrastructure.exceptions import DatabaseError
+from .indexes import INDEXES, ensure_indexes, verify_indexes, find_full_scans
+from .migrations import MIGRATIONS, migrate, get_version, rebuild_financial_summary
+from .change_monitor import ChangeMonitor, OnChange
+from .instrumentation import InstrumentedConnection, SQLStats
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """Perfil de PRAGMAs de SQLite aplicado a cada conexión del pool.
+
+    Attributes:
+        name: Nombre del perfil
+        journal_mode: Modo de journal ('DELETE', 'TRUNCATE', 'PERSIST', 'WAL')
+        synchronous: Nivel de sincronización ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+        cache_size: Tamaño de caché (páginas si es positivo, KiB si es negativo)
+        mmap_size: Bytes de E/S mapeada en memoria (0 la desactiva)
+        temp_store: Almacenamiento temporal ('DEFAULT', 'FILE', 'MEMORY')
+        busy_timeout: Milisegundos de espera ante un bloqueo
+    """
+    name: str
+    journal_mode: str = 'DELETE'
+    synchronous: str = 'FULL'
+    cache_size: int = -2000
+    mmap_size: int = 0
+    temp_store: str = 'DEFAULT'
+    busy_timeout: int = 5000
+
+    JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'WAL')
+    SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+    TEMP_STORES = ('DEFAULT', 'FILE', 'MEMORY')
+
+    def __post_init__(self):
+        # Los valores se interpolan en PRAGMAs, así que se validan aquí
+        if self.journal_mode.upper() not in self.JOURNAL_MODES:
+            raise ValueError(f"journal_mode inválido: {self.journal_mode}")
+        if self.synchronous.upper() not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronous inválido: {self.synchronous}")
+        if self.temp_store.upper() not in self.TEMP_STORES:
+            raise ValueError(f"temp_store inválido: {self.temp_store}")
+        for campo in ('cache_size', 'mmap_size', 'busy_timeout'):
+            if not isinstance(getattr(self, campo), int):
+                raise ValueError(f"{campo} debe ser un entero")
+        if self.mmap_size < 0 or self.busy_timeout < 0:
+            raise ValueError("mmap_size y busy_timeout no pueden ser negativos")
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        """Aplica el perfil a una conexión recién abierta."""
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode.upper()}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous.upper()}")
+        conn.execute(f"PRAGMA cache_size = {self.cache_size}")
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store.upper()}")
+
+
+# Perfiles predefinidos. 'balanced' (WAL + synchronous NORMAL) permite que los
+# lectores del panel de administración no se bloqueen con las escrituras de
+# recepción; 'durable' mantiene WAL pero sincroniza en cada commit;
+# 'compatible' reproduce el comportamiento por defecto de SQLite.
+PERFORMANCE_PROFILES: Dict[str, PerformanceProfile] = {
+    'compatible': PerformanceProfile(name='compatible'),
+    'balanced': PerformanceProfile(
+        name='balanced',
+        journal_mode='WAL',
+        synchronous='NORMAL',
+        cache_size=-16000,
+        mmap_size=128 * 1024 * 1024,
+        temp_store='MEMORY',
+        busy_timeout=5000,
+    ),
+    'durable': PerformanceProfile(
+        name='durable',
+        journal_mode='WAL',
+        synchronous='FULL',
+        cache_size=-16000,
+        mmap_size=0,
+        temp_store='MEMORY',
+        busy_timeout=10000,
+    ),
+}
+
+
+def resolve_profile(profile: Union[str, PerformanceProfile]) -> PerformanceProfile:
+    """Devuelve el perfil indicado por nombre o instancia.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún perfil registrado
+    """
+    if isinstance(profile, PerformanceProfile):
+        return profile
+    try:
+        return PERFORMANCE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Perfil desconocido: {profile}. Disponibles: {', '.join(PERFORMANCE_PROFILES)}"
+        )
+
+
+class ConnectionPool:
+    """Pool de conexiones SQLite reutilizables.
+
+    Mantiene abiertas hasta ``size`` conexiones y las presta por hilo: las
+    llamadas anidadas desde un mismo hilo reutilizan la conexión que ese hilo
+    ya tiene prestada, de modo que un método de modelo que llama a otro
+    comparte conexión y transacción.
+    """
+
+    def __init__(self, db_name: str, size: int = 5, timeout: float = 10.0,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+                 factory: Type[sqlite3.Connection] = sqlite3.Connection):
+        """Inicializa el pool (las conexiones se crean bajo demanda).
+
+        Args:
+            db_name: Nombre del archivo de base de datos
+            size: Número máximo de conexiones abiertas
+            timeout: Segundos a esperar por una conexión libre
+            on_connect: Función que configura cada conexión nueva
+            factory: Clase de las conexiones (p. ej. ``InstrumentedConnection``)
+        """
+        if size < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+        self.db_name = db_name
+        self.size = size
+        self.timeout = timeout
+        self.on_connect = on_connect
+        self.factory = factory
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre una conexión nueva configurada para el pool."""
+        conn = sqlite3.connect(self.db_name, timeout=self.timeout, check_same_thread=False,
+                               factory=self.factory)
+        conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
+        if self.on_connect is not None:
+            try:
+                self.on_connect(conn)
+            except Exception:
+                conn.close()
+                raise
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Comprueba que una conexión ociosa sigue siendo utilizable."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Cierra una conexión y libera su plaza en el pool."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Obtiene una conexión sana del pool, creándola si hay plaza."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        return self._connect()
+                    except sqlite3.Error as e:
+                        with self._lock:
+                            self._created -= 1
+                        raise DatabaseError(f"No se pudo abrir la base de datos: {e}") from e
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise DatabaseError(
+                        f"No hay conexiones libres tras {self.timeout}s (pool de {self.size})"
+                    )
+
+            if self._is_healthy(conn):
+                return conn
+            logger.warning("Descartando conexión SQLite no válida del pool")
+            self._discard(conn)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Presta una conexión al hilo actual.
+
+        Si el hilo ya tiene una conexión prestada se devuelve la misma.
+        Cada ``acquire`` debe emparejarse con un ``release``.
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is not None:
+            local.depth += 1
+            return conn
+
+        conn = self._checkout()
+        local.conn = conn
+        local.depth = 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Devuelve la conexión al pool cuando se libera el último préstamo del hilo."""
+        local = self._local
+        if getattr(local, 'conn', None) is not conn:
+            raise DatabaseError("La conexión no pertenece al hilo actual")
+
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        local.conn = None
+
+        try:
+            if conn.in_transaction:
+                conn.rollback()  # Descartar cambios no confirmados, igual que close()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        self._idle.put_nowait(conn)
+
+    @property
+    def in_use(self) -> bool:
+        """Indica si el hilo actual tiene una conexión prestada."""
+        return getattr(self._local, 'conn', None) is not None
+
+    @contextmanager
+    def connection(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Context manager que presta una conexión y gestiona la transacción.
+
+        El bloque más externo del hilo confirma al salir sin errores y
+        revierte si se produce una excepción; los bloques anidados
+        participan en la misma transacción.
+
+        Args:
+            immediate: Abrir la transacción con BEGIN IMMEDIATE, tomando el
+                bloqueo de escritura antes de la primera lectura
+        """
+        outermost = not self.in_use
+        conn = self.acquire()
+        try:
+            if immediate and outermost and not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            if outermost:
+                conn.commit()
+        except BaseException:
+            if outermost:
+                conn.rollback()
+            raise
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Cierra todas las conexiones ociosas del pool."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+class PooledConnection:
+    """Envoltorio de una conexión prestada cuyo ``close()`` la devuelve al pool.
+
+    Permite que el código que usa ``get_connection()``/``close()`` siga
+    funcionando sin abrir una conexión SQLite nueva en cada llamada.
+    """
+
+    def __init__(self, pool: ConnectionPool):
+        self._pool = pool
+        self._conn: Optional[sqlite3.Connection] = pool.acquire()
+
+    def close(self) -> None:
+        """Devuelve la conexión al pool (idempotente)."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
 class Database:
     """Clase para gestionar la conexión y la inicialización de la base de datos.
     
-    Responsable de crear las tablas necesarias y mantener la conexión
-    con SQLite.
+    Responsable de crear las tablas necesarias y mantener el pool de
+    conexiones con SQLite.
     """
 
-    def __init__(self, db_name: str = "gimnasio.db"):
-        """Inicializa la conexión a la base de datos.
+    def __init__(self, db_name: str = "gimnasio.db", pool_size: int = 5,
+                 timeout: float = 10.0,
+                 profile: Union[str, PerformanceProfile] = 'balanced',
+                 instrument: bool = True, slow_query_ms: Optional[float] = 250.0):
+        """Inicializa el pool de conexiones y la base de datos.
         
         Args:
             db_name: Nombre del archivo de base de datos
+            pool_size: Número máximo de conexiones reutilizables
+            timeout: Segundos de espera por una conexión libre
+            profile: Perfil de rendimiento (nombre en PERFORMANCE_PROFILES o instancia)
+            instrument: Si se registran tiempos y filas de cada sentencia SQL
+            slow_query_ms: Umbral del registro de consultas lentas (None lo desactiva)
         """
         self.db_name = db_name
+        self.profile = resolve_profile(profile)
+        self.sql_stats: Optional[SQLStats] = SQLStats(slow_query_ms) if instrument else None
+        self.pool = ConnectionPool(db_name, size=pool_size, timeout=timeout,
+                                   on_connect=self._configure_connection,
+                                   factory=InstrumentedConnection if instrument else sqlite3.Connection)
         self.initialize_database()
         logger.info(f"Base de datos inicializada: {db_name}")
 
-    def get_connection(self) -> sqlite3.Connection:
-        """Obtiene una conexión a la base de datos.
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Configura cada conexión nueva del pool."""
+        if isinstance(conn, InstrumentedConnection):
+            conn.stats = self.sql_stats
+        self.profile.apply(conn)
+
+    def get_connection(self) -> PooledConnection:
+        """Obtiene una conexión del pool.
+
+        La conexión se devuelve al pool al llamar a ``close()``. Para código
+        nuevo es preferible ``connection()``, que además gestiona la transacción.
         
         Returns:
-            Conexión a SQLite
+            Conexión a SQLite prestada por el pool
         """
-        conn = sqlite3.connect(self.db_name)
-        conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
-        return conn
+        return PooledConnection(self.pool)
 
-    def initialize_database(self):
-        """Crea las tablas si no existen"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Tabla Clientes
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS clientes
-                       (
-                           id_cliente
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           nombre
-                           TEXT
-                           NOT
-                           NULL,
-                           apellido
-                           TEXT
-                           NOT
-                           NULL,
-                           dni
-                           TEXT
-                           UNIQUE
-                           NOT
-                           NULL,
-                           telefono
-                           TEXT,
-                           email
-                           TEXT,
-                           tipo_usuario
-                           TEXT
-                           NOT
-                           NULL
-                           CHECK (
-                           tipo_usuario
-                           IN
-                       (
-                           'cliente',
-                           'admin'
-                       )),
-                           password TEXT NOT NULL,
-                           fecha_registro DATE DEFAULT CURRENT_DATE
-                           )
-                       ''')
-
-        # Tabla Aparatos
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS aparatos
-                       (
-                           id_aparato
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           nombre
-                           TEXT
-                           NOT
-                           NULL,
-                           tipo
-                           TEXT
-                           NOT
-                           NULL,
-                           descripcion
-                           TEXT
-                       )
-                       ''')
-
-        # Tabla Reservas
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS reservas
-                       (
-                           id_reserva
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           id_cliente
-                           INTEGER
-                           NOT
-                           NULL,
-                           id_aparato
-                           INTEGER
-                           NOT
-                           NULL,
-                           dia_semana
-                           TEXT
-                           NOT
-                           NULL
-                           CHECK (
-                           dia_semana
-                           IN
-                       (
-                           'Lunes',
-                           'Martes',
-                           'Miércoles',
-                           'Jueves',
-                           'Viernes'
-                       )),
-                           hora_inicio TEXT NOT NULL,
-                           hora_fin TEXT NOT NULL,
-                           fecha_reserva DATE DEFAULT CURRENT_DATE,
-                           estado TEXT NOT NULL DEFAULT 'pendiente' CHECK (estado IN ('pendiente', 'aceptada', 'rechazada')),
-                           FOREIGN KEY
-                       (
-                           id_cliente
-                       ) REFERENCES clientes
-                       (
-                           id_cliente
-                       ) ON DELETE CASCADE,
-                           FOREIGN KEY
-                       (
-                           id_aparato
-                       ) REFERENCES aparatos
-                       (
-                           id_aparato
-                       )
-                         ON DELETE CASCADE
-                           )
-                       ''')
-
-        # Tabla Recibos
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS recibos
-                       (
-                           id_recibo
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           id_cliente
-                           INTEGER
-                           NOT
-                           NULL,
-                           mes
-                           INTEGER
-                           NOT
-                           NULL,
-                           anio
-                           INTEGER
-                           NOT
-                           NULL,
-                           monto
-                           REAL
-                           NOT
-                           NULL
-                           DEFAULT
-                           50.0,
-                           fecha_emision
-                           DATE
-                           DEFAULT
-                           CURRENT_DATE,
-                           estado
-                           TEXT
-                           NOT
-                           NULL
-                           DEFAULT
-                           'pendiente'
-                           CHECK (
-                           estado
-                           IN
-                       (
-                           'pendiente',
-                           'pagado'
-                       )),
-                           FOREIGN KEY
-                       (
-                           id_cliente
-                       ) REFERENCES clientes
-                       (
-                           id_cliente
-                       ) ON DELETE CASCADE,
-                           UNIQUE
-                       (
-                           id_cliente,
-                           mes,
-                           anio
-                       )
-                           )
-                       ''')
-
-        # Tabla Pagos
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS pagos
-                       (
-                           id_pago
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           id_recibo
-                           INTEGER
-                           NOT
-                           NULL,
-                           fecha_pago
-                           DATE
-                           DEFAULT
-                           CURRENT_DATE,
-                           monto
-                           REAL
-                           NOT
-                           NULL,
-                           metodo_pago
-                           TEXT,
-                           FOREIGN
-                           KEY
-                       (
-                           id_recibo
-                       ) REFERENCES recibos
-                       (
-                           id_recibo
-                       ) ON DELETE CASCADE
-                           )
-                       ''')
-
-        # Tabla Notificaciones
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS notificaciones
-                       (
-                           id_notificacion
-                           INTEGER
-                           PRIMARY
-                           KEY
-                           AUTOINCREMENT,
-                           id_cliente
-                           INTEGER
-                           NOT
-                           NULL,
-                           id_reserva
-                           INTEGER,
-                           tipo
-                           TEXT
-                           NOT
-                           NULL
-                           CHECK (
-                           tipo
-                           IN
-                       (
-                           'aceptada',
-                           'rechazada'
-                       )),
-                           mensaje
-                           TEXT
-                           NOT
-                           NULL,
-                           leida
-                           BOOLEAN
-                           DEFAULT
-                           0,
-                           fecha_creacion
-                           DATETIME
-                           DEFAULT
-                           CURRENT_TIMESTAMP,
-                           FOREIGN KEY
-                       (
-                           id_cliente
-                       ) REFERENCES clientes
-                       (
-                           id_cliente
-                       ) ON DELETE CASCADE,
-                           FOREIGN KEY
-                       (
-                           id_reserva
-                       ) REFERENCES reservas
-                       (
-                           id_reserva
-                       ) ON DELETE CASCADE
-                           )
-                       ''')
-
-        conn.commit()
-
-        # Crear usuario admin por defecto si no existe
-        cursor.execute("SELECT COUNT(*) FROM clientes WHERE tipo_usuario = 'admin'")
-        if cursor.fetchone()[0] == 0:
-            cursor.execute('''
-                           INSERT INTO clientes (nombre, apellido, dni, telefono, email, tipo_usuario, password)
-                           VALUES ('Admin', 'Sistema', 'admin123', '000000000', 'admin@gym.com', 'admin', 'admin123')
-                           ''')
-            conn.commit()
-
-        conn.close()
-        
-        # Ejecutar migraciones
-        self._execute_migrations()
+    def connection(self):
+        """Context manager con una conexión del pool y su transacción.
 
-    def _execute_migrations(self):
-        """Ejecuta migraciones necesarias para actualizar la base de datos existente"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # Migración 1: Agregar columna 'estado' a la tabla reservas si no existe
-            cursor.execute("PRAGMA table_info(reservas)")
-            columns = [row[1] for row in cursor.fetchall()]
-            
-            if 'estado' not in columns:
-                logger.info("Agregando columna 'estado' a tabla reservas...")
-                cursor.execute('''
-                    ALTER TABLE reservas 
-                    ADD COLUMN estado TEXT NOT NULL DEFAULT 'pendiente' 
-                    CHECK (estado IN ('pendiente', 'aceptada', 'rechazada'))
-                ''')
-                conn.commit()
-                logger.info("Columna 'estado' agregada exitosamente")
-            
-            # Migración 2: Verificar que existe la tabla notificaciones
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='notificaciones'")
-            if not cursor.fetchone():
-                logger.info("Creando tabla notificaciones...")
-                cursor.execute('''
-                    CREATE TABLE notificaciones
-                    (
-                        id_notificacion INTEGER PRIMARY KEY AUTOINCREMENT,
-                        id_cliente INTEGER NOT NULL,
-                        id_reserva INTEGER,
-                        tipo TEXT NOT NULL CHECK (tipo IN ('aceptada', 'rechazada')),
-                        mensaje TEXT NOT NULL,
-                        leida BOOLEAN DEFAULT 0,
-                        fecha_creacion DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY(id_cliente) REFERENCES clientes(id_cliente) ON DELETE CASCADE,
-                        FOREIGN KEY(id_reserva) REFERENCES reservas(id_reserva) ON DELETE CASCADE
-                    )
-                ''')
-                conn.commit()
-                logger.info("Tabla notificaciones creada exitosamente")
-                
-        except Exception as e:
-            logger.error(f"Error ejecutando migraciones: {e}")
-        finally:
-            conn.close()
+        Uso::
+
+            with db.connection() as conn:
+                conn.execute(...)
+        """
+        return self.pool.connection()
+
+    def transaction(self):
+        """Como ``connection()`` pero abriendo una transacción de escritura inmediata.
+
+        Las lecturas dentro del bloque ven un estado que ningún otro
+        escritor puede modificar hasta el commit.
+        """
+        return self.pool.connection(immediate=True)
+
+    def close(self) -> None:
+        """Cierra las conexiones ociosas del pool."""
+        self.pool.close()
+
+    def runtime_settings(self) -> Dict:
+        """Informa de los PRAGMAs efectivos en una conexión del pool.
+
+        Returns:
+            Diccionario con el perfil solicitado y los valores leídos de SQLite
+        """
+        with self.connection() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+            mmap_size = conn.execute("PRAGMA mmap_size").fetchone()[0]
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+            busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+
+        return {
+            'profile': self.profile.name,
+            'requested': asdict(self.profile),
+            'journal_mode': str(journal_mode).upper(),
+            'synchronous': PerformanceProfile.SYNCHRONOUS_LEVELS[synchronous],
+            'cache_size': cache_size,
+            'mmap_size': mmap_size,
+            'temp_store': PerformanceProfile.TEMP_STORES[temp_store],
+            'busy_timeout': busy_timeout,
+        }
+
+    def initialize_database(self) -> List[int]:
+        """Lleva el esquema a la última versión.
+
+        En una base de datos al día solo lee ``PRAGMA user_version``.
+
+        Returns:
+            Versiones de migración aplicadas en esta llamada
+        """
+        with self.connection() as conn:
+            aplicadas = migrate(conn, MIGRATIONS)
+        if aplicadas:
+            logger.info(f"Esquema migrado a la versión {aplicadas[-1]}")
+        return aplicadas
+
+    def schema_version(self) -> int:
+        """Versión de esquema actual (PRAGMA user_version)."""
+        with self.connection() as conn:
+            return get_version(conn)
+
+    def rebuild_financial_summary(self) -> int:
+        """Recalcula la tabla ``resumen_financiero`` desde recibos y pagos.
+
+        Returns:
+            Número de meses del resumen
+        """
+        with self.transaction() as conn:
+            return rebuild_financial_summary(conn)
+
+    def ensure_indexes(self) -> Dict[str, str]:
+        """Aplica el registro de índices secundarios y verifica el resultado.
+
+        Las migraciones ya lo hacen al actualizar el esquema; este método
+        permite reparar índices borrados a mano sin cambiar de versión.
+
+        Returns:
+            Diccionario nombre -> 'ok' | 'creado' | 'recreado'
+        """
+        with self.connection() as conn:
+            estado = ensure_indexes(conn, INDEXES)
+            faltantes = verify_indexes(conn, INDEXES)
+        if faltantes:
+            raise DatabaseError(f"Índices no verificados: {', '.join(faltantes)}")
+        return estado
+
+    def check_query_plans(self, queries: Optional[Dict] = None) -> List[Dict]:
+        """Informa de las consultas de ruta caliente que aún recorren tablas completas.
+
+        Args:
+            queries: Diccionario nombre -> (sql, parámetros); por defecto
+                las consultas registradas en ``indexes.HOT_PATH_QUERIES``
+
+        Returns:
+            Lista de {'query', 'detail'} por cada SCAN sin índice
+        """
+        with self.connection() as conn:
+            hallazgos = find_full_scans(conn, queries)
+        for hallazgo in hallazgos:
+            logger.warning(f"Recorrido completo en {hallazgo['query']}: {hallazgo['detail']}")
+        return hallazgos
+
+    def change_monitor(self, on_change: Optional[OnChange] = None,
+                       interval: float = 1.0) -> ChangeMonitor:
+        """Crea un monitor de cambios sobre una conexión dedicada.
+
+        El monitor detecta las escrituras confirmadas por cualquier otra
+        conexión (de este proceso o de otro terminal) y qué tablas tocaron.
+
+        Args:
+            on_change: Recibe el conjunto de tablas cambiadas
+            interval: Segundos entre sondeos si se usa ``start()``
+
+        Returns:
+            Monitor listo para ``poll()`` o ``start()``
+        """
+        return ChangeMonitor(self.db_name, on_change=on_change, interval=interval,
+                             timeout=self.pool.timeout, on_connect=self.profile.apply)
+
+    def table_versions(self) -> Dict[str, int]:
+        """Contadores de cambios por tabla (tabla ``cambios_tablas``)."""
+        with self.connection() as conn:
+            return {fila['tabla']: fila['version']
+                    for fila in conn.execute("SELECT tabla, version FROM cambios_tablas")}
+
+    def sql_snapshot(self, order_by: str = 'total_ms', limit: Optional[int] = None) -> Dict:
+        """Estadísticas de las sentencias SQL ejecutadas por el pool.
+
+        Args:
+            order_by: Campo de ``SQLStats.snapshot`` por el que ordenar
+            limit: Número máximo de sentencias
+
+        Returns:
+            Diccionario con 'summary', 'statements' y 'slow_queries' (vacío si
+            la instrumentación está desactivada)
+        """
+        if self.sql_stats is None:
+            return {}
+        return {
+            'summary': self.sql_stats.summary(),
+            'statements': self.sql_stats.snapshot(order_by, limit),
+            'slow_queries': self.sql_stats.slow_queries(),
+        }
+
+    def reset_sql_stats(self) -> None:
+        """Descarta las estadísticas SQL acumuladas."""
+        if self.sql_stats is not None:
+            self.sql_stats.reset()
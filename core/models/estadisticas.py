@@ -0,0 +1,70 @@
+import sqlite3
+from typing import Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Estadisticas:
+    """Consultas agregadas para el panel de administración.
+
+    Cada tabla se resume con un único recorrido (COUNT/TOTAL con FILTER por
+    estado) y los resúmenes se combinan en una sola fila, de modo que el
+    panel se obtiene en un único viaje a la base de datos. Los totales de
+    recibos salen del resumen financiero materializado.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def resumen_general(self) -> Dict:
+        """Números del panel; 'total_clientes' cuenta todas las cuentas (admins incluidos)."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT c.clientes,
+                                  c.admins,
+                                  a.aparatos,
+                                  r.reservas,
+                                  r.pendientes,
+                                  r.aceptadas,
+                                  rc.recibos,
+                                  rc.pagados,
+                                  rc.pendientes,
+                                  rc.ingresos,
+                                  rc.deuda,
+                                  rc.morosos
+                           FROM (SELECT COUNT(*)                                       AS clientes,
+                                        COUNT(*) FILTER (WHERE tipo_usuario = 'admin') AS admins
+                                 FROM clientes) c,
+                                (SELECT COUNT(*) AS aparatos FROM aparatos) a,
+                                (SELECT COUNT(*)                                       AS reservas,
+                                        COUNT(*) FILTER (WHERE estado = 'pendiente') AS pendientes,
+                                        COUNT(*) FILTER (WHERE estado = 'aceptada')  AS aceptadas
+                                 FROM reservas) r,
+                                (SELECT TOTAL(recibos_pagados + recibos_pendientes) AS recibos,
+                                        TOTAL(recibos_pagados)                      AS pagados,
+                                        TOTAL(recibos_pendientes)                   AS pendientes,
+                                        TOTAL(monto_pagado)                         AS ingresos,
+                                        TOTAL(monto_pendiente)                      AS deuda,
+                                        (SELECT COUNT(DISTINCT id_cliente)
+                                         FROM recibos
+                                         WHERE estado = 'pendiente')                AS morosos
+                                 FROM resumen_financiero) rc
+                           ''')
+            row = cursor.fetchone()
+
+        return {
+            'total_clientes': row[0],
+            'total_admins': row[1],
+            'total_aparatos': row[2],
+            'total_reservas': row[3],
+            'reservas_pendientes': row[4],
+            'reservas_aceptadas': row[5],
+            'total_recibos': int(row[6]),
+            'recibos_pagados': int(row[7]),
+            'recibos_pendientes': int(row[8]),
+            'total_ingresos': row[9],
+            'deuda_total': row[10],
+            'total_morosos': row[11]
+        }
@@ -0,0 +1,226 @@
+"""Registro declarativo de índices secundarios del esquema del gimnasio.
+
+Cada ``IndexDefinition`` documenta qué consulta de los modelos cubre. Las
+migraciones los crean y verifican (``ensure_indexes``) al actualizar el
+esquema y ``find_full_scans`` informa de las consultas que el planificador de SQLite
+todavía resuelve recorriendo la tabla completa.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    """Definición de un índice secundario.
+
+    Attributes:
+        name: Nombre del índice en sqlite_master
+        table: Tabla indexada
+        columns: Columnas en orden (admite sufijos ' DESC')
+        unique: Si el índice es UNIQUE
+        where: Condición para índices parciales
+        covers: Consulta(s) de los modelos a la que da servicio
+    """
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    where: Optional[str] = None
+    covers: str = ''
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        """Nombres de columna sin modificadores de orden."""
+        return tuple(col.split()[0] for col in self.columns)
+
+    def create_sql(self) -> str:
+        """Sentencia CREATE INDEX IF NOT EXISTS del índice."""
+        unique = 'UNIQUE ' if self.unique else ''
+        sql = (f"CREATE {unique}INDEX IF NOT EXISTS {self.name} "
+               f"ON {self.table} ({', '.join(self.columns)})")
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
+INDEXES: Tuple[IndexDefinition, ...] = (
+    # clientes
+    IndexDefinition('idx_clientes_tipo', 'clientes', ('tipo_usuario',),
+                    covers='Recibo.generar_recibos_periodo, conteo de admins'),
+    IndexDefinition('idx_clientes_apellido_nombre', 'clientes', ('apellido', 'nombre'),
+                    covers='Cliente.obtener_todos (ORDER BY apellido, nombre)'),
+    # aparatos
+    IndexDefinition('idx_aparatos_tipo_nombre', 'aparatos', ('tipo', 'nombre'),
+                    covers='Aparato.obtener_todos (ORDER BY tipo, nombre)'),
+    # reservas
+    IndexDefinition('idx_reservas_disponibilidad', 'reservas',
+                    ('id_aparato', 'dia', 'inicio_min', 'estado'),
+                    covers='Reserva.verificar_disponibilidad, obtener_reservas_por_aparato'),
+    IndexDefinition('uq_reservas_franja_aceptada', 'reservas',
+                    ('id_aparato', 'dia', 'inicio_min'),
+                    unique=True, where="estado = 'aceptada'",
+                    covers='Reserva.aceptar_reserva (una sola aceptada por franja)'),
+    IndexDefinition('idx_reservas_cliente', 'reservas', ('id_cliente', 'dia', 'inicio_min'),
+                    covers='Reserva.obtener_reservas_cliente (ORDER BY dia, inicio_min)'),
+    IndexDefinition('idx_reservas_dia_hora', 'reservas', ('dia', 'inicio_min'),
+                    covers='Reserva.obtener_ocupacion_dia'),
+    IndexDefinition('idx_reservas_estado_fecha', 'reservas', ('estado', 'fecha_reserva'),
+                    covers='Reserva.obtener_reservas_pendientes (WHERE estado ORDER BY fecha_reserva)'),
+    IndexDefinition('idx_reservas_fecha', 'reservas',
+                    ('fecha_reserva DESC', 'dia', 'inicio_min'),
+                    covers='Reserva.obtener_todas (ORDER BY fecha_reserva DESC, dia, inicio_min)'),
+    # recibos
+    IndexDefinition('idx_recibos_cliente_periodo', 'recibos', ('id_cliente', 'anio', 'mes'),
+                    covers='Recibo.obtener_recibos_cliente (ORDER BY anio DESC, mes DESC)'),
+    IndexDefinition('idx_recibos_estado_cliente', 'recibos', ('estado', 'id_cliente'),
+                    covers='Recibo.obtener_morosos (WHERE estado GROUP BY id_cliente)'),
+    IndexDefinition('idx_recibos_periodo', 'recibos', ('anio', 'mes'),
+                    covers='Recibo.obtener_todos_recibos (ORDER BY anio DESC, mes DESC)'),
+    # pagos
+    IndexDefinition('idx_pagos_recibo', 'pagos', ('id_recibo',),
+                    covers='ON DELETE CASCADE desde recibos'),
+    # notificaciones
+    IndexDefinition('idx_notificaciones_cliente_fecha', 'notificaciones',
+                    ('id_cliente', 'fecha_creacion'),
+                    covers='Notificacion.obtener_por_cliente (ORDER BY fecha_creacion DESC)'),
+    IndexDefinition('idx_notificaciones_cliente_leida', 'notificaciones',
+                    ('id_cliente', 'leida'),
+                    covers='Notificacion.contar_no_leidas'),
+    IndexDefinition('idx_notificaciones_reserva', 'notificaciones', ('id_reserva',),
+                    covers='ON DELETE CASCADE desde reservas'),
+)
+
+
+# Consultas de ruta caliente que deben resolverse mediante índices.
+# Cada entrada es (sql, parámetros de ejemplo).
+HOT_PATH_QUERIES: Dict[str, Tuple[str, tuple]] = {
+    'Cliente.dni_existe': (
+        "SELECT COUNT(*) FROM clientes WHERE dni = ?", ('0',)),
+    'Cliente.obtener_todos': (
+        "SELECT id_cliente FROM clientes ORDER BY apellido, nombre", ()),
+    'Reserva.verificar_disponibilidad': (
+        "SELECT COUNT(*) FROM reservas WHERE id_aparato = ? AND dia = ? "
+        "AND inicio_min = ? AND estado = 'aceptada'", (0, 1, 0)),
+    'Reserva.obtener_reservas_cliente': (
+        "SELECT id_reserva FROM reservas WHERE id_cliente = ? ORDER BY dia, inicio_min", (0,)),
+    'Reserva.obtener_ocupacion_dia': (
+        "SELECT id_reserva FROM reservas WHERE dia = ? ORDER BY inicio_min", (1,)),
+    'Reserva.obtener_reservas_pendientes': (
+        "SELECT id_reserva FROM reservas WHERE estado = 'pendiente' ORDER BY fecha_reserva", ()),
+    'Reserva.obtener_reservas_por_aparato': (
+        "SELECT id_reserva FROM reservas WHERE id_aparato = ?", (0,)),
+    'Cliente.obtener_pagina': (
+        "SELECT id_cliente FROM clientes WHERE (apellido, nombre, id_cliente) > (?, ?, ?) "
+        "ORDER BY apellido, nombre, id_cliente LIMIT 51", ('', '', 0)),
+    'Reserva.obtener_pagina': (
+        "SELECT id_reserva FROM reservas WHERE fecha_reserva <= ? AND (fecha_reserva < ? "
+        "OR (dia, inicio_min, id_reserva) > (?, ?, ?)) "
+        "ORDER BY fecha_reserva DESC, dia, inicio_min, id_reserva LIMIT 51",
+        ('2026-01-01', '2026-01-01', 1, 0, 0)),
+    'Reserva.obtener_pagina_pendientes': (
+        "SELECT id_reserva FROM reservas WHERE estado = 'pendiente' "
+        "AND (fecha_reserva, id_reserva) > (?, ?) ORDER BY fecha_reserva, id_reserva LIMIT 51",
+        ('2026-01-01', 0)),
+    'Recibo.obtener_pagina': (
+        "SELECT id_recibo FROM recibos WHERE (anio, mes, id_recibo) < (?, ?, ?) "
+        "ORDER BY anio DESC, mes DESC, id_recibo DESC LIMIT 51", (2026, 1, 0)),
+    'Recibo.obtener_recibos_cliente': (
+        "SELECT id_recibo FROM recibos WHERE id_cliente = ? ORDER BY anio DESC, mes DESC", (0,)),
+    'Recibo.obtener_morosos': (
+        "SELECT id_cliente, COUNT(*), SUM(monto) FROM recibos WHERE estado = 'pendiente' "
+        "GROUP BY id_cliente", ()),
+    'Notificacion.obtener_por_cliente': (
+        "SELECT id_notificacion FROM notificaciones WHERE id_cliente = ? "
+        "ORDER BY fecha_creacion DESC", (0,)),
+    'Notificacion.contar_no_leidas': (
+        "SELECT COUNT(*) FROM notificaciones WHERE id_cliente = ? AND leida = 0", (0,)),
+}
+
+
+def _index_columns(conn: sqlite3.Connection, name: str) -> Tuple[str, ...]:
+    """Columnas de un índice existente según PRAGMA index_info."""
+    rows = conn.execute(f"PRAGMA index_info({name})").fetchall()
+    return tuple(row[2] for row in sorted(rows, key=lambda r: r[0]))
+
+
+def ensure_indexes(conn: sqlite3.Connection,
+                   indexes: Sequence[IndexDefinition] = INDEXES) -> Dict[str, str]:
+    """Crea los índices que falten y recrea los que no coincidan con su definición.
+
+    Args:
+        conn: Conexión abierta (la transacción la gestiona el llamador)
+        indexes: Definiciones a aplicar
+
+    Returns:
+        Diccionario nombre -> 'ok' | 'creado' | 'recreado'
+    """
+    existentes = {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).fetchall()
+    }
+
+    estado = {}
+    for index in indexes:
+        if index.name in existentes:
+            if _index_columns(conn, index.name) == index.column_names:
+                estado[index.name] = 'ok'
+                continue
+            logger.warning(f"Índice {index.name} no coincide con su definición, recreando")
+            conn.execute(f"DROP INDEX {index.name}")
+            conn.execute(index.create_sql())
+            estado[index.name] = 'recreado'
+        else:
+            conn.execute(index.create_sql())
+            estado[index.name] = 'creado'
+
+    creados = [nombre for nombre, valor in estado.items() if valor != 'ok']
+    if creados:
+        logger.info(f"Índices aplicados: {', '.join(creados)}")
+    return estado
+
+
+def verify_indexes(conn: sqlite3.Connection,
+                   indexes: Sequence[IndexDefinition] = INDEXES) -> List[str]:
+    """Devuelve los nombres de índices ausentes o con columnas distintas."""
+    existentes = {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).fetchall()
+    }
+    return [
+        index.name for index in indexes
+        if index.name not in existentes
+        or _index_columns(conn, index.name) != index.column_names
+    ]
+
+
+def find_full_scans(conn: sqlite3.Connection,
+                    queries: Optional[Dict[str, Tuple[str, tuple]]] = None) -> List[Dict]:
+    """Ejecuta EXPLAIN QUERY PLAN y devuelve las consultas con recorridos completos.
+
+    Se considera recorrido completo un paso ``SCAN <tabla>`` que no usa ningún
+    índice.
+
+    Args:
+        conn: Conexión abierta
+        queries: Consultas a revisar (por defecto HOT_PATH_QUERIES)
+
+    Returns:
+        Lista de diccionarios {'query', 'detail'} por cada paso SCAN sin índice
+    """
+    if queries is None:
+        queries = HOT_PATH_QUERIES
+
+    hallazgos = []
+    for nombre, (sql, params) in queries.items():
+        for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall():
+            detail = row[3]
+            if detail.startswith('SCAN ') and 'USING' not in detail:
+                hallazgos.append({'query': nombre, 'detail': detail})
+    return hallazgos
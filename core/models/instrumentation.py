@@ -0,0 +1,273 @@
+"""Instrumentación de las sentencias SQL ejecutadas por el pool.
+
+Las conexiones del pool se crean con ``InstrumentedConnection``, cuyos
+cursores miden cada sentencia desde ``execute`` hasta que se termina de
+leer su resultado (``fetchall``, ``fetchone`` sin más filas, fin de la
+iteración o cierre del cursor), de modo que el tiempo incluye la lectura de
+filas y no solo la preparación. Las estadísticas se agrupan por el texto
+normalizado de la sentencia en un ``SQLStats`` compartido.
+
+Las sentencias que superan ``slow_query_ms`` se registran en el logger
+``core.models.sql`` (y en un archivo si se configura con ``log_to``).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+slow_logger = logging.getLogger('core.models.sql')
+
+# Duraciones recientes guardadas por sentencia para estimar el p95
+MUESTRAS_POR_SENTENCIA = 512
+
+
+class _StatementStats:
+    """Acumulados de una sentencia normalizada."""
+
+    __slots__ = ('count', 'errors', 'total', 'max', 'rows', 'recientes')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.recientes: Deque[float] = deque(maxlen=MUESTRAS_POR_SENTENCIA)
+
+
+class SQLStats:
+    """Contadores por sentencia y registro de consultas lentas (seguro entre hilos)."""
+
+    def __init__(self, slow_query_ms: Optional[float] = 250.0, slow_history: int = 100):
+        """Inicializa las estadísticas.
+
+        Args:
+            slow_query_ms: Umbral de consulta lenta en milisegundos (None lo desactiva)
+            slow_history: Consultas lentas recientes que se conservan en memoria
+        """
+        self.slow_query_ms = slow_query_ms
+        self._stats: Dict[str, _StatementStats] = {}
+        self._normalizadas: Dict[str, str] = {}
+        self._lentas: Deque[Dict] = deque(maxlen=slow_history)
+        self._lock = threading.Lock()
+        self._desde = time.time()
+
+    def _normalizar(self, sql: str) -> str:
+        normalizada = self._normalizadas.get(sql)
+        if normalizada is None:
+            normalizada = ' '.join(sql.split())
+            if len(self._normalizadas) > 10000:
+                self._normalizadas.clear()  # SQL con valores interpolados
+            self._normalizadas[sql] = normalizada
+        return normalizada
+
+    def record(self, sql: str, seconds: float, rows: int, error: bool = False) -> None:
+        """Registra una ejecución de ``sql``."""
+        with self._lock:
+            clave = self._normalizar(sql)
+            stats = self._stats.get(clave)
+            if stats is None:
+                stats = self._stats[clave] = _StatementStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.rows += rows
+            stats.recientes.append(seconds)
+            if seconds > stats.max:
+                stats.max = seconds
+            if error:
+                stats.errors += 1
+
+        ms = seconds * 1000
+        if self.slow_query_ms is not None and ms >= self.slow_query_ms:
+            lenta = {'sql': clave, 'ms': round(ms, 3), 'rows': rows, 'error': error,
+                     'at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+            self._lentas.append(lenta)
+            slow_logger.warning(f"Consulta lenta ({ms:.1f} ms, {rows} filas): {clave}")
+
+    def snapshot(self, order_by: str = 'total_ms', limit: Optional[int] = None) -> List[Dict]:
+        """Estadísticas por sentencia.
+
+        Args:
+            order_by: Campo por el que ordenar (de mayor a menor)
+            limit: Número máximo de sentencias
+
+        Returns:
+            Lista de {'sql', 'count', 'errors', 'total_ms', 'mean_ms',
+            'p95_ms', 'max_ms', 'rows', 'rows_per_call'}; el p95 se calcula
+            sobre las últimas ``MUESTRAS_POR_SENTENCIA`` ejecuciones
+        """
+        with self._lock:
+            copia = [(sql, s.count, s.errors, s.total, s.max, s.rows, sorted(s.recientes))
+                     for sql, s in self._stats.items()]
+
+        filas = []
+        for sql, count, errors, total, maximo, rows, recientes in copia:
+            p95 = recientes[min(len(recientes) - 1, max(0, round(0.95 * len(recientes)) - 1))]
+            filas.append({
+                'sql': sql,
+                'count': count,
+                'errors': errors,
+                'total_ms': round(total * 1000, 3),
+                'mean_ms': round(total * 1000 / count, 4),
+                'p95_ms': round(p95 * 1000, 4),
+                'max_ms': round(maximo * 1000, 4),
+                'rows': rows,
+                'rows_per_call': round(rows / count, 2),
+            })
+        filas.sort(key=lambda fila: fila[order_by], reverse=True)
+        return filas[:limit] if limit is not None else filas
+
+    def slow_queries(self) -> List[Dict]:
+        """Consultas lentas recientes, de la más antigua a la más reciente."""
+        return list(self._lentas)
+
+    def summary(self) -> Dict:
+        """Totales desde el último ``reset``."""
+        with self._lock:
+            sentencias = len(self._stats)
+            llamadas = sum(s.count for s in self._stats.values())
+            total = sum(s.total for s in self._stats.values())
+        return {
+            'since': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._desde)),
+            'statements': sentencias,
+            'calls': llamadas,
+            'total_ms': round(total * 1000, 3),
+            'slow_queries': len(self._lentas),
+            'slow_query_ms': self.slow_query_ms,
+        }
+
+    def reset(self) -> None:
+        """Descarta las estadísticas acumuladas."""
+        with self._lock:
+            self._stats.clear()
+            self._lentas.clear()
+            self._desde = time.time()
+
+    @staticmethod
+    def log_to(path: str) -> logging.Handler:
+        """Escribe también las consultas lentas en ``path``.
+
+        Returns:
+            El handler añadido (para quitarlo con ``removeHandler``)
+        """
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        slow_logger.addHandler(handler)
+        return handler
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor que mide cada sentencia hasta que se consume su resultado."""
+
+    _sql: Optional[str] = None
+    _segundos = 0.0
+    _filas = 0
+
+    def _registrar(self, sql: str, segundos: float, filas: int, error: bool = False) -> None:
+        stats = self.connection.stats
+        if stats is not None:
+            stats.record(sql, segundos, filas, error)
+
+    def _terminar(self) -> None:
+        """Registra la sentencia en curso, si la hay."""
+        if self._sql is not None:
+            sql, self._sql = self._sql, None
+            self._registrar(sql, self._segundos, self._filas)
+
+    def _empezar(self, sql: str, segundos: float) -> None:
+        if self.description is None:
+            # Sin resultado que leer (INSERT, UPDATE, PRAGMA de escritura...)
+            self._registrar(sql, segundos, max(self.rowcount, 0))
+        else:
+            self._sql, self._segundos, self._filas = sql, segundos, 0
+
+    def execute(self, sql, parameters=()):
+        self._terminar()
+        inicio = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception:
+            self._registrar(sql, time.perf_counter() - inicio, 0, error=True)
+            raise
+        self._empezar(sql, time.perf_counter() - inicio)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._terminar()
+        inicio = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        except Exception:
+            self._registrar(sql, time.perf_counter() - inicio, 0, error=True)
+            raise
+        self._registrar(sql, time.perf_counter() - inicio, max(self.rowcount, 0))
+        return self
+
+    def fetchone(self):
+        inicio = time.perf_counter()
+        fila = super().fetchone()
+        self._segundos += time.perf_counter() - inicio
+        if fila is None:
+            self._terminar()
+        else:
+            self._filas += 1
+        return fila
+
+    def fetchmany(self, size=None):
+        tamano = self.arraysize if size is None else size
+        inicio = time.perf_counter()
+        filas = super().fetchmany(tamano)
+        self._segundos += time.perf_counter() - inicio
+        self._filas += len(filas)
+        if len(filas) < tamano:
+            self._terminar()
+        return filas
+
+    def fetchall(self):
+        inicio = time.perf_counter()
+        filas = super().fetchall()
+        self._segundos += time.perf_counter() - inicio
+        self._filas += len(filas)
+        self._terminar()
+        return filas
+
+    def __next__(self):
+        inicio = time.perf_counter()
+        try:
+            fila = super().__next__()
+        except StopIteration:
+            self._segundos += time.perf_counter() - inicio
+            self._terminar()
+            raise
+        self._segundos += time.perf_counter() - inicio
+        self._filas += 1
+        return fila
+
+    def close(self):
+        self._terminar()
+        super().close()
+
+    def __del__(self):
+        # Resultados no leídos hasta el final (p. ej. un único fetchone)
+        try:
+            self._terminar()
+        except Exception:
+            pass
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Conexión cuyos cursores registran sus sentencias en ``stats``."""
+
+    stats: Optional[SQLStats] = None
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -0,0 +1,459 @@
+"""Motor de migraciones versionadas del esquema, basado en ``PRAGMA user_version``.
+
+Cada ``Migration`` lleva el esquema de la versión ``version - 1`` a
+``version`` y se ejecuta en su propia transacción (``BEGIN IMMEDIATE``).
+En una base de datos ya actualizada ``migrate`` se limita a leer
+``user_version`` y retornar.
+
+Los índices secundarios se sincronizan con el registro de ``indexes`` en la
+transacción de la última migración pendiente, cuando las tablas ya tienen
+su forma definitiva. Para publicar un índice nuevo basta con añadirlo al
+registro y agregar una migración (aunque no modifique tablas).
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+import logging
+
+from infrastructure.exceptions import DatabaseError
+from .indexes import INDEXES, ensure_indexes, verify_indexes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Paso de migración del esquema.
+
+    Attributes:
+        version: Versión de esquema resultante (user_version)
+        description: Descripción para el log
+        apply: Función que recibe la conexión y aplica los cambios;
+            ``None`` para migraciones que solo sincronizan índices
+    """
+    version: int
+    description: str
+    apply: Optional[Callable[[sqlite3.Connection], None]] = None
+
+
+def _esquema_base(conn: sqlite3.Connection) -> None:
+    """Versión 1: tablas del sistema y usuario administrador por defecto.
+
+    Usa IF NOT EXISTS para adoptar bases de datos creadas antes de que
+    existiera el control de versiones.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS clientes
+        (
+            id_cliente INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            apellido TEXT NOT NULL,
+            dni TEXT UNIQUE NOT NULL,
+            telefono TEXT,
+            email TEXT,
+            tipo_usuario TEXT NOT NULL CHECK (tipo_usuario IN ('cliente', 'admin')),
+            password TEXT NOT NULL,
+            fecha_registro DATE DEFAULT CURRENT_DATE
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS aparatos
+        (
+            id_aparato INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            descripcion TEXT
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS reservas
+        (
+            id_reserva INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_cliente INTEGER NOT NULL,
+            id_aparato INTEGER NOT NULL,
+            dia_semana TEXT NOT NULL
+                CHECK (dia_semana IN ('Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes')),
+            hora_inicio TEXT NOT NULL,
+            hora_fin TEXT NOT NULL,
+            fecha_reserva DATE DEFAULT CURRENT_DATE,
+            estado TEXT NOT NULL DEFAULT 'pendiente'
+                CHECK (estado IN ('pendiente', 'aceptada', 'rechazada')),
+            FOREIGN KEY (id_cliente) REFERENCES clientes (id_cliente) ON DELETE CASCADE,
+            FOREIGN KEY (id_aparato) REFERENCES aparatos (id_aparato) ON DELETE CASCADE
+        )
+    ''')
+
+    # Bases de datos antiguas: reservas sin columna 'estado'
+    columnas = [row[1] for row in conn.execute("PRAGMA table_info(reservas)").fetchall()]
+    if 'estado' not in columnas:
+        logger.info("Agregando columna 'estado' a tabla reservas...")
+        conn.execute('''
+            ALTER TABLE reservas
+            ADD COLUMN estado TEXT NOT NULL DEFAULT 'pendiente'
+            CHECK (estado IN ('pendiente', 'aceptada', 'rechazada'))
+        ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recibos
+        (
+            id_recibo INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_cliente INTEGER NOT NULL,
+            mes INTEGER NOT NULL,
+            anio INTEGER NOT NULL,
+            monto REAL NOT NULL DEFAULT 50.0,
+            fecha_emision DATE DEFAULT CURRENT_DATE,
+            estado TEXT NOT NULL DEFAULT 'pendiente' CHECK (estado IN ('pendiente', 'pagado')),
+            FOREIGN KEY (id_cliente) REFERENCES clientes (id_cliente) ON DELETE CASCADE,
+            UNIQUE (id_cliente, mes, anio)
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS pagos
+        (
+            id_pago INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_recibo INTEGER NOT NULL,
+            fecha_pago DATE DEFAULT CURRENT_DATE,
+            monto REAL NOT NULL,
+            metodo_pago TEXT,
+            FOREIGN KEY (id_recibo) REFERENCES recibos (id_recibo) ON DELETE CASCADE
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS notificaciones
+        (
+            id_notificacion INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_cliente INTEGER NOT NULL,
+            id_reserva INTEGER,
+            tipo TEXT NOT NULL CHECK (tipo IN ('aceptada', 'rechazada')),
+            mensaje TEXT NOT NULL,
+            leida BOOLEAN DEFAULT 0,
+            fecha_creacion DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (id_cliente) REFERENCES clientes (id_cliente) ON DELETE CASCADE,
+            FOREIGN KEY (id_reserva) REFERENCES reservas (id_reserva) ON DELETE CASCADE
+        )
+    ''')
+
+    # Crear usuario admin por defecto si no existe
+    if conn.execute("SELECT COUNT(*) FROM clientes WHERE tipo_usuario = 'admin'").fetchone()[0] == 0:
+        conn.execute('''
+            INSERT INTO clientes (nombre, apellido, dni, telefono, email, tipo_usuario, password)
+            VALUES ('Admin', 'Sistema', 'admin123', '000000000', 'admin@gym.com', 'admin', 'admin123')
+        ''')
+
+
+def _franjas_enteras(conn: sqlite3.Connection) -> None:
+    """Versión 3: día y horas de ``reservas`` como enteros.
+
+    ``dia`` es el día ISO (1 = Lunes ... 5 = Viernes) e ``inicio_min`` /
+    ``fin_min`` son minutos desde medianoche, de modo que las búsquedas y
+    ordenaciones comparan enteros y pueden recorrer índices en orden. La
+    tabla se reconstruye porque SQLite no permite cambiar tipos de columna.
+    """
+    conn.execute('''
+        CREATE TABLE reservas_v3
+        (
+            id_reserva INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_cliente INTEGER NOT NULL,
+            id_aparato INTEGER NOT NULL,
+            dia INTEGER NOT NULL CHECK (dia BETWEEN 1 AND 5),
+            inicio_min INTEGER NOT NULL CHECK (inicio_min BETWEEN 0 AND 1439),
+            fin_min INTEGER NOT NULL CHECK (fin_min > inicio_min AND fin_min <= 1440),
+            fecha_reserva DATE DEFAULT CURRENT_DATE,
+            estado TEXT NOT NULL DEFAULT 'pendiente'
+                CHECK (estado IN ('pendiente', 'aceptada', 'rechazada')),
+            FOREIGN KEY (id_cliente) REFERENCES clientes (id_cliente) ON DELETE CASCADE,
+            FOREIGN KEY (id_aparato) REFERENCES aparatos (id_aparato) ON DELETE CASCADE
+        )
+    ''')
+
+    # 'H:MM' o 'HH:MM' -> minutos; una hora de fin que "da la vuelta"
+    # (23:30 -> 00:00) se guarda como 1440. Las franjas no cruzan de día:
+    # si una fila antigua termina después de medianoche (23:30 -> 00:30) se
+    # recorta a 1440 para cumplir el CHECK en lugar de abortar la migración
+    conn.execute('''
+        CREATE TEMP VIEW reservas_minutos AS
+        SELECT id_reserva, id_cliente, id_aparato, fecha_reserva, estado, dia, inicio,
+               CASE WHEN fin <= inicio THEN fin + 1440 ELSE fin END AS fin
+        FROM (
+            SELECT id_reserva, id_cliente, id_aparato, fecha_reserva, estado,
+                   CASE dia_semana
+                       WHEN 'Lunes' THEN 1
+                       WHEN 'Martes' THEN 2
+                       WHEN 'Miércoles' THEN 3
+                       WHEN 'Jueves' THEN 4
+                       WHEN 'Viernes' THEN 5
+                   END AS dia,
+                   CAST(substr(hora_inicio, 1, instr(hora_inicio, ':') - 1) AS INTEGER) * 60
+                       + CAST(substr(hora_inicio, instr(hora_inicio, ':') + 1) AS INTEGER) AS inicio,
+                   CAST(substr(hora_fin, 1, instr(hora_fin, ':') - 1) AS INTEGER) * 60
+                       + CAST(substr(hora_fin, instr(hora_fin, ':') + 1) AS INTEGER) AS fin
+            FROM reservas
+        )
+    ''')
+    recortadas = conn.execute(
+        "SELECT id_reserva FROM reservas_minutos WHERE fin > 1440 ORDER BY id_reserva"
+    ).fetchall()
+    if recortadas:
+        logger.warning(
+            f"{len(recortadas)} reservas terminaban después de medianoche; fin recortado a 24:00 "
+            f"(ids: {', '.join(str(fila[0]) for fila in recortadas[:20])}"
+            f"{', ...' if len(recortadas) > 20 else ''})"
+        )
+
+    conn.execute('''
+        INSERT INTO reservas_v3 (id_reserva, id_cliente, id_aparato, dia, inicio_min, fin_min,
+                                 fecha_reserva, estado)
+        SELECT id_reserva, id_cliente, id_aparato, dia, inicio, MIN(fin, 1440), fecha_reserva, estado
+        FROM reservas_minutos
+    ''')
+    conn.execute("DROP VIEW reservas_minutos")
+
+    conn.execute("DROP TABLE reservas")
+    conn.execute("ALTER TABLE reservas_v3 RENAME TO reservas")
+
+
+def _franja_aceptada_unica(conn: sqlite3.Connection) -> None:
+    """Versión 4: prepara el índice único parcial de reservas aceptadas.
+
+    Antes de que existiera el índice, dos administradores podían aceptar
+    la misma franja. Se conserva la aceptación más antigua y las demás
+    pasan a 'rechazada' para que el índice pueda crearse.
+    """
+    cursor = conn.execute('''
+        UPDATE reservas
+        SET estado = 'rechazada'
+        WHERE estado = 'aceptada'
+          AND id_reserva NOT IN (
+              SELECT MIN(id_reserva)
+              FROM reservas
+              WHERE estado = 'aceptada'
+              GROUP BY id_aparato, dia, inicio_min
+          )
+    ''')
+    if cursor.rowcount:
+        logger.warning(f"{cursor.rowcount} reservas aceptadas duplicadas pasadas a 'rechazada'")
+
+
+# Deltas de resumen_financiero: (recibos_pendientes, monto_pendiente,
+# recibos_pagados, monto_pagado, pagos, monto_cobrado)
+def _sumar_resumen(anio: str, mes: str, deltas: str) -> str:
+    """Upsert que suma ``deltas`` a la fila (anio, mes) del resumen."""
+    return f'''
+        INSERT INTO resumen_financiero (anio, mes, recibos_pendientes, monto_pendiente,
+                                        recibos_pagados, monto_pagado, pagos, monto_cobrado)
+        VALUES ({anio}, {mes}, {deltas})
+        ON CONFLICT (anio, mes) DO UPDATE SET
+            recibos_pendientes = recibos_pendientes + excluded.recibos_pendientes,
+            monto_pendiente = monto_pendiente + excluded.monto_pendiente,
+            recibos_pagados = recibos_pagados + excluded.recibos_pagados,
+            monto_pagado = monto_pagado + excluded.monto_pagado,
+            pagos = pagos + excluded.pagos,
+            monto_cobrado = monto_cobrado + excluded.monto_cobrado;
+    '''
+
+
+def _deltas_recibo(fila: str, signo: str) -> str:
+    return (f"{signo}({fila}.estado = 'pendiente'), "
+            f"{signo}(CASE WHEN {fila}.estado = 'pendiente' THEN {fila}.monto ELSE 0 END), "
+            f"{signo}({fila}.estado = 'pagado'), "
+            f"{signo}(CASE WHEN {fila}.estado = 'pagado' THEN {fila}.monto ELSE 0 END), 0, 0")
+
+
+def _deltas_pago(fila: str, signo: str) -> str:
+    return f"0, 0, 0, 0, {signo}1, {signo}{fila}.monto"
+
+
+def _periodo_pago(fila: str) -> Tuple[str, str]:
+    fecha = f"COALESCE({fila}.fecha_pago, CURRENT_DATE)"
+    return (f"CAST(strftime('%Y', {fecha}) AS INTEGER)",
+            f"CAST(strftime('%m', {fecha}) AS INTEGER)")
+
+
+_TRIGGERS_RESUMEN = {
+    'trg_recibos_resumen_insert':
+        "AFTER INSERT ON recibos BEGIN"
+        + _sumar_resumen('NEW.anio', 'NEW.mes', _deltas_recibo('NEW', '+')) + "END",
+    'trg_recibos_resumen_delete':
+        "AFTER DELETE ON recibos BEGIN"
+        + _sumar_resumen('OLD.anio', 'OLD.mes', _deltas_recibo('OLD', '-')) + "END",
+    'trg_recibos_resumen_update':
+        "AFTER UPDATE OF estado, monto, mes, anio ON recibos BEGIN"
+        + _sumar_resumen('OLD.anio', 'OLD.mes', _deltas_recibo('OLD', '-'))
+        + _sumar_resumen('NEW.anio', 'NEW.mes', _deltas_recibo('NEW', '+')) + "END",
+    'trg_pagos_resumen_insert':
+        "AFTER INSERT ON pagos BEGIN"
+        + _sumar_resumen(*_periodo_pago('NEW'), _deltas_pago('NEW', '+')) + "END",
+    'trg_pagos_resumen_delete':
+        "AFTER DELETE ON pagos BEGIN"
+        + _sumar_resumen(*_periodo_pago('OLD'), _deltas_pago('OLD', '-')) + "END",
+    'trg_pagos_resumen_update':
+        "AFTER UPDATE OF monto, fecha_pago ON pagos BEGIN"
+        + _sumar_resumen(*_periodo_pago('OLD'), _deltas_pago('OLD', '-'))
+        + _sumar_resumen(*_periodo_pago('NEW'), _deltas_pago('NEW', '+')) + "END",
+}
+
+
+def rebuild_financial_summary(conn: sqlite3.Connection) -> int:
+    """Recalcula ``resumen_financiero`` desde ``recibos`` y ``pagos``.
+
+    Los triggers lo mantienen exacto; esta función sirve para repararlo
+    (p. ej. tras cargas masivas con los triggers deshabilitados). La
+    transacción la gestiona el llamador.
+
+    Returns:
+        Número de meses del resumen
+    """
+    conn.execute("DELETE FROM resumen_financiero")
+    conn.execute('''
+        INSERT INTO resumen_financiero (anio, mes, recibos_pendientes, monto_pendiente,
+                                        recibos_pagados, monto_pagado, pagos, monto_cobrado)
+        SELECT anio, mes, TOTAL(rp), TOTAL(mp), TOTAL(rg), TOTAL(mg), TOTAL(np), TOTAL(mc)
+        FROM (SELECT anio, mes,
+                     estado = 'pendiente' AS rp,
+                     CASE WHEN estado = 'pendiente' THEN monto ELSE 0 END AS mp,
+                     estado = 'pagado' AS rg,
+                     CASE WHEN estado = 'pagado' THEN monto ELSE 0 END AS mg,
+                     0 AS np, 0 AS mc
+              FROM recibos
+              UNION ALL
+              SELECT CAST(strftime('%Y', COALESCE(fecha_pago, CURRENT_DATE)) AS INTEGER),
+                     CAST(strftime('%m', COALESCE(fecha_pago, CURRENT_DATE)) AS INTEGER),
+                     0, 0, 0, 0, 1, monto
+              FROM pagos)
+        GROUP BY anio, mes
+    ''')
+    return conn.execute("SELECT COUNT(*) FROM resumen_financiero").fetchone()[0]
+
+
+def _resumen_financiero(conn: sqlite3.Connection) -> None:
+    """Versión 5: resumen financiero materializado por mes.
+
+    ``resumen_financiero`` guarda por (anio, mes) los recibos y el importe
+    de cada estado según el periodo facturado, y los pagos y el importe
+    cobrado según el mes del pago. Los triggers lo actualizan en la misma
+    transacción que la escritura, de modo que las estadísticas financieras
+    cuestan O(meses) y son exactas aunque haya pagos concurrentes.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS resumen_financiero
+        (
+            anio INTEGER NOT NULL,
+            mes INTEGER NOT NULL,
+            recibos_pendientes INTEGER NOT NULL DEFAULT 0,
+            monto_pendiente REAL NOT NULL DEFAULT 0,
+            recibos_pagados INTEGER NOT NULL DEFAULT 0,
+            monto_pagado REAL NOT NULL DEFAULT 0,
+            pagos INTEGER NOT NULL DEFAULT 0,
+            monto_cobrado REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (anio, mes)
+        ) WITHOUT ROWID
+    ''')
+    for nombre, cuerpo in _TRIGGERS_RESUMEN.items():
+        conn.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+        conn.execute(f"CREATE TRIGGER {nombre} {cuerpo}")
+    meses = rebuild_financial_summary(conn)
+    logger.info(f"Resumen financiero inicializado con {meses} meses")
+
+
+# Tablas cuyos cambios se contabilizan en cambios_tablas
+TABLAS_VIGILADAS = ('clientes', 'aparatos', 'reservas', 'recibos', 'pagos', 'notificaciones')
+
+
+def _cambios_tablas(conn: sqlite3.Connection) -> None:
+    """Versión 6: contador de cambios por tabla.
+
+    Cada inserción, actualización o borrado en una tabla vigilada suma uno
+    a su fila de ``cambios_tablas`` dentro de la misma transacción. Junto
+    con ``PRAGMA data_version`` permite a otros procesos saber qué tablas
+    han cambiado sin volver a leerlas.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS cambios_tablas
+        (
+            tabla TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    ''')
+    for tabla in TABLAS_VIGILADAS:
+        conn.execute("INSERT OR IGNORE INTO cambios_tablas (tabla) VALUES (?)", (tabla,))
+        for operacion in ('INSERT', 'UPDATE', 'DELETE'):
+            nombre = f"trg_{tabla}_cambios_{operacion.lower()}"
+            conn.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+            conn.execute(f'''
+                CREATE TRIGGER {nombre} AFTER {operacion} ON {tabla} BEGIN
+                    UPDATE cambios_tablas SET version = version + 1 WHERE tabla = '{tabla}';
+                END
+            ''')
+
+
+MIGRATIONS: Sequence[Migration] = (
+    Migration(1, "Esquema base", _esquema_base),
+    Migration(2, "Índices secundarios"),
+    Migration(3, "Día y franja horaria de reservas como enteros", _franjas_enteras),
+    Migration(4, "Franja aceptada única por aparato", _franja_aceptada_unica),
+    Migration(5, "Resumen financiero materializado", _resumen_financiero),
+    Migration(6, "Contadores de cambios por tabla", _cambios_tablas),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_version(conn: sqlite3.Connection) -> int:
+    """Lee la versión de esquema almacenada en la base de datos."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection,
+            migrations: Sequence[Migration] = MIGRATIONS) -> List[int]:
+    """Aplica en orden las migraciones pendientes.
+
+    Args:
+        conn: Conexión sin transacción abierta
+        migrations: Migraciones ordenadas por versión
+
+    Returns:
+        Versiones aplicadas (lista vacía si el esquema ya estaba al día)
+
+    Raises:
+        DatabaseError: Si una migración falla (su transacción se revierte)
+    """
+    latest = migrations[-1].version
+    if get_version(conn) >= latest:
+        return []
+
+    aplicadas = []
+    for migration in migrations:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Releer dentro de la transacción: otro proceso pudo migrar antes
+            if get_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+
+            logger.info(f"Aplicando migración {migration.version}: {migration.description}")
+            if migration.apply is not None:
+                migration.apply(conn)
+
+            if migration.version == latest:
+                ensure_indexes(conn, INDEXES)
+                faltantes = verify_indexes(conn, INDEXES)
+                if faltantes:
+                    raise DatabaseError(f"Índices no verificados: {', '.join(faltantes)}")
+
+            # user_version no admite parámetros; version es un entero propio
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error en migración {migration.version}: {e}")
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(f"Falló la migración {migration.version}: {e}") from e
+        aplicadas.append(migration.version)
+
+    return aplicadas
@@ -0,0 +1,62 @@
+"""Paginación por clave (keyset) para los listados de los modelos.
+
+En lugar de ``OFFSET`` cada página continúa a partir de la clave de
+ordenación de la última fila entregada, de modo que el coste de una
+página depende de su tamaño y no de la posición en la tabla. La clave
+viaja al cliente como un token opaco (JSON en base64 URL-safe).
+"""
+
+import base64
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+TAMANO_PAGINA_DEFECTO = 50
+TAMANO_PAGINA_MAXIMO = 500
+
+
+def page_size(tamano: Optional[int]) -> int:
+    """Normaliza el tamaño de página al rango [1, TAMANO_PAGINA_MAXIMO]."""
+    if not tamano:
+        return TAMANO_PAGINA_DEFECTO
+    return max(1, min(int(tamano), TAMANO_PAGINA_MAXIMO))
+
+
+def encode_cursor(clave: Sequence[Any]) -> str:
+    """Serializa la clave de ordenación de una fila como token opaco."""
+    datos = json.dumps(list(clave), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(datos).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str, longitud: int) -> List[Any]:
+    """Recupera la clave de ordenación de un token.
+
+    Raises:
+        ValueError: Si el token está corrupto o no corresponde al listado
+    """
+    try:
+        relleno = '=' * (-len(token) % 4)
+        clave = json.loads(base64.urlsafe_b64decode(token + relleno))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Cursor de paginación inválido: {e}") from e
+    if not isinstance(clave, list) or len(clave) != longitud:
+        raise ValueError("Cursor de paginación inválido para este listado")
+    return clave
+
+
+def build_page(filas: List[tuple], tamano: int, clave: Callable[[tuple], Sequence[Any]],
+               convertir: Callable[[tuple], Dict]) -> Dict:
+    """Construye la página a partir de ``tamano + 1`` filas leídas.
+
+    La fila sobrante solo indica que hay más resultados; el cursor
+    siguiente se calcula con la última fila entregada.
+
+    Returns:
+        Diccionario con 'items' (filas convertidas) y 'siguiente'
+        (token de la página siguiente o None si es la última)
+    """
+    hay_mas = len(filas) > tamano
+    filas = filas[:tamano]
+    return {
+        'items': [convertir(fila) for fila in filas],
+        'siguiente': encode_cursor(clave(filas[-1])) if hay_mas else None
+    }
@@ -1,7 +1,11 @@
+import json
 import sqlite3
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from datetime import date
 import logging
 
+from .pagination import build_page, decode_cursor, page_size
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,61 +18,81 @@ class Recibo:
         self.db = db
 
     def generar_recibos_mes(self, mes: int, anio: int) -> int:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        return self.generar_recibos_periodo([(mes, anio)])['creados']
 
-        cursor.execute("SELECT id_cliente FROM clientes WHERE tipo_usuario = 'cliente'")
-        clientes = cursor.fetchall()
+    def generar_recibos_periodo(self, periodos: List[Tuple[int, int]],
+                                monto: Optional[float] = None) -> Dict:
+        """Emite los recibos de varios meses con una sola sentencia.
 
-        generados = 0
-        for (id_cliente,) in clientes:
-            try:
-                cursor.execute('''
-                               INSERT INTO recibos (id_cliente, mes, anio, monto)
-                               VALUES (?, ?, ?, ?)
-                               ''', (id_cliente, mes, anio, self.MONTO_MENSUAL))
-                generados += 1
-            except sqlite3.IntegrityError:
-                pass
+        Cada cliente recibe un recibo por mes; los que ya existen se omiten
+        mediante ``ON CONFLICT DO NOTHING`` sobre UNIQUE (id_cliente, mes, anio),
+        sin viajes de ida y vuelta por cliente.
+
+        Args:
+            periodos: Pares (mes, anio) a facturar
+            monto: Importe de cada recibo (por defecto MONTO_MENSUAL)
+
+        Returns:
+            Diccionario con 'creados', 'omitidos' (ya existían) y 'periodos'
+        """
+        periodos = sorted(set(periodos), key=lambda p: (p[1], p[0]))
+        if not periodos:
+            return {'creados': 0, 'omitidos': 0, 'periodos': 0}
+        if monto is None:
+            monto = self.MONTO_MENSUAL
+        lista = json.dumps([[mes, anio] for mes, anio in periodos])
+
+        with self.db.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM clientes WHERE tipo_usuario = 'cliente'")
+            candidatos = cursor.fetchone()[0] * len(periodos)
+
+            cursor.execute('''
+                           INSERT INTO recibos (id_cliente, mes, anio, monto)
+                           SELECT c.id_cliente,
+                                  json_extract(p.value, '$[0]'),
+                                  json_extract(p.value, '$[1]'),
+                                  ?
+                           FROM clientes c
+                                    CROSS JOIN json_each(?) p
+                           WHERE c.tipo_usuario = 'cliente'
+                           ON CONFLICT (id_cliente, mes, anio) DO NOTHING
+                           ''', (monto, lista))
+            creados = cursor.rowcount
 
-        conn.commit()
-        conn.close()
-        return generados
+        return {'creados': creados, 'omitidos': candidatos - creados, 'periodos': len(periodos)}
 
     def obtener_recibos_cliente(self, id_cliente: int) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT id_recibo, mes, anio, monto, fecha_emision, estado
-                       FROM recibos
-                       WHERE id_cliente = ?
-                       ORDER BY anio DESC, mes DESC
-                       ''', (id_cliente,))
-
-        recibos = []
-        for row in cursor.fetchall():
-            recibos.append({
-                'id': row[0],
-                'mes': row[1],
-                'anio': row[2],
-                'monto': row[3],
-                'fecha_emision': row[4],
-                'estado': row[5]
-            })
-        conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT id_recibo, mes, anio, monto, fecha_emision, estado
+                           FROM recibos
+                           WHERE id_cliente = ?
+                           ORDER BY anio DESC, mes DESC
+                           ''', (id_cliente,))
+
+            recibos = []
+            for row in cursor.fetchall():
+                recibos.append({
+                    'id': row[0],
+                    'mes': row[1],
+                    'anio': row[2],
+                    'monto': row[3],
+                    'fecha_emision': row[4],
+                    'estado': row[5]
+                })
         return recibos
 
     def obtener_por_id(self, id_recibo: int) -> Optional[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT id_recibo, id_cliente, mes, anio, monto, fecha_emision, estado
-                       FROM recibos
-                       WHERE id_recibo = ?
-                       ''', (id_recibo,))
-
-        result = cursor.fetchone()
-        conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT id_recibo, id_cliente, mes, anio, monto, fecha_emision, estado
+                           FROM recibos
+                           WHERE id_recibo = ?
+                           ''', (id_recibo,))
+            result = cursor.fetchone()
 
         if result:
             return {
@@ -84,15 +108,13 @@ class Recibo:
 
     def marcar_pagado(self, id_recibo: int) -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           UPDATE recibos
-                           SET estado = 'pagado'
-                           WHERE id_recibo = ?
-                           ''', (id_recibo,))
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               UPDATE recibos
+                               SET estado = 'pagado'
+                               WHERE id_recibo = ?
+                               ''', (id_recibo,))
             return True
         except:
             return False
@@ -100,23 +122,21 @@ class Recibo:
     def crear(self, recibo_data: Dict) -> Optional[int]:
         """Crea un nuevo recibo con los datos proporcionados."""
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                           INSERT INTO recibos (id_cliente, mes, anio, monto, estado)
-                           VALUES (?, ?, ?, ?, ?)
-                           ''', (
-                               recibo_data.get('id_cliente'),
-                               recibo_data.get('mes'),
-                               recibo_data.get('anio'),
-                               recibo_data.get('monto'),
-                               recibo_data.get('estado', 'pendiente')
-                           ))
-            
-            recibo_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                               INSERT INTO recibos (id_cliente, mes, anio, monto, estado)
+                               VALUES (?, ?, ?, ?, ?)
+                               ''', (
+                                   recibo_data.get('id_cliente'),
+                                   recibo_data.get('mes'),
+                                   recibo_data.get('anio'),
+                                   recibo_data.get('monto'),
+                                   recibo_data.get('estado', 'pendiente')
+                               ))
+                
+                recibo_id = cursor.lastrowid
             
             return recibo_id
         except Exception as e:
@@ -125,86 +145,262 @@ class Recibo:
 
     def registrar_pago(self, id_recibo: int, monto: float, metodo_pago: str = "Efectivo") -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute('''
-                           INSERT INTO pagos (id_recibo, monto, metodo_pago)
-                           VALUES (?, ?, ?)
-                           ''', (id_recibo, monto, metodo_pago))
+                cursor.execute('''
+                               INSERT INTO pagos (id_recibo, monto, metodo_pago)
+                               VALUES (?, ?, ?)
+                               ''', (id_recibo, monto, metodo_pago))
 
-            cursor.execute('''
-                           UPDATE recibos
-                           SET estado = 'pagado'
-                           WHERE id_recibo = ?
-                           ''', (id_recibo,))
+                cursor.execute('''
+                               UPDATE recibos
+                               SET estado = 'pagado'
+                               WHERE id_recibo = ?
+                               ''', (id_recibo,))
 
-            conn.commit()
-            conn.close()
             return True
         except:
             return False
 
-    def obtener_morosos(self) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT DISTINCT c.id_cliente,
-                                       c.nombre,
-                                       c.apellido,
-                                       c.dni,
-                                       c.telefono,
-                                       COUNT(r.id_recibo) as recibos_pendientes,
-                                       SUM(r.monto)       as deuda_total
-                       FROM clientes c
-                                JOIN recibos r ON c.id_cliente = r.id_cliente
-                       WHERE r.estado = 'pendiente'
-                       GROUP BY c.id_cliente
-                       ORDER BY deuda_total DESC
-                       ''')
-
-        morosos = []
-        for row in cursor.fetchall():
-            morosos.append({
-                'id': row[0],
-                'nombre': row[1],
-                'apellido': row[2],
-                'dni': row[3],
-                'telefono': row[4],
-                'recibos_pendientes': row[5],
-                'deuda_total': row[6]
-            })
-        conn.close()
-        return morosos
+    def obtener_totales_financieros(self) -> Dict:
+        """Totales de recibos y cobros leídos de ``resumen_financiero``."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT TOTAL(recibos_pendientes),
+                                  TOTAL(monto_pendiente),
+                                  TOTAL(recibos_pagados),
+                                  TOTAL(monto_pagado),
+                                  TOTAL(pagos),
+                                  TOTAL(monto_cobrado)
+                           FROM resumen_financiero
+                           ''')
+            row = cursor.fetchone()
+
+        return {
+            'recibos_pendientes': int(row[0]),
+            'monto_pendiente': row[1],
+            'recibos_pagados': int(row[2]),
+            'monto_pagado': row[3],
+            'pagos': int(row[4]),
+            'monto_cobrado': row[5]
+        }
+
+    def obtener_resumen_mensual(self, anio: Optional[int] = None) -> List[Dict]:
+        """Filas de ``resumen_financiero`` por mes, de la más reciente a la más antigua."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT anio, mes, recibos_pendientes, monto_pendiente,
+                                  recibos_pagados, monto_pagado, pagos, monto_cobrado
+                           FROM resumen_financiero
+                           WHERE ? IS NULL OR anio = ?
+                           ORDER BY anio DESC, mes DESC
+                           ''', (anio, anio))
+
+            meses = []
+            for row in cursor.fetchall():
+                meses.append({
+                    'anio': row[0],
+                    'mes': row[1],
+                    'recibos_pendientes': row[2],
+                    'monto_pendiente': row[3],
+                    'recibos_pagados': row[4],
+                    'monto_pagado': row[5],
+                    'pagos': row[6],
+                    'monto_cobrado': row[7]
+                })
+        return meses
+
+    def reconstruir_resumen_financiero(self) -> int:
+        return self.db.rebuild_financial_summary()
+
+    # Criterios de orden de morosos: (expresión, descendente)
+    ORDENES_MOROSOS = {
+        'deuda': ('m.deuda_total', True),
+        'recibos': ('m.recibos_pendientes', True),
+        'antiguedad': ('m.periodo_mas_antiguo', False),
+        'apellido': ("c.apellido || ' ' || c.nombre", False),
+    }
+
+    def _consultar_morosos(self, orden: str, fecha_referencia: Optional[str],
+                           clave: Optional[List] = None, limite: Optional[int] = None) -> List[tuple]:
+        """Agrupa los recibos pendientes por cliente en una sola consulta.
+
+        La antigüedad de un recibo se cuenta desde el día 1 de su mes y se
+        reparte en tramos de 0-30, 31-60, 61-90 y más de 90 días.
+        """
+        expresion, descendente = self.ORDENES_MOROSOS[orden]
+        sentido = 'DESC' if descendente else 'ASC'
+        where, params = '', [fecha_referencia or date.today().isoformat()]
+        if clave is not None:
+            where = f"WHERE ({expresion}, c.id_cliente) {'<' if descendente else '>'} (?, ?)"
+            params += clave
+        limit = ''
+        if limite is not None:
+            limit = 'LIMIT ?'
+            params.append(limite)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                           WITH pendientes AS (SELECT id_cliente,
+                                                      monto,
+                                                      anio * 100 + mes AS periodo,
+                                                      julianday(?) - julianday(printf('%04d-%02d-01', anio, mes)) AS dias
+                                               FROM recibos
+                                               WHERE estado = 'pendiente'),
+                                m AS (SELECT id_cliente,
+                                             COUNT(*)                                              AS recibos_pendientes,
+                                             TOTAL(monto)                                          AS deuda_total,
+                                             MIN(periodo)                                          AS periodo_mas_antiguo,
+                                             MAX(dias)                                             AS dias_mora,
+                                             TOTAL(monto) FILTER (WHERE dias <= 30)                AS deuda_0_30,
+                                             TOTAL(monto) FILTER (WHERE dias > 30 AND dias <= 60)  AS deuda_31_60,
+                                             TOTAL(monto) FILTER (WHERE dias > 60 AND dias <= 90)  AS deuda_61_90,
+                                             TOTAL(monto) FILTER (WHERE dias > 90)                 AS deuda_mas_90
+                                      FROM pendientes
+                                      GROUP BY id_cliente)
+                           SELECT c.id_cliente,
+                                  c.nombre,
+                                  c.apellido,
+                                  c.dni,
+                                  c.telefono,
+                                  c.email,
+                                  m.recibos_pendientes,
+                                  m.deuda_total,
+                                  m.periodo_mas_antiguo,
+                                  m.dias_mora,
+                                  m.deuda_0_30,
+                                  m.deuda_31_60,
+                                  m.deuda_61_90,
+                                  m.deuda_mas_90,
+                                  {expresion}
+                           FROM m
+                                    JOIN clientes c ON c.id_cliente = m.id_cliente
+                           {where}
+                           ORDER BY {expresion} {sentido}, c.id_cliente {sentido}
+                           {limit}
+                           ''', params)
+            return cursor.fetchall()
+
+    @staticmethod
+    def _fila_moroso(row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'nombre': row[1],
+            'apellido': row[2],
+            'dni': row[3],
+            'telefono': row[4],
+            'email': row[5],
+            'recibos_pendientes': row[6],
+            'deuda_total': row[7],
+            'mes_mas_antiguo': row[8] % 100,
+            'anio_mas_antiguo': row[8] // 100,
+            'dias_mora': max(0, int(row[9])),
+            'antiguedad': {
+                '0_30': row[10],
+                '31_60': row[11],
+                '61_90': row[12],
+                'mas_90': row[13]
+            }
+        }
+
+    def obtener_morosos(self, orden: str = 'deuda',
+                        fecha_referencia: Optional[str] = None) -> List[Dict]:
+        """Clientes con recibos pendientes, con su deuda y antigüedad.
+
+        Args:
+            orden: Una de las claves de ORDENES_MOROSOS
+            fecha_referencia: Fecha ISO desde la que se mide la mora (hoy por defecto)
+        """
+        return [self._fila_moroso(row) for row in self._consultar_morosos(orden, fecha_referencia)]
+
+    def obtener_pagina_morosos(self, orden: str = 'deuda', cursor_pagina: Optional[str] = None,
+                               tamano: Optional[int] = None,
+                               fecha_referencia: Optional[str] = None) -> Dict:
+        """Página de ``obtener_morosos`` paginada por la clave (orden, id_cliente).
+
+        Returns:
+            Diccionario con 'items' y 'siguiente'
+
+        Raises:
+            ValueError: Si el cursor es inválido
+        """
+        tamano = page_size(tamano)
+        clave = decode_cursor(cursor_pagina, 2) if cursor_pagina else None
+        filas = self._consultar_morosos(orden, fecha_referencia, clave, tamano + 1)
+        return build_page(filas, tamano, lambda row: (row[14], row[0]), self._fila_moroso)
+
+    @staticmethod
+    def _fila_recibo(row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'id_cliente': row[1],
+            'cliente': row[2],
+            'mes': row[3],
+            'anio': row[4],
+            'monto': row[5],
+            'estado': row[6],
+            'fecha': row[7]
+        }
 
     def obtener_todos_recibos(self) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT r.id_recibo,
-                              r.id_cliente,
-                              c.nombre || ' ' || c.apellido,
-                              r.mes,
-                              r.anio,
-                              r.monto,
-                              r.estado,
-                              r.fecha_emision
-                       FROM recibos r
-                                JOIN clientes c ON r.id_cliente = c.id_cliente
-                       ORDER BY r.anio DESC, r.mes DESC, c.apellido
-                       ''')
-
-        recibos = []
-        for row in cursor.fetchall():
-            recibos.append({
-                'id': row[0],
-                'id_cliente': row[1],
-                'cliente': row[2],
-                'mes': row[3],
-                'anio': row[4],
-                'monto': row[5],
-                'estado': row[6],
-                'fecha': row[7]
-            })
-        conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT r.id_recibo,
+                                  r.id_cliente,
+                                  c.nombre || ' ' || c.apellido,
+                                  r.mes,
+                                  r.anio,
+                                  r.monto,
+                                  r.estado,
+                                  r.fecha_emision
+                           FROM recibos r
+                                    JOIN clientes c ON r.id_cliente = c.id_cliente
+                           ORDER BY r.anio DESC, r.mes DESC, c.apellido
+                           ''')
+            recibos = [self._fila_recibo(row) for row in cursor.fetchall()]
         return recibos
+
+    def obtener_pagina(self, cursor_pagina: Optional[str] = None,
+                       tamano: Optional[int] = None) -> Dict:
+        """Página de recibos paginada por clave, del periodo más reciente al más antiguo.
+
+        Dentro de un mismo mes se ordena por id_recibo descendente (y no por
+        apellido como ``obtener_todos_recibos``) para que la clave
+        (anio, mes, id_recibo) se resuelva recorriendo ``idx_recibos_periodo``.
+
+        Returns:
+            Diccionario con 'items' y 'siguiente'
+
+        Raises:
+            ValueError: Si el cursor es inválido
+        """
+        tamano = page_size(tamano)
+        where, params = '', []
+        if cursor_pagina:
+            where = 'WHERE (r.anio, r.mes, r.id_recibo) < (?, ?, ?)'
+            params = decode_cursor(cursor_pagina, 3)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                           SELECT r.id_recibo,
+                                  r.id_cliente,
+                                  c.nombre || ' ' || c.apellido,
+                                  r.mes,
+                                  r.anio,
+                                  r.monto,
+                                  r.estado,
+                                  r.fecha_emision
+                           FROM recibos r
+                                    JOIN clientes c ON r.id_cliente = c.id_cliente
+                           {where}
+                           ORDER BY r.anio DESC, r.mes DESC, r.id_recibo DESC
+                           LIMIT ?
+                           ''', (*params, tamano + 1))
+            filas = cursor.fetchall()
+        return build_page(filas, tamano, lambda row: (row[4], row[3], row[0]), self._fila_recibo)
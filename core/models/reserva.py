@@ -1,304 +1,619 @@
+import json
 import sqlite3
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 import logging
 
+from .pagination import build_page, decode_cursor, page_size
+
 logger = logging.getLogger(__name__)
 
+# Texto de la notificación de una reserva aceptada o rechazada: f(reserva, tipo)
+MensajeNotificacion = Callable[[Dict, str], str]
+
 
 class Reserva:
     """Modelo para la entidad Reserva"""
 
     DIAS_SEMANA = ['Lunes', 'Martes', 'Miércoles', 'Jueves', 'Viernes']
+    DURACION_MINUTOS = 30
+
+    # Resultados de aceptar_reservas_lote / rechazar_reservas_lote
+    ACEPTADA = 'aceptada'
+    RECHAZADA = 'rechazada'
+    CONFLICTO = 'conflicto'
+    NO_ENCONTRADA = 'no_encontrada'
+    NO_PENDIENTE = 'no_pendiente'
+    ERROR = 'error'
 
     def __init__(self, db):
         self.db = db
 
+    # Conversión entre la representación de las vistas ('Lunes', 'HH:MM')
+    # y la de la base de datos (día 1-5, minutos desde medianoche)
+    @classmethod
+    def dia_a_numero(cls, dia_semana: str) -> int:
+        """'Lunes' -> 1 ... 'Viernes' -> 5. Lanza ValueError si no es válido."""
+        return cls.DIAS_SEMANA.index(dia_semana) + 1
+
+    @classmethod
+    def numero_a_dia(cls, dia: int) -> str:
+        """1 -> 'Lunes' ... 5 -> 'Viernes'."""
+        return cls.DIAS_SEMANA[dia - 1]
+
+    @staticmethod
+    def hora_a_minutos(hora: str) -> int:
+        """'HH:MM' -> minutos desde medianoche. Lanza ValueError si no es válida."""
+        horas, sep, minutos = hora.partition(':')
+        if not sep or not horas.isdigit() or not minutos.isdigit():
+            raise ValueError(f"Hora inválida: {hora}")
+        horas, minutos = int(horas), int(minutos)
+        if not (0 <= horas <= 23 and 0 <= minutos <= 59):
+            raise ValueError(f"Hora fuera de rango: {hora}")
+        return horas * 60 + minutos
+
+    @staticmethod
+    def minutos_a_hora(minutos: int) -> str:
+        """Minutos desde medianoche -> 'HH:MM' (1440 se muestra como '00:00')."""
+        return f"{(minutos // 60) % 24:02d}:{minutos % 60:02d}"
+
     def crear_reserva(self, id_cliente: int, id_aparato: int, dia_semana: str,
                       hora_inicio: str) -> Tuple[bool, str]:
         if dia_semana not in self.DIAS_SEMANA:
             return False, "Día de la semana no válido"
 
         try:
-            hora_obj = datetime.strptime(hora_inicio, "%H:%M")
-            hora_fin_obj = hora_obj + timedelta(minutes=30)
-            hora_fin = hora_fin_obj.strftime("%H:%M")
-        except:
+            inicio = self.hora_a_minutos(hora_inicio)
+        except ValueError:
             return False, "Formato de hora inválido"
+        dia = self.dia_a_numero(dia_semana)
 
-        if not self.verificar_disponibilidad(id_aparato, dia_semana, hora_inicio):
-            return False, "El aparato no está disponible en ese horario"
-
+        # La disponibilidad la comprueba ReservationService con el índice en
+        # memoria; la unicidad de la franja la garantiza el índice único
+        # parcial al aceptar (uq_reservas_franja_aceptada)
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                           INSERT INTO reservas (id_cliente, id_aparato, dia_semana, hora_inicio, hora_fin, estado)
-                           VALUES (?, ?, ?, ?, ?, 'pendiente')
-                           ''', (id_cliente, id_aparato, dia_semana, hora_inicio, hora_fin))
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                               INSERT INTO reservas (id_cliente, id_aparato, dia, inicio_min, fin_min, estado)
+                               VALUES (?, ?, ?, ?, ?, 'pendiente')
+                               ''', (id_cliente, id_aparato, dia, inicio, inicio + self.DURACION_MINUTOS))
             return True, "Solicitud de reserva enviada. El administrador la revisará"
         except Exception as e:
             return False, f"Error al crear reserva: {str(e)}"
 
     def verificar_disponibilidad(self, id_aparato: int, dia_semana: str, hora_inicio: str) -> bool:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT COUNT(*)
-                       FROM reservas
-                       WHERE id_aparato = ?
-                         AND dia_semana = ?
-                         AND hora_inicio = ?
-                         AND estado = 'aceptada'
-                       ''', (id_aparato, dia_semana, hora_inicio))
-        count = cursor.fetchone()[0]
-        conn.close()
+        return self._franja_libre(id_aparato, self.dia_a_numero(dia_semana),
+                                  self.hora_a_minutos(hora_inicio))
+
+    def _franja_libre(self, id_aparato: int, dia: int, inicio: int) -> bool:
+        """Comprueba que no haya una reserva aceptada en la franja (valores enteros)."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT COUNT(*)
+                           FROM reservas
+                           WHERE id_aparato = ?
+                             AND dia = ?
+                             AND inicio_min = ?
+                             AND estado = 'aceptada'
+                           ''', (id_aparato, dia, inicio))
+            count = cursor.fetchone()[0]
         return count == 0
 
     def obtener_reservas_cliente(self, id_cliente: int) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT r.id_reserva, a.nombre, a.tipo, r.dia_semana, r.hora_inicio, r.hora_fin, r.fecha_reserva, r.estado
-                       FROM reservas r
-                                JOIN aparatos a ON r.id_aparato = a.id_aparato
-                       WHERE r.id_cliente = ?
-                       ORDER BY CASE r.dia_semana
-                                    WHEN 'Lunes' THEN 1
-                                    WHEN 'Martes' THEN 2
-                                    WHEN 'Miércoles' THEN 3
-                                    WHEN 'Jueves' THEN 4
-                                    WHEN 'Viernes' THEN 5
-                                    END,
-                                r.hora_inicio
-                       ''', (id_cliente,))
-
-        reservas = []
-        for row in cursor.fetchall():
-            reservas.append({
-                'id': row[0],
-                'aparato': row[1],
-                'tipo': row[2],
-                'dia': row[3],
-                'hora_inicio': row[4],
-                'hora_fin': row[5],
-                'fecha_reserva': row[6],
-                'estado': row[7]
-            })
-        conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT r.id_reserva, a.nombre, a.tipo, r.dia, r.inicio_min, r.fin_min, r.fecha_reserva, r.estado
+                           FROM reservas r
+                                    JOIN aparatos a ON r.id_aparato = a.id_aparato
+                           WHERE r.id_cliente = ?
+                           ORDER BY r.dia, r.inicio_min
+                           ''', (id_cliente,))
+
+            reservas = []
+            for row in cursor.fetchall():
+                reservas.append({
+                    'id': row[0],
+                    'aparato': row[1],
+                    'tipo': row[2],
+                    'dia': self.numero_a_dia(row[3]),
+                    'hora_inicio': self.minutos_a_hora(row[4]),
+                    'hora_fin': self.minutos_a_hora(row[5]),
+                    'fecha_reserva': row[6],
+                    'estado': row[7]
+                })
         return reservas
 
     def obtener_ocupacion_dia(self, dia_semana: str) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT a.nombre,
-                              a.tipo,
-                              r.hora_inicio,
-                              r.hora_fin,
-                              c.nombre || ' ' || c.apellido as cliente
-                       FROM reservas r
-                                JOIN aparatos a ON r.id_aparato = a.id_aparato
-                                JOIN clientes c ON r.id_cliente = c.id_cliente
-                       WHERE r.dia_semana = ?
-                       ORDER BY a.nombre, r.hora_inicio
-                       ''', (dia_semana,))
+        dia = self.dia_a_numero(dia_semana)
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT a.nombre,
+                                  a.tipo,
+                                  r.inicio_min,
+                                  r.fin_min,
+                                  c.nombre || ' ' || c.apellido as cliente
+                           FROM reservas r
+                                    JOIN aparatos a ON r.id_aparato = a.id_aparato
+                                    JOIN clientes c ON r.id_cliente = c.id_cliente
+                           WHERE r.dia = ?
+                           ORDER BY a.nombre, r.inicio_min
+                           ''', (dia,))
 
-        ocupacion = []
-        for row in cursor.fetchall():
-            ocupacion.append({
-                'aparato': row[0],
-                'tipo': row[1],
-                'hora_inicio': row[2],
-                'hora_fin': row[3],
-                'cliente': row[4]
-            })
-        conn.close()
+            ocupacion = []
+            for row in cursor.fetchall():
+                ocupacion.append({
+                    'aparato': row[0],
+                    'tipo': row[1],
+                    'hora_inicio': self.minutos_a_hora(row[2]),
+                    'hora_fin': self.minutos_a_hora(row[3]),
+                    'cliente': row[4]
+                })
         return ocupacion
 
-    def obtener_todas(self) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT r.id_reserva,
-                              c.nombre || ' ' || c.apellido,
-                              a.nombre,
-                              r.dia_semana,
-                              r.hora_inicio,
-                              r.hora_fin,
-                              r.fecha_reserva,
-                              r.estado
-                       FROM reservas r
-                                JOIN clientes c ON r.id_cliente = c.id_cliente
-                                JOIN aparatos a ON r.id_aparato = a.id_aparato
-                       ORDER BY r.fecha_reserva DESC, r.dia_semana, r.hora_inicio
-                       ''')
+    # Listados de administración: consulta base y filtros de paginación
+    _SQL_TODAS = '''
+                 SELECT r.id_reserva,
+                        c.nombre || ' ' || c.apellido,
+                        a.nombre,
+                        r.dia,
+                        r.inicio_min,
+                        r.fin_min,
+                        r.fecha_reserva,
+                        r.estado
+                 FROM reservas r
+                          JOIN clientes c ON r.id_cliente = c.id_cliente
+                          JOIN aparatos a ON r.id_aparato = a.id_aparato
+                 {where}
+                 ORDER BY r.fecha_reserva DESC, r.dia, r.inicio_min, r.id_reserva
+                 '''
 
-        reservas = []
-        for row in cursor.fetchall():
-            reservas.append({
-                'id': row[0],
-                'cliente': row[1],
-                'aparato': row[2],
-                'dia': row[3],
-                'hora_inicio': row[4],
-                'hora_fin': row[5],
-                'fecha': row[6],
-                'estado': row[7]
-            })
-        conn.close()
+    _SQL_POR_ESTADO = '''
+                      SELECT r.id_reserva,
+                             c.nombre || ' ' || c.apellido,
+                             a.nombre,
+                             r.dia,
+                             r.inicio_min,
+                             r.fin_min,
+                             r.fecha_reserva,
+                             r.estado
+                      FROM reservas r
+                               JOIN clientes c ON r.id_cliente = c.id_cliente
+                               JOIN aparatos a ON r.id_aparato = a.id_aparato
+                      WHERE r.estado = ? {where}
+                      ORDER BY r.fecha_reserva DESC, r.id_reserva DESC
+                      '''
+
+    _SQL_PENDIENTES = '''
+                      SELECT r.id_reserva,
+                             c.nombre || ' ' || c.apellido as cliente,
+                             c.id_cliente,
+                             a.nombre,
+                             r.dia,
+                             r.inicio_min,
+                             r.fin_min,
+                             r.fecha_reserva
+                      FROM reservas r
+                               JOIN clientes c ON r.id_cliente = c.id_cliente
+                               JOIN aparatos a ON r.id_aparato = a.id_aparato
+                      WHERE r.estado = 'pendiente' {where}
+                      ORDER BY r.fecha_reserva ASC, r.id_reserva ASC
+                      '''
+
+    def _fila_todas(self, row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'cliente': row[1],
+            'aparato': row[2],
+            'dia': self.numero_a_dia(row[3]),
+            'hora_inicio': self.minutos_a_hora(row[4]),
+            'hora_fin': self.minutos_a_hora(row[5]),
+            'fecha': row[6],
+            'estado': row[7]
+        }
+
+    def _fila_pendiente(self, row: tuple) -> Dict:
+        return {
+            'id': row[0],
+            'cliente': row[1],
+            'id_cliente': row[2],
+            'aparato': row[3],
+            'dia': self.numero_a_dia(row[4]),
+            'hora_inicio': self.minutos_a_hora(row[5]),
+            'hora_fin': self.minutos_a_hora(row[6]),
+            'fecha': row[7]
+        }
+
+    def obtener_todas(self) -> List[Dict]:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_TODAS.format(where=''))
+            reservas = [self._fila_todas(row) for row in cursor.fetchall()]
         return reservas
 
+    def obtener_pagina(self, cursor_pagina: Optional[str] = None,
+                       tamano: Optional[int] = None) -> Dict:
+        """Página de ``obtener_todas`` paginada por clave.
+
+        Recorre ``idx_reservas_fecha`` a partir de la clave
+        (fecha_reserva DESC, dia, inicio_min, id_reserva) de la última fila
+        de la página anterior.
+
+        Args:
+            cursor_pagina: Token 'siguiente' de la página anterior (None = primera)
+            tamano: Filas por página
+
+        Returns:
+            Diccionario con 'items' y 'siguiente'
+
+        Raises:
+            ValueError: Si el cursor es inválido
+        """
+        tamano = page_size(tamano)
+        where, params = '', []
+        if cursor_pagina:
+            fecha, dia, inicio, id_reserva = decode_cursor(cursor_pagina, 4)
+            where = ('WHERE r.fecha_reserva <= ? AND (r.fecha_reserva < ? '
+                     'OR (r.dia, r.inicio_min, r.id_reserva) > (?, ?, ?))')
+            params = [fecha, fecha, dia, inicio, id_reserva]
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_TODAS.format(where=where) + ' LIMIT ?', (*params, tamano + 1))
+            filas = cursor.fetchall()
+        return build_page(filas, tamano, lambda row: (row[6], row[3], row[4], row[0]),
+                          self._fila_todas)
+
+    def obtener_por_id(self, id_reserva: int) -> Optional[Dict]:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT r.id_reserva,
+                                  r.id_cliente,
+                                  r.id_aparato,
+                                  a.nombre,
+                                  r.dia,
+                                  r.inicio_min,
+                                  r.fin_min,
+                                  r.estado
+                           FROM reservas r
+                                    JOIN aparatos a ON r.id_aparato = a.id_aparato
+                           WHERE r.id_reserva = ?
+                           ''', (id_reserva,))
+            result = cursor.fetchone()
+
+        if result:
+            return {
+                'id': result[0],
+                'id_cliente': result[1],
+                'id_aparato': result[2],
+                'aparato': result[3],
+                'dia': self.numero_a_dia(result[4]),
+                'hora_inicio': self.minutos_a_hora(result[5]),
+                'hora_fin': self.minutos_a_hora(result[6]),
+                'estado': result[7]
+            }
+        return None
+
+    def obtener_franjas_aceptadas(self) -> List[Tuple[int, int, int]]:
+        """Franjas ocupadas por reservas aceptadas como (id_aparato, dia, inicio_min)."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT id_aparato, dia, inicio_min
+                           FROM reservas
+                           WHERE estado = 'aceptada'
+                           ''')
+            return [tuple(row) for row in cursor.fetchall()]
+
     def obtener_reservas_por_aparato(self, id_aparato: int) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT r.id_reserva, r.id_aparato
-                       FROM reservas r
-                       WHERE r.id_aparato = ?
-                       ''', (id_aparato,))
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT r.id_reserva, r.id_aparato
+                           FROM reservas r
+                           WHERE r.id_aparato = ?
+                           ''', (id_aparato,))
 
-        reservas = []
-        for row in cursor.fetchall():
-            reservas.append({
-                'id': row[0],
-                'id_aparato': row[1]
-            })
-        conn.close()
+            reservas = []
+            for row in cursor.fetchall():
+                reservas.append({
+                    'id': row[0],
+                    'id_aparato': row[1]
+                })
         return reservas
 
     def eliminar_reserva(self, id_reserva: int) -> bool:
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM reservas WHERE id_reserva = ?', (id_reserva,))
-            conn.commit()
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM reservas WHERE id_reserva = ?', (id_reserva,))
             return True
-        except:
+        except Exception as e:
+            logger.error(f"Error al eliminar reserva {id_reserva}: {e}")
             return False
 
     def aceptar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
+        resultado = self.aceptar_reserva_detallada(id_reserva)
+        return resultado['resultado'] == self.ACEPTADA, resultado['mensaje']
+
+    def aceptar_reserva_detallada(self, id_reserva: int) -> Dict:
+        """Acepta una reserva pendiente en una única transacción de escritura.
+
+        Returns:
+            Resultado con la forma descrita en ``aceptar_reservas_lote``
+        """
+        return self.aceptar_reservas_lote([id_reserva])[0]
+
+    def aceptar_reservas_lote(self, ids_reserva: List[int],
+                              mensaje: Optional[MensajeNotificacion] = None) -> List[Dict]:
+        """Acepta varias reservas pendientes en una sola transacción.
+
+        La lectura, la comprobación de franjas y los UPDATE se hacen bajo
+        BEGIN IMMEDIATE; el índice único parcial ``uq_reservas_franja_aceptada``
+        garantiza además que nunca haya dos aceptadas en la misma franja.
+        Si varias reservas del lote piden la misma franja gana la de menor
+        id (la solicitud más antigua), independientemente del orden recibido.
+
+        Args:
+            ids_reserva: IDs a aceptar (los repetidos se procesan una vez)
+            mensaje: Si se indica, ``mensaje(reserva, 'aceptada')`` es el texto
+                de la notificación al cliente de cada reserva aceptada; las
+                notificaciones se insertan en la misma transacción
+
+        Returns:
+            Un diccionario por id, en el orden recibido, con 'id',
+            'resultado' (ACEPTADA, CONFLICTO, NO_ENCONTRADA, NO_PENDIENTE o
+            ERROR), 'mensaje', 'conflicto_con' (id de la reserva que ocupa
+            la franja) y 'reserva' (detalles, si existe)
+        """
+        ids = list(dict.fromkeys(ids_reserva))
+        if not ids:
+            return []
+
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Obtener detalles de la reserva
-            cursor.execute('''
-                           SELECT id_cliente, id_aparato, dia_semana, hora_inicio, estado
-                           FROM reservas
-                           WHERE id_reserva = ?
-                           ''', (id_reserva,))
-            reserva = cursor.fetchone()
-            
-            if not reserva:
-                conn.close()
-                return False, "Reserva no encontrada"
-            
-            id_cliente, id_aparato, dia_semana, hora_inicio, estado = reserva
-            
-            if estado != 'pendiente':
-                conn.close()
-                return False, f"La reserva ya fue {estado}"
-            
-            # Verificar disponibilidad antes de aceptar
-            if not self.verificar_disponibilidad(id_aparato, dia_semana, hora_inicio):
-                conn.close()
-                return False, "El aparato ya está reservado en ese horario"
-            
-            # Actualizar estado a aceptada
-            cursor.execute('''
-                           UPDATE reservas
-                           SET estado = 'aceptada'
-                           WHERE id_reserva = ?
-                           ''', (id_reserva,))
-            conn.commit()
-            conn.close()
-            
-            return True, "Reserva aceptada exitosamente"
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                detalles = self._detalles_lote(cursor, ids)
+
+                # Franjas ya ocupadas en los aparatos implicados
+                aparatos = sorted({reserva['id_aparato'] for reserva, _, _ in detalles.values()})
+                cursor.execute('''
+                               SELECT id_aparato, dia, inicio_min, id_reserva
+                               FROM reservas
+                               WHERE estado = 'aceptada'
+                                 AND id_aparato IN (SELECT value FROM json_each(?))
+                               ''', (json.dumps(aparatos),))
+                ocupadas = {(row[0], row[1], row[2]): row[3] for row in cursor.fetchall()}
+
+                resultados = {}
+                ganadoras = []
+                for id_reserva in sorted(ids):
+                    if id_reserva not in detalles:
+                        resultados[id_reserva] = self._resultado(
+                            id_reserva, self.NO_ENCONTRADA, "Reserva no encontrada")
+                        continue
+
+                    reserva, dia, inicio = detalles[id_reserva]
+                    if reserva['estado'] != 'pendiente':
+                        resultados[id_reserva] = self._resultado(
+                            id_reserva, self.NO_PENDIENTE, f"La reserva ya fue {reserva['estado']}",
+                            reserva=reserva)
+                        continue
+
+                    franja = (reserva['id_aparato'], dia, inicio)
+                    if franja in ocupadas:
+                        resultados[id_reserva] = self._resultado(
+                            id_reserva, self.CONFLICTO, "El aparato ya está reservado en ese horario",
+                            conflicto_con=ocupadas[franja], reserva=reserva)
+                        continue
+
+                    ocupadas[franja] = id_reserva
+                    ganadoras.append((id_reserva,))
+                    reserva['estado'] = 'aceptada'
+                    resultados[id_reserva] = self._resultado(
+                        id_reserva, self.ACEPTADA, "Reserva aceptada exitosamente", reserva=reserva)
+
+                cursor.executemany('''
+                                   UPDATE reservas
+                                   SET estado = 'aceptada'
+                                   WHERE id_reserva = ?
+                                   ''', ganadoras)
+                if mensaje is not None:
+                    self._notificar_lote(cursor, [resultados[i]['reserva'] for i, in ganadoras],
+                                         self.ACEPTADA, mensaje)
         except Exception as e:
-            return False, f"Error al aceptar reserva: {str(e)}"
+            logger.error(f"Error al aceptar reservas {ids}: {e}")
+            return [self._resultado(i, self.ERROR, f"Error al aceptar reserva: {str(e)}") for i in ids]
+
+        return [resultados[i] for i in ids]
 
     def rechazar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
+        resultado = self.rechazar_reserva_detallada(id_reserva)
+        return resultado['resultado'] == self.RECHAZADA, resultado['mensaje']
+
+    def rechazar_reserva_detallada(self, id_reserva: int) -> Dict:
+        """Rechaza una reserva pendiente.
+
+        Returns:
+            Resultado con la forma descrita en ``aceptar_reservas_lote``
+        """
+        return self.rechazar_reservas_lote([id_reserva])[0]
+
+    def rechazar_reservas_lote(self, ids_reserva: List[int],
+                               mensaje: Optional[MensajeNotificacion] = None) -> List[Dict]:
+        """Rechaza varias reservas pendientes en una sola transacción.
+
+        Args:
+            ids_reserva: IDs a rechazar (los repetidos se procesan una vez)
+            mensaje: Como en ``aceptar_reservas_lote``, con 'rechazada'
+
+        Returns:
+            Un diccionario por id, en el orden recibido, con 'id',
+            'resultado' (RECHAZADA, NO_ENCONTRADA, NO_PENDIENTE o ERROR),
+            'mensaje', 'conflicto_con' (siempre None) y 'reserva'
+        """
+        ids = list(dict.fromkeys(ids_reserva))
+        if not ids:
+            return []
+
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            # Obtener detalles de la reserva
-            cursor.execute('''
-                           SELECT estado
-                           FROM reservas
-                           WHERE id_reserva = ?
-                           ''', (id_reserva,))
-            result = cursor.fetchone()
-            
-            if not result:
-                conn.close()
-                return False, "Reserva no encontrada"
-            
-            estado = result[0]
-            
-            if estado != 'pendiente':
-                conn.close()
-                return False, f"La reserva ya fue {estado}"
-            
-            # Actualizar estado a rechazada
-            cursor.execute('''
-                           UPDATE reservas
-                           SET estado = 'rechazada'
-                           WHERE id_reserva = ?
-                           ''', (id_reserva,))
-            conn.commit()
-            conn.close()
-            
-            return True, "Reserva rechazada"
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                detalles = self._detalles_lote(cursor, ids)
+
+                resultados = {}
+                rechazadas = []
+                for id_reserva in ids:
+                    if id_reserva not in detalles:
+                        resultados[id_reserva] = self._resultado(
+                            id_reserva, self.NO_ENCONTRADA, "Reserva no encontrada")
+                        continue
+
+                    reserva = detalles[id_reserva][0]
+                    if reserva['estado'] != 'pendiente':
+                        resultados[id_reserva] = self._resultado(
+                            id_reserva, self.NO_PENDIENTE, f"La reserva ya fue {reserva['estado']}",
+                            reserva=reserva)
+                        continue
+
+                    rechazadas.append((id_reserva,))
+                    reserva['estado'] = 'rechazada'
+                    resultados[id_reserva] = self._resultado(
+                        id_reserva, self.RECHAZADA, "Reserva rechazada", reserva=reserva)
+
+                cursor.executemany('''
+                                   UPDATE reservas
+                                   SET estado = 'rechazada'
+                                   WHERE id_reserva = ?
+                                   ''', rechazadas)
+                if mensaje is not None:
+                    self._notificar_lote(cursor, [resultados[i]['reserva'] for i, in rechazadas],
+                                         self.RECHAZADA, mensaje)
         except Exception as e:
-            return False, f"Error al rechazar reserva: {str(e)}"
+            logger.error(f"Error al rechazar reservas {ids}: {e}")
+            return [self._resultado(i, self.ERROR, f"Error al rechazar reserva: {str(e)}") for i in ids]
 
-    def obtener_reservas_pendientes(self) -> List[Dict]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        return [resultados[i] for i in ids]
+
+    @staticmethod
+    def _notificar_lote(cursor, reservas: List[Dict], tipo: str, mensaje: MensajeNotificacion) -> None:
+        """Inserta con un solo executemany las notificaciones de las reservas procesadas."""
+        cursor.executemany('''
+                           INSERT INTO notificaciones (id_cliente, id_reserva, tipo, mensaje)
+                           VALUES (?, ?, ?, ?)
+                           ''', [(reserva['id_cliente'], reserva['id'], tipo, mensaje(reserva, tipo))
+                                 for reserva in reservas])
+
+    @staticmethod
+    def _resultado(id_reserva: int, resultado: str, mensaje: str,
+                   conflicto_con: Optional[int] = None, reserva: Optional[Dict] = None) -> Dict:
+        return {
+            'id': id_reserva,
+            'resultado': resultado,
+            'mensaje': mensaje,
+            'conflicto_con': conflicto_con,
+            'reserva': reserva
+        }
+
+    def _detalles_lote(self, cursor, ids: List[int]) -> Dict[int, Tuple[Dict, int, int]]:
+        """Carga en una consulta los detalles de varias reservas.
+
+        Returns:
+            id_reserva -> (detalles, dia, inicio_min)
+        """
         cursor.execute('''
-                       SELECT r.id_reserva,
-                              c.nombre || ' ' || c.apellido as cliente,
-                              c.id_cliente,
-                              a.nombre,
-                              r.dia_semana,
-                              r.hora_inicio,
-                              r.hora_fin,
-                              r.fecha_reserva
+                       SELECT r.id_reserva, r.id_cliente, r.id_aparato, a.nombre,
+                              r.dia, r.inicio_min, r.fin_min, r.estado
                        FROM reservas r
-                                JOIN clientes c ON r.id_cliente = c.id_cliente
                                 JOIN aparatos a ON r.id_aparato = a.id_aparato
-                       WHERE r.estado = 'pendiente'
-                       ORDER BY r.fecha_reserva ASC
-                       ''')
+                       WHERE r.id_reserva IN (SELECT value FROM json_each(?))
+                       ''', (json.dumps(ids),))
 
-        reservas = []
+        detalles = {}
         for row in cursor.fetchall():
-            reservas.append({
+            detalles[row[0]] = ({
                 'id': row[0],
-                'cliente': row[1],
-                'id_cliente': row[2],
+                'id_cliente': row[1],
+                'id_aparato': row[2],
                 'aparato': row[3],
-                'dia': row[4],
-                'hora_inicio': row[5],
-                'hora_fin': row[6],
-                'fecha': row[7]
-            })
-        conn.close()
+                'dia': self.numero_a_dia(row[4]),
+                'hora_inicio': self.minutos_a_hora(row[5]),
+                'hora_fin': self.minutos_a_hora(row[6]),
+                'estado': row[7]
+            }, row[4], row[5])
+        return detalles
+
+    def obtener_reservas_pendientes(self) -> List[Dict]:
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_PENDIENTES.format(where=''))
+            reservas = [self._fila_pendiente(row) for row in cursor.fetchall()]
         return reservas
 
+    def obtener_pagina_pendientes(self, cursor_pagina: Optional[str] = None,
+                                  tamano: Optional[int] = None) -> Dict:
+        """Página de ``obtener_reservas_pendientes`` paginada por clave.
+
+        Recorre ``idx_reservas_estado_fecha`` a partir de la clave
+        (fecha_reserva, id_reserva) de la última fila entregada.
+
+        Returns:
+            Diccionario con 'items' y 'siguiente'
+
+        Raises:
+            ValueError: Si el cursor es inválido
+        """
+        tamano = page_size(tamano)
+        where, params = '', []
+        if cursor_pagina:
+            where = 'AND (r.fecha_reserva, r.id_reserva) > (?, ?)'
+            params = decode_cursor(cursor_pagina, 2)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_PENDIENTES.format(where=where) + ' LIMIT ?',
+                           (*params, tamano + 1))
+            filas = cursor.fetchall()
+        return build_page(filas, tamano, lambda row: (row[7], row[0]), self._fila_pendiente)
+
+    def obtener_pagina_por_estado(self, estado: str, cursor_pagina: Optional[str] = None,
+                                  tamano: Optional[int] = None) -> Dict:
+        """Página de reservas en un estado, de la más reciente a la más antigua.
+
+        Recorre ``idx_reservas_estado_fecha`` hacia atrás a partir de la
+        clave (fecha_reserva, id_reserva) de la última fila entregada.
+
+        Returns:
+            Diccionario con 'items' y 'siguiente' (filas como ``obtener_todas``)
+
+        Raises:
+            ValueError: Si el estado o el cursor son inválidos
+        """
+        if estado not in (self.ACEPTADA, 'pendiente', self.RECHAZADA):
+            raise ValueError(f"Estado de reserva inválido: {estado}")
+        tamano = page_size(tamano)
+        where, params = '', []
+        if cursor_pagina:
+            where = 'AND (r.fecha_reserva, r.id_reserva) < (?, ?)'
+            params = decode_cursor(cursor_pagina, 2)
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_POR_ESTADO.format(where=where) + ' LIMIT ?',
+                           (estado, *params, tamano + 1))
+            filas = cursor.fetchall()
+        return build_page(filas, tamano, lambda row: (row[6], row[0]), self._fila_todas)
+
     def obtener_id_cliente_por_reserva(self, id_reserva: int) -> Optional[int]:
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-                       SELECT id_cliente
-                       FROM reservas
-                       WHERE id_reserva = ?
-                       ''', (id_reserva,))
-        result = cursor.fetchone()
-        conn.close()
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                           SELECT id_cliente
+                           FROM reservas
+                           WHERE id_reserva = ?
+                           ''', (id_reserva,))
+            result = cursor.fetchone()
         return result[0] if result else None
@@ -7,6 +7,9 @@ Contiene servicios especializados para cada área funcional del sistema:
 - ApparatusService: Gestión de aparatos
 - ReservationService: Gestión de reservas
 - PaymentService: Gestión de pagos y recibos
+- StatisticsService: Estadísticas agregadas del panel de administración
+- AvailabilityIndex: Índice en memoria de franjas ocupadas
+- ReadCache: Caché LRU/TTL de lecturas del controlador
 """
 
 from core.services.auth_service import AuthService
@@ -14,11 +17,17 @@ from core.services.client_service import ClientService
 from core.services.apparatus_service import ApparatusService
 from core.services.reservation_service import ReservationService
 from core.services.payment_service import PaymentService
+from core.services.statistics_service import StatisticsService
+from core.services.availability_index import AvailabilityIndex
+from core.services.read_cache import ReadCache
 
 __all__ = [
     'AuthService',
     'ClientService',
     'ApparatusService',
     'ReservationService',
-    'PaymentService'
+    'PaymentService',
+    'StatisticsService',
+    'AvailabilityIndex',
+    'ReadCache'
 ]
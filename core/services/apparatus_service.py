@@ -9,6 +9,7 @@ from infrastructure.exceptions import (
     ValidationError, NotFoundError, BusinessLogicError
 )
 from infrastructure.validators import ValidadorAparato
+from core.events import EventBus, AparatoCreado, AparatoEliminado
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +17,11 @@ logger = logging.getLogger(__name__)
 class ApparatusService:
     """Servicio especializado en gestión de aparatos."""
     
-    def __init__(self, aparato_model, reserva_model):
+    def __init__(self, aparato_model, reserva_model, event_bus: EventBus = None):
         """Inicializa el servicio de aparatos."""
         self.aparato_model = aparato_model
         self.reserva_model = reserva_model
+        self.event_bus = event_bus or EventBus()
     
     def obtener_aparatos(self) -> List[Dict]:
         """Obtiene la lista de todos los aparatos disponibles."""
@@ -50,6 +52,7 @@ class ApparatusService:
             id_aparato = self.aparato_model.crear_aparato(nombre, tipo, descripcion)
             if id_aparato > 0:
                 logger.info(f"Aparato creado exitosamente: {nombre}")
+                self.event_bus.publish(AparatoCreado(id_aparato, nombre, tipo))
                 return True, f"Aparato '{nombre}' creado exitosamente"
             else:
                 raise BusinessLogicError("No se pudo crear el aparato")
@@ -89,6 +92,7 @@ class ApparatusService:
             success = self.aparato_model.eliminar_aparato(id_aparato)
             if success:
                 logger.info(f"Aparato eliminado exitosamente: {id_aparato}")
+                self.event_bus.publish(AparatoEliminado(id_aparato))
                 return True, f"Aparato '{aparato['nombre']}' eliminado exitosamente"
             else:
                 raise BusinessLogicError("No se pudo eliminar el aparato")
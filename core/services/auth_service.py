@@ -3,7 +3,9 @@ Servicio de Autenticación - Gestiona login, logout y autenticación de usuarios
 Responsabilidad única: Autenticación y autorización.
 """
 
-from typing import Optional, Tuple, Dict
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple, Dict
 import logging
 from infrastructure.exceptions import (
     AuthenticationError, AuthorizationError, ValidationError
@@ -12,6 +14,9 @@ from infrastructure.validators import Validador
 
 logger = logging.getLogger(__name__)
 
+# Marca de "sin sesión propia del hilo": se usa la sesión compartida
+_COMPARTIDA = object()
+
 
 class AuthService:
     """Servicio especializado en autenticación y autorización."""
@@ -19,7 +24,39 @@ class AuthService:
     def __init__(self, cliente_model):
         """Inicializa el servicio de autenticación."""
         self.cliente_model = cliente_model
-        self.usuario_actual: Optional[Dict] = None
+        self._usuario: Optional[Dict] = None
+        self._local = threading.local()
+
+    @property
+    def usuario_actual(self) -> Optional[Dict]:
+        """Usuario de la sesión del hilo si hay una abierta con ``sesion``; si no, el compartido."""
+        usuario = getattr(self._local, 'usuario', _COMPARTIDA)
+        return self._usuario if usuario is _COMPARTIDA else usuario
+
+    @usuario_actual.setter
+    def usuario_actual(self, value: Optional[Dict]) -> None:
+        if getattr(self._local, 'usuario', _COMPARTIDA) is _COMPARTIDA:
+            self._usuario = value
+        else:
+            self._local.usuario = value
+
+    @contextmanager
+    def sesion(self, usuario: Optional[Dict]) -> Iterator[None]:
+        """Atiende el bloque con ``usuario`` como usuario actual solo en este hilo.
+
+        Permite que varias peticiones concurrentes (p. ej. del servidor HTTP)
+        compartan el servicio con sesiones distintas; ``login`` y ``logout``
+        dentro del bloque modifican solo la sesión del hilo.
+        """
+        anterior = getattr(self._local, 'usuario', _COMPARTIDA)
+        self._local.usuario = usuario
+        try:
+            yield
+        finally:
+            if anterior is _COMPARTIDA:
+                del self._local.usuario
+            else:
+                self._local.usuario = anterior
     
     def login(self, dni: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
         """Autentica un usuario.
@@ -0,0 +1,106 @@
+"""
+Índice de Disponibilidad - Mapa de bits en memoria de franjas ocupadas.
+Responsabilidad única: Responder consultas de disponibilidad sin ir a la base de datos.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AvailabilityIndex:
+    """Un bitset de 48 franjas de media hora por (aparato, día).
+
+    El bit ``n`` a 1 indica que hay una reserva aceptada que empieza en el
+    minuto ``n * 30``. Solo las reservas aceptadas ocupan franjas; las
+    pendientes y rechazadas no.
+
+    Como en la base de datos (``uq_reservas_franja_aceptada`` y
+    ``Reserva.aceptar_reservas_lote``), una franja está ocupada solo si una
+    reserva aceptada empieza exactamente en ella: cada bit tiene como mucho
+    una reserva dueña, así que liberarla no afecta a ninguna otra. Las
+    reservas que no empiezan en una franja de la rejilla no se indexan; sus
+    horas se consultan en la base de datos.
+
+    El índice refleja las escrituras hechas a través de este proceso. Si
+    otros terminales comparten el archivo, debe reconstruirse cuando cambie
+    la tabla de reservas.
+    """
+
+    MINUTOS_FRANJA = 30
+    FRANJAS_POR_DIA = 24 * 60 // MINUTOS_FRANJA
+    TODAS_LIBRES = (1 << FRANJAS_POR_DIA) - 1
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self._ocupadas: Dict[Tuple[int, int], int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def franja(cls, inicio_min: int) -> Optional[int]:
+        """Número de franja para un minuto de inicio, o None si no está alineado."""
+        if inicio_min % cls.MINUTOS_FRANJA or not 0 <= inicio_min < 24 * 60:
+            return None
+        return inicio_min // cls.MINUTOS_FRANJA
+
+    def rebuild(self, franjas: Iterable[Tuple[int, int, int]]) -> None:
+        """Reconstruye el índice a partir de (id_aparato, dia, inicio_min)."""
+        ocupadas: Dict[Tuple[int, int], int] = {}
+        total = 0
+        for id_aparato, dia, inicio_min in franjas:
+            franja = self.franja(inicio_min)
+            if franja is None:
+                continue
+            clave = (id_aparato, dia)
+            ocupadas[clave] = ocupadas.get(clave, 0) | (1 << franja)
+            total += 1
+        with self._lock:
+            self._ocupadas = ocupadas
+        logger.info(f"Índice de disponibilidad reconstruido con {total} reservas aceptadas")
+
+    def occupy(self, id_aparato: int, dia: int, inicio_min: int) -> None:
+        """Marca como ocupada la franja de una reserva aceptada."""
+        franja = self.franja(inicio_min)
+        if franja is None:
+            return
+        with self._lock:
+            clave = (id_aparato, dia)
+            self._ocupadas[clave] = self._ocupadas.get(clave, 0) | (1 << franja)
+
+    def release(self, id_aparato: int, dia: int, inicio_min: int) -> None:
+        """Libera la franja de una reserva aceptada que deja de estarlo."""
+        franja = self.franja(inicio_min)
+        if franja is None:
+            return
+        with self._lock:
+            clave = (id_aparato, dia)
+            bits = self._ocupadas.get(clave, 0) & ~(1 << franja)
+            if bits:
+                self._ocupadas[clave] = bits
+            else:
+                self._ocupadas.pop(clave, None)
+
+    def remove_aparato(self, id_aparato: int) -> None:
+        """Elimina todas las franjas de un aparato."""
+        with self._lock:
+            for clave in [c for c in self._ocupadas if c[0] == id_aparato]:
+                del self._ocupadas[clave]
+
+    def is_free(self, id_aparato: int, dia: int, franja: int) -> bool:
+        """Indica si una franja está libre. O(1)."""
+        return not (self._ocupadas.get((id_aparato, dia), 0) >> franja) & 1
+
+    def free_mask(self, id_aparato: int, dia: int) -> int:
+        """Bitset de franjas libres (bit a 1 = libre). O(1)."""
+        return self.TODAS_LIBRES & ~self._ocupadas.get((id_aparato, dia), 0)
+
+    def free_slots(self, id_aparato: int, dia: int) -> List[int]:
+        """Minutos de inicio de todas las franjas libres, en orden."""
+        libres = self.free_mask(id_aparato, dia)
+        return [
+            franja * self.MINUTOS_FRANJA
+            for franja in range(self.FRANJAS_POR_DIA)
+            if (libres >> franja) & 1
+        ]
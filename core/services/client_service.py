@@ -3,13 +3,14 @@ Servicio de Clientes - Gestiona operaciones CRUD de clientes.
 Responsabilidad única: Gestión de datos de clientes.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import logging
 from infrastructure.exceptions import (
     ValidationError, NotFoundError, BusinessLogicError
 )
 from infrastructure.validators import ValidadorCliente
 from infrastructure.dtos import UsuarioDTO, ResponseDTO
+from core.events import EventBus, ClienteCreado
 
 logger = logging.getLogger(__name__)
 
@@ -17,9 +18,10 @@ logger = logging.getLogger(__name__)
 class ClientService:
     """Servicio especializado en gestión de clientes."""
     
-    def __init__(self, cliente_model):
+    def __init__(self, cliente_model, event_bus: EventBus = None):
         """Inicializa el servicio de clientes."""
         self.cliente_model = cliente_model
+        self.event_bus = event_bus or EventBus()
     
     def obtener_clientes(self) -> List[Dict]:
         """Obtiene la lista de todos los clientes."""
@@ -31,6 +33,24 @@ class ClientService:
             logger.error(f"Error al obtener clientes: {e}")
             return []
     
+    def obtener_pagina_clientes(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página de clientes ordenados por apellido y nombre.
+        
+        Args:
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            return self.cliente_model.obtener_pagina(cursor, tamano)
+        except ValueError as e:
+            logger.warning(f"Cursor de clientes inválido: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de clientes: {e}")
+        return {'items': [], 'siguiente': None}
+    
     def crear_cliente_admin(self, nombre: str, apellido: str, dni: str, 
                            telefono: str, email: str, password: str, tipo: str = 'cliente') -> Tuple[bool, str]:
         """Crea un nuevo cliente desde el panel de administrador.
@@ -63,6 +83,7 @@ class ClientService:
             success = self.cliente_model.crear_cliente(nombre, apellido, dni, telefono, email, password, tipo_usuario=tipo)
             if success:
                 logger.info(f"Cliente creado exitosamente: {dni} (tipo: {tipo})")
+                self.event_bus.publish(ClienteCreado(dni, nombre, apellido, tipo))
                 return True, f"Cliente {nombre} {apellido} creado exitosamente como {tipo}"
             else:
                 raise BusinessLogicError("No se pudo crear el cliente")
@@ -101,6 +122,7 @@ class ClientService:
             success = self.cliente_model.crear_cliente(nombre, apellido, dni, telefono, email, password, tipo_usuario='cliente')
             if success:
                 logger.info(f"Usuario registrado exitosamente: {dni}")
+                self.event_bus.publish(ClienteCreado(dni, nombre, apellido, 'cliente'))
                 return True, "Registro completado exitosamente. Ya puedes iniciar sesión"
             else:
                 raise BusinessLogicError("No se pudo registrar el usuario")
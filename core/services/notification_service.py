@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 class NotificationService:
     """Servicio especializado en gestión de notificaciones."""
     
+    # Texto de cada tipo de notificación de reserva
+    TEXTO_ESTADO = {'aceptada': "ACEPTADA ✅", 'rechazada': "RECHAZADA ❌"}
+    
     def __init__(self, notification_model):
         """Inicializa el servicio de notificaciones."""
         self.notification_model = notification_model
@@ -34,12 +37,11 @@ class NotificationService:
             Tupla (éxito: bool, mensaje: str)
         """
         try:
-            if tipo == 'aceptada':
-                mensaje = f"Tu reserva para {aparato_nombre} el {dia_semana} a las {hora} ha sido ACEPTADA ✅"
-            elif tipo == 'rechazada':
-                mensaje = f"Tu reserva para {aparato_nombre} el {dia_semana} a las {hora} ha sido RECHAZADA ❌"
-            else:
+            if tipo not in self.TEXTO_ESTADO:
                 return False, "Tipo de notificación inválido"
+            mensaje = self.mensaje_reserva(
+                {'aparato': aparato_nombre, 'dia': dia_semana, 'hora_inicio': hora}, tipo
+            )
             
             success = self.notification_model.crear_notificacion(
                 id_cliente, id_reserva, tipo, mensaje
@@ -107,3 +109,17 @@ class NotificationService:
         except Exception as e:
             logger.error(f"Error al contar notificaciones no leídas: {e}")
             return 0
+    
+    @classmethod
+    def mensaje_reserva(cls, reserva: Dict, tipo: str) -> str:
+        """Texto de la notificación de una reserva aceptada o rechazada.
+        
+        Args:
+            reserva: Reserva con 'aparato', 'dia' y 'hora_inicio'
+            tipo: 'aceptada' o 'rechazada'
+            
+        Returns:
+            Mensaje para el cliente
+        """
+        return (f"Tu reserva para {reserva['aparato']} el {reserva['dia']} a las "
+                f"{reserva['hora_inicio']} ha sido {cls.TEXTO_ESTADO[tipo]}")
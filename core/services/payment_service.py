@@ -3,12 +3,13 @@ Servicio de Pagos - Gestiona operaciones de pagos y recibos.
 Responsabilidad única: Gestión de pagos, recibos e historial financiero.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from infrastructure.exceptions import (
     ValidationError, NotFoundError, BusinessLogicError
 )
+from core.events import EventBus, ReciboPagado, RecibosGenerados, ResumenFinancieroReconstruido
 
 logger = logging.getLogger(__name__)
 
@@ -18,19 +19,21 @@ class PaymentService:
     
     # Constantes
     PRECIO_MENSUALIDAD = 50.0  # Precio base de la mensualidad
+    MAX_MESES_RANGO = 24  # Meses como máximo por facturación en lote
     MESES = {
         1: "Enero", 2: "Febrero", 3: "Marzo", 4: "Abril",
         5: "Mayo", 6: "Junio", 7: "Julio", 8: "Agosto",
         9: "Septiembre", 10: "Octubre", 11: "Noviembre", 12: "Diciembre"
     }
     
-    def __init__(self, recibo_model, cliente_model):
+    def __init__(self, recibo_model, cliente_model, event_bus: EventBus = None):
         """Inicializa el servicio de pagos."""
         self.recibo_model = recibo_model
         self.cliente_model = cliente_model
+        self.event_bus = event_bus or EventBus()
     
     def pagar_recibo(self, id_recibo: int) -> Tuple[bool, str]:
-        """Marca un recibo como pagado.
+        """Registra el pago de un recibo por su importe y lo marca como pagado.
         
         Args:
             id_recibo: ID del recibo a pagar
@@ -48,10 +51,13 @@ class PaymentService:
             if recibo.get('estado') == 'pagado':
                 raise BusinessLogicError("El recibo ya ha sido pagado")
             
-            # Marcar como pagado
-            success = self.recibo_model.marcar_pagado(id_recibo)
+            # Registrar el pago (alimenta pagos/monto_cobrado de resumen_financiero)
+            success = self.recibo_model.registrar_pago(id_recibo, recibo['monto'])
             if success:
                 logger.info(f"Recibo pagado: {id_recibo}")
+                self.event_bus.publish(ReciboPagado(
+                    id_recibo, recibo['id_cliente'], recibo['mes'], recibo['anio'], recibo['monto']
+                ))
                 return True, "Pago registrado exitosamente"
             else:
                 raise BusinessLogicError("No se pudo procesar el pago")
@@ -73,51 +79,68 @@ class PaymentService:
         Returns:
             Tupla (éxito: bool, mensaje: str)
         """
-        try:
-            # Validar mes y año
-            if not (1 <= mes <= 12):
-                raise ValidationError("El mes debe estar entre 1 y 12")
-            if año < 2000 or año > 2100:
-                raise ValidationError("Año inválido")
-            
-            # Obtener todos los clientes activos
-            clientes = self.cliente_model.obtener_todos()
-            clientes_activos = [c for c in clientes if c.get('rol') == 'cliente']
+        success, message, _ = self.generar_recibos_rango(mes, año, mes, año)
+        return success, message
+    
+    def generar_recibos_rango(self, mes_desde: int, año_desde: int,
+                              mes_hasta: int, año_hasta: int) -> Tuple[bool, str, Dict]:
+        """Genera los recibos de todos los clientes para un rango de meses.
+        
+        La facturación se resuelve en la base de datos con una única
+        sentencia INSERT ... SELECT; los recibos ya emitidos se omiten.
+        
+        Args:
+            mes_desde: Primer mes (1-12)
+            año_desde: Año del primer mes
+            mes_hasta: Último mes incluido (1-12)
+            año_hasta: Año del último mes
             
-            recibos_generados = 0
+        Returns:
+            Tupla (éxito: bool, mensaje: str, resumen: dict con 'creados',
+            'omitidos' y 'periodos')
+        """
+        resumen = {'creados': 0, 'omitidos': 0, 'periodos': 0}
+        try:
+            periodos = self._periodos(mes_desde, año_desde, mes_hasta, año_hasta)
+            resumen = self.recibo_model.generar_recibos_periodo(periodos, self.PRECIO_MENSUALIDAD)
             
-            for cliente in clientes_activos:
-                # Verificar si ya existe recibo para este mes
-                recibo_existente = self.recibo_model.obtener_por_cliente_mes(
-                    cliente['dni'], mes, año
-                )
-                
-                if not recibo_existente:
-                    # Crear nuevo recibo
-                    monto = self.PRECIO_MENSUALIDAD
-                    mes_nombre = self.MESES.get(mes, f"Mes {mes}")
-                    descripcion = f"Mensualidad {mes_nombre} {año}"
-                    
-                    success = self.recibo_model.crear(
-                        cliente['dni'],
-                        monto,
-                        descripcion,
-                        mes,
-                        año
-                    )
-                    
-                    if success:
-                        recibos_generados += 1
-            
-            logger.info(f"Se generaron {recibos_generados} recibos para {mes}/{año}")
-            return True, f"Se generaron {recibos_generados} recibos para {self.MESES[mes]} {año}"
+            if len(periodos) == 1:
+                descripcion = f"{self.MESES[mes_desde]} {año_desde}"
+            else:
+                descripcion = (f"{self.MESES[mes_desde]} {año_desde} - "
+                               f"{self.MESES[mes_hasta]} {año_hasta}")
+            logger.info(f"Recibos {descripcion}: {resumen['creados']} creados, "
+                        f"{resumen['omitidos']} ya existentes")
+            if resumen['creados']:
+                self.event_bus.publish(RecibosGenerados(**resumen))
+            mensaje = f"Se generaron {resumen['creados']} recibos para {descripcion}"
+            if resumen['omitidos']:
+                mensaje += f" ({resumen['omitidos']} ya existían)"
+            return True, mensaje, resumen
             
         except ValidationError as e:
             logger.warning(f"Error al generar recibos: {e}")
-            return False, str(e)
+            return False, str(e), resumen
         except Exception as e:
             logger.error(f"Error inesperado al generar recibos: {e}")
-            return False, "Error al generar recibos"
+            return False, "Error al generar recibos", resumen
+    
+    def _periodos(self, mes_desde: int, año_desde: int,
+                  mes_hasta: int, año_hasta: int) -> List[Tuple[int, int]]:
+        """Valida el rango y devuelve sus meses como pares (mes, año)."""
+        for mes, año in ((mes_desde, año_desde), (mes_hasta, año_hasta)):
+            if not (1 <= mes <= 12):
+                raise ValidationError("El mes debe estar entre 1 y 12")
+            if año < 2000 or año > 2100:
+                raise ValidationError("Año inválido")
+        
+        inicio = año_desde * 12 + mes_desde - 1
+        fin = año_hasta * 12 + mes_hasta - 1
+        if fin < inicio:
+            raise ValidationError("El mes final no puede ser anterior al inicial")
+        if fin - inicio + 1 > self.MAX_MESES_RANGO:
+            raise ValidationError(f"El rango no puede superar {self.MAX_MESES_RANGO} meses")
+        return [(n % 12 + 1, n // 12) for n in range(inicio, fin + 1)]
     
     def obtener_mis_recibos(self, usuario_actual: Dict) -> List[Dict]:
         """Obtiene los recibos del usuario actual.
@@ -150,33 +173,101 @@ class PaymentService:
             logger.error(f"Error al obtener todos los recibos: {e}")
             return []
     
+    def obtener_pagina_recibos(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página de recibos, del periodo más reciente al más antiguo.
+        
+        Args:
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            return self.recibo_model.obtener_pagina(cursor, tamano)
+        except ValueError as e:
+            logger.warning(f"Cursor de recibos inválido: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de recibos: {e}")
+        return {'items': [], 'siguiente': None}
+    
+    def obtener_morosos(self, orden: str = 'deuda') -> List[Dict]:
+        """Obtiene los clientes con recibos pendientes.
+        
+        Args:
+            orden: 'deuda', 'recibos', 'antiguedad' o 'apellido'
+            
+        Returns:
+            Lista de morosos con deuda, recibos pendientes, mes impagado más
+            antiguo y deuda por tramos de antigüedad (0-30, 31-60, 61-90, +90 días)
+        """
+        try:
+            self._validar_orden_morosos(orden)
+            morosos = self.recibo_model.obtener_morosos(orden)
+            logger.info(f"Se obtuvieron {len(morosos)} clientes morosos")
+            return morosos
+        except ValidationError as e:
+            logger.warning(f"Error al obtener morosos: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error al obtener clientes morosos: {e}")
+            return []
+    
+    def obtener_pagina_morosos(self, orden: str = 'deuda', cursor: Optional[str] = None,
+                               tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página del informe de morosos.
+        
+        Args:
+            orden: 'deuda', 'recibos', 'antiguedad' o 'apellido'
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            self._validar_orden_morosos(orden)
+            return self.recibo_model.obtener_pagina_morosos(orden, cursor, tamano)
+        except (ValidationError, ValueError) as e:
+            logger.warning(f"Error al obtener página de morosos: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de morosos: {e}")
+        return {'items': [], 'siguiente': None}
+    
+    def _validar_orden_morosos(self, orden: str) -> None:
+        if orden not in self.recibo_model.ORDENES_MOROSOS:
+            raise ValidationError(
+                f"Orden no válido. Debe ser uno de: {', '.join(self.recibo_model.ORDENES_MOROSOS)}"
+            )
+    
     def obtener_estadisticas_financieras(self) -> Dict:
         """Obtiene estadísticas financieras del gimnasio.
         
+        Se leen del resumen mensual materializado, por lo que el coste
+        depende del número de meses y no del de recibos.
+        
         Returns:
             Diccionario con estadísticas
         """
         try:
-            recibos = self.recibo_model.obtener_todos_recibos()
+            totales = self.recibo_model.obtener_totales_financieros()
             
-            total_recibos = len(recibos)
-            recibos_pagados = len([r for r in recibos if r.get('estado') == 'pagado'])
-            recibos_pendientes = total_recibos - recibos_pagados
-            
-            monto_total = sum(float(r.get('monto', 0)) for r in recibos)
-            monto_pagado = sum(
-                float(r.get('monto', 0)) for r in recibos if r.get('estado') == 'pagado'
-            )
-            monto_pendiente = monto_total - monto_pagado
+            recibos_pagados = totales['recibos_pagados']
+            recibos_pendientes = totales['recibos_pendientes']
+            monto_pagado = totales['monto_pagado']
+            monto_pendiente = totales['monto_pendiente']
+            monto_total = monto_pagado + monto_pendiente
             
             estadisticas = {
-                'total_recibos': total_recibos,
+                'total_recibos': recibos_pagados + recibos_pendientes,
                 'recibos_pagados': recibos_pagados,
                 'recibos_pendientes': recibos_pendientes,
                 'monto_total': monto_total,
                 'monto_pagado': monto_pagado,
                 'monto_pendiente': monto_pendiente,
-                'porcentaje_pago': (monto_pagado / monto_total * 100) if monto_total > 0 else 0
+                'porcentaje_pago': (monto_pagado / monto_total * 100) if monto_total > 0 else 0,
+                'total_pagos': totales['pagos'],
+                'monto_cobrado': totales['monto_cobrado']
             }
             
             logger.info("Estadísticas financieras calculadas")
@@ -185,3 +276,33 @@ class PaymentService:
         except Exception as e:
             logger.error(f"Error al calcular estadísticas: {e}")
             return {}
+    
+    def obtener_resumen_mensual(self, año: Optional[int] = None) -> List[Dict]:
+        """Obtiene los totales financieros mes a mes.
+        
+        Args:
+            año: Limitar a un año (None = todos)
+            
+        Returns:
+            Lista de meses con recibos e importes por estado y cobros
+        """
+        try:
+            return self.recibo_model.obtener_resumen_mensual(año)
+        except Exception as e:
+            logger.error(f"Error al obtener resumen mensual: {e}")
+            return []
+    
+    def reconstruir_resumen_financiero(self) -> Tuple[bool, str]:
+        """Recalcula el resumen financiero materializado desde recibos y pagos.
+        
+        Returns:
+            Tupla (éxito: bool, mensaje: str)
+        """
+        try:
+            meses = self.recibo_model.reconstruir_resumen_financiero()
+            logger.info(f"Resumen financiero reconstruido: {meses} meses")
+            self.event_bus.publish(ResumenFinancieroReconstruido(meses))
+            return True, f"Resumen financiero reconstruido ({meses} meses)"
+        except Exception as e:
+            logger.error(f"Error al reconstruir resumen financiero: {e}")
+            return False, "Error al reconstruir el resumen financiero"
@@ -0,0 +1,105 @@
+"""
+Caché de Lectura - Resultados recientes de las consultas del controlador.
+Responsabilidad única: Evitar consultas repetidas mientras los datos no cambian.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReadCache:
+    """Caché LRU con caducidad (TTL) organizada por espacios de nombres.
+
+    Cada espacio agrupa las lecturas de una entidad ('aparatos',
+    'clientes', ...). Las escrituras invalidan los espacios afectados; el
+    TTL acota el tiempo que puede servirse un dato modificado por otro
+    proceso. Los valores se comparten entre llamadas y deben tratarse como
+    de solo lectura.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Inicializa la caché.
+
+        Args:
+            max_entries: Entradas como máximo entre todos los espacios
+            ttl: Segundos de validez de cada entrada
+            clock: Reloj monotónico (inyectable para pruebas)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser mayor que 0")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entradas: 'OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]' = OrderedDict()
+        self._versiones: Dict[str, int] = {}
+        self._contadores: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _contador(self, namespace: str) -> Dict[str, int]:
+        if namespace not in self._contadores:
+            self._contadores[namespace] = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        return self._contadores[namespace]
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Devuelve el valor en caché o lo carga con ``loader`` y lo guarda.
+
+        Si el espacio se invalida mientras ``loader`` se ejecuta, el valor
+        se devuelve pero no se guarda, para no servir datos anteriores a la
+        escritura.
+        """
+        clave = (namespace, key)
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[0] > self._clock():
+                self._entradas.move_to_end(clave)
+                self._contador(namespace)['hits'] += 1
+                return entrada[1]
+            if entrada is not None:
+                del self._entradas[clave]
+                self._contador(namespace)['evictions'] += 1
+            self._contador(namespace)['misses'] += 1
+            version = self._versiones.get(namespace, 0)
+
+        valor = loader()
+
+        with self._lock:
+            if self._versiones.get(namespace, 0) == version:
+                self._entradas[clave] = (self._clock() + self.ttl, valor)
+                self._entradas.move_to_end(clave)
+                while len(self._entradas) > self.max_entries:
+                    (ns_expulsado, _), _ = self._entradas.popitem(last=False)
+                    self._contador(ns_expulsado)['evictions'] += 1
+        return valor
+
+    def invalidate(self, *namespaces: str) -> None:
+        """Descarta todas las entradas de los espacios indicados."""
+        with self._lock:
+            for namespace in namespaces:
+                self._versiones[namespace] = self._versiones.get(namespace, 0) + 1
+                self._contador(namespace)['invalidations'] += 1
+                for clave in [c for c in self._entradas if c[0] == namespace]:
+                    del self._entradas[clave]
+
+    def clear(self) -> None:
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            for namespace in {c[0] for c in self._entradas}:
+                self._versiones[namespace] = self._versiones.get(namespace, 0) + 1
+            self._entradas.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Aciertos, fallos, expulsiones, invalidaciones y entradas por espacio."""
+        with self._lock:
+            resultado = {ns: dict(valores) for ns, valores in self._contadores.items()}
+            for namespace, _ in self._entradas:
+                resultado.setdefault(namespace, dict(self._contador(namespace)))
+                resultado[namespace]['entries'] = resultado[namespace].get('entries', 0) + 1
+            for valores in resultado.values():
+                valores.setdefault('entries', 0)
+        return resultado
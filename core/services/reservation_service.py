@@ -3,13 +3,19 @@ Servicio de Reservas - Gestiona operaciones de reservas de aparatos.
 Responsabilidad única: Gestión de reservas y disponibilidad.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 from infrastructure.exceptions import (
     ValidationError, NotFoundError, BusinessLogicError
 )
 from infrastructure.validators import ValidadorReserva
+from core.services.availability_index import AvailabilityIndex
+from core.services.notification_service import NotificationService
+from core.events import (
+    EventBus, ReservaCreada, ReservaAceptada, ReservaRechazada, ReservaEliminada, EventoReserva,
+    AparatoEliminado
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +23,42 @@ logger = logging.getLogger(__name__)
 class ReservationService:
     """Servicio especializado en gestión de reservas."""
     
-    def __init__(self, reserva_model, aparato_model, cliente_model, notificacion_model=None):
-        """Inicializa el servicio de reservas."""
+    def __init__(self, reserva_model, aparato_model, cliente_model, notificacion_model=None,
+                 availability_index: AvailabilityIndex = None, event_bus: EventBus = None):
+        """Inicializa el servicio de reservas y carga el índice de disponibilidad.
+        
+        Si se indica ``notificacion_model``, los clientes reciben una
+        notificación al aceptarse o rechazarse sus reservas, escrita en la
+        misma transacción que el cambio de estado.
+        """
         self.reserva_model = reserva_model
         self.aparato_model = aparato_model
         self.cliente_model = cliente_model
         self.notificacion_model = notificacion_model
+        self.event_bus = event_bus or EventBus()
+        self._mensaje_notificacion = (
+            NotificationService.mensaje_reserva if notificacion_model is not None else None
+        )
+        self.availability_index = availability_index or AvailabilityIndex()
+        self.event_bus.subscribe(AparatoEliminado, self._al_eliminar_aparatos)
+        self.reconstruir_indice_disponibilidad()
+
+    def reconstruir_indice_disponibilidad(self) -> None:
+        """Recarga el índice de disponibilidad desde las reservas aceptadas."""
+        try:
+            self.availability_index.rebuild(self.reserva_model.obtener_franjas_aceptadas())
+        except Exception as e:
+            logger.error(f"Error al reconstruir índice de disponibilidad: {e}")
+
+    def _al_eliminar_aparatos(self, eventos: List[AparatoEliminado]) -> None:
+        """Suscriptor del bus: quita del índice las franjas de los aparatos eliminados."""
+        for evento in eventos:
+            self.availability_index.remove_aparato(evento.id_aparato)
+
+    def _franja_de(self, reserva: Dict) -> Tuple[int, int, int]:
+        """(id_aparato, dia, inicio_min) de una reserva devuelta por el modelo."""
+        return (reserva['id_aparato'], self.reserva_model.dia_a_numero(reserva['dia']),
+                self.reserva_model.hora_a_minutos(reserva['hora_inicio']))
     
     def crear_reserva(self, usuario_actual: Dict, id_aparato: int, 
                      dia_semana: str, hora_inicio: str) -> Tuple[bool, str]:
@@ -58,6 +94,7 @@ class ReservationService:
             
             if success:
                 logger.info(f"Reserva creada: Cliente {id_cliente} - Aparato {id_aparato}")
+                self.event_bus.publish(ReservaCreada(id_cliente, id_aparato, dia_semana, hora_inicio))
                 return True, f"Reserva confirmada para {aparato['nombre']} el {dia_semana}"
             else:
                 raise BusinessLogicError(message)
@@ -92,6 +129,24 @@ class ReservationService:
             logger.error(f"Error al obtener todas las reservas: {e}")
             return []
     
+    def obtener_pagina_reservas(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página de todas las reservas, de la más reciente a la más antigua.
+        
+        Args:
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            return self.reserva_model.obtener_pagina(cursor, tamano)
+        except ValueError as e:
+            logger.warning(f"Cursor de reservas inválido: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de reservas: {e}")
+        return {'items': [], 'siguiente': None}
+    
     def obtener_ocupacion_dia(self, dia_semana: str) -> List[Dict]:
         """Obtiene la ocupación de aparatos para un día específico.
         
@@ -124,22 +179,42 @@ class ReservationService:
             Tupla (éxito: bool, mensaje: str)
         """
         try:
-            # Por ahora, permitir eliminación sin verificar propietario
-            # (más adelante se puede refinar con acceso directo a la BD para verificar)
+            reserva = self.reserva_model.obtener_por_id(id_reserva)
+            if not reserva:
+                raise NotFoundError(f"La reserva con ID {id_reserva} no existe")
+            if usuario_actual.get('tipo') != 'admin' and reserva['id_cliente'] != usuario_actual.get('id'):
+                raise BusinessLogicError("No puede eliminar reservas de otro cliente")
             success = self.reserva_model.eliminar_reserva(id_reserva)
             if success:
+                self._liberar_franja(reserva)
                 logger.info(f"Reserva eliminada: {id_reserva}")
+                self.event_bus.publish(ReservaEliminada(id_reserva))
                 return True, "Reserva eliminada exitosamente"
             else:
                 raise BusinessLogicError("No se pudo eliminar la reserva")
                 
-        except BusinessLogicError as e:
+        except (NotFoundError, BusinessLogicError) as e:
             logger.warning(f"Error al eliminar reserva: {e}")
             return False, str(e)
         except Exception as e:
             logger.error(f"Error inesperado al eliminar reserva: {e}")
             return False, "Error al eliminar la reserva"
     
+    def _liberar_franja(self, reserva: Dict) -> None:
+        """Actualiza el índice tras eliminar una reserva.
+        
+        Una reserva aceptada ocupaba su franja. Una pendiente pudo marcarla
+        como ocupada al aceptarse con 'conflicto' (la ocupaba otra reserva,
+        quizá aceptada desde otro terminal): se consulta la base de datos
+        para liberar la franja solo si ya no la ocupa ninguna reserva.
+        """
+        modelo = self.reserva_model
+        if reserva['estado'] == modelo.ACEPTADA:
+            self.availability_index.release(*self._franja_de(reserva))
+        elif reserva['estado'] == 'pendiente':
+            if modelo.verificar_disponibilidad(reserva['id_aparato'], reserva['dia'], reserva['hora_inicio']):
+                self.availability_index.release(*self._franja_de(reserva))
+    
     def verificar_disponibilidad(self, id_aparato: int, dia_semana: str, 
                                  hora_inicio: str) -> bool:
         """Verifica si un aparato está disponible en un horario específico.
@@ -153,16 +228,44 @@ class ReservationService:
             True si está disponible, False en caso contrario
         """
         try:
-            # Obtener ocupación del día
-            ocupacion = self.reserva_model.obtener_ocupacion_dia(dia_semana)
-            # Verificar si hay conflicto para este aparato y horario
-            for item in ocupacion:
-                if item.get('id_aparato') == id_aparato and item.get('hora_inicio') == hora_inicio:
-                    return False  # No disponible
-            return True  # Disponible
+            ValidadorReserva.validar_datos_reserva(id_aparato, dia_semana, hora_inicio)
+            dia = self.reserva_model.dia_a_numero(dia_semana)
+            inicio = self.reserva_model.hora_a_minutos(hora_inicio)
+
+            # Misma regla que la base de datos: la franja está ocupada solo si
+            # una reserva aceptada empieza exactamente a esa hora
+            franja = self.availability_index.franja(inicio)
+            if franja is None:
+                # Horas fuera de la rejilla de medias horas: consultar la base de datos
+                return self.reserva_model.verificar_disponibilidad(id_aparato, dia_semana, hora_inicio)
+            return self.availability_index.is_free(id_aparato, dia, franja)
+        except ValidationError as e:
+            logger.warning(f"Error al verificar disponibilidad: {e}")
+            return False
         except Exception as e:
             logger.error(f"Error al verificar disponibilidad: {e}")
             return False
+
+    def obtener_horarios_libres(self, id_aparato: int, dia_semana: str) -> List[str]:
+        """Obtiene las horas de inicio libres de un aparato en un día.
+
+        Args:
+            id_aparato: ID del aparato
+            dia_semana: Día de la semana
+
+        Returns:
+            Lista de horas 'HH:MM' sin reserva aceptada
+        """
+        try:
+            ValidadorReserva.validar_dia_semana(dia_semana)
+            dia = self.reserva_model.dia_a_numero(dia_semana)
+            return [
+                self.reserva_model.minutos_a_hora(inicio)
+                for inicio in self.availability_index.free_slots(id_aparato, dia)
+            ]
+        except ValidationError as e:
+            logger.warning(f"Error al obtener horarios libres: {e}")
+            return []
     
     def aceptar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
         """Acepta una reserva pendiente.
@@ -173,38 +276,8 @@ class ReservationService:
         Returns:
             Tupla (éxito: bool, mensaje: str)
         """
-        try:
-            success, message = self.reserva_model.aceptar_reserva(id_reserva)
-            if success:
-                logger.info(f"Reserva aceptada: {id_reserva}")
-                
-                # Obtener detalles de la reserva para la notificación
-                if self.notificacion_model:
-                    try:
-                        # Obtener información de la reserva aceptada
-                        reservas_pendientes = self.reserva_model.obtener_todas()
-                        for reserva in reservas_pendientes:
-                            if reserva['id'] == id_reserva:
-                                # Crear notificación
-                                self.notificacion_model.crear_notificacion(
-                                    id_cliente=self._obtener_id_cliente_por_reserva(id_reserva),
-                                    id_reserva=id_reserva,
-                                    tipo='aceptada',
-                                    mensaje=f"Tu reserva para {reserva['aparato']} el {reserva['dia']} a las {reserva['hora_inicio']} ha sido ACEPTADA ✅"
-                                )
-                                break
-                    except Exception as e:
-                        logger.error(f"Error al crear notificación de aceptación: {e}")
-                
-                return True, message
-            else:
-                raise BusinessLogicError(message)
-        except BusinessLogicError as e:
-            logger.warning(f"Error al aceptar reserva: {e}")
-            return False, str(e)
-        except Exception as e:
-            logger.error(f"Error inesperado al aceptar reserva: {e}")
-            return False, "Error al aceptar la reserva"
+        resultado = self.aceptar_reservas([id_reserva])[0]
+        return resultado['exito'], resultado['mensaje']
     
     def rechazar_reserva(self, id_reserva: int) -> Tuple[bool, str]:
         """Rechaza una reserva pendiente.
@@ -215,46 +288,102 @@ class ReservationService:
         Returns:
             Tupla (éxito: bool, mensaje: str)
         """
+        resultado = self.rechazar_reservas([id_reserva])[0]
+        return resultado['exito'], resultado['mensaje']
+    
+    def aceptar_reservas(self, ids_reserva: List[int]) -> List[Dict]:
+        """Acepta varias reservas pendientes en una sola transacción.
+        
+        Si dos reservas del lote piden la misma franja se acepta la más
+        antigua y la otra queda pendiente con resultado 'conflicto'.
+        
+        Args:
+            ids_reserva: IDs de las reservas a aceptar
+            
+        Returns:
+            Un diccionario por id (en el orden recibido) con 'id', 'exito',
+            'mensaje', 'resultado' y 'conflicto_con'
+        """
         try:
-            success, message = self.reserva_model.rechazar_reserva(id_reserva)
-            if success:
-                logger.info(f"Reserva rechazada: {id_reserva}")
-                
-                # Crear notificación
-                if self.notificacion_model:
-                    try:
-                        # Obtener información de la reserva rechazada
-                        reservas = self.reserva_model.obtener_todas()
-                        for reserva in reservas:
-                            if reserva['id'] == id_reserva:
-                                # Crear notificación
-                                self.notificacion_model.crear_notificacion(
-                                    id_cliente=self._obtener_id_cliente_por_reserva(id_reserva),
-                                    id_reserva=id_reserva,
-                                    tipo='rechazada',
-                                    mensaje=f"Tu reserva para {reserva['aparato']} el {reserva['dia']} a las {reserva['hora_inicio']} ha sido RECHAZADA ❌"
-                                )
-                                break
-                    except Exception as e:
-                        logger.error(f"Error al crear notificación de rechazo: {e}")
-                
-                return True, message
-            else:
-                raise BusinessLogicError(message)
-        except BusinessLogicError as e:
-            logger.warning(f"Error al rechazar reserva: {e}")
-            return False, str(e)
+            resultados = self.reserva_model.aceptar_reservas_lote(ids_reserva, self._mensaje_notificacion)
         except Exception as e:
-            logger.error(f"Error inesperado al rechazar reserva: {e}")
-            return False, "Error al rechazar la reserva"
+            logger.error(f"Error inesperado al aceptar reservas: {e}")
+            return [self._resumen(i, False, "Error al aceptar la reserva") for i in ids_reserva]
+        
+        modelo = self.reserva_model
+        for resultado in resultados:
+            if resultado['resultado'] in (modelo.ACEPTADA, modelo.CONFLICTO):
+                # En caso de conflicto la franja la ocupa otra reserva (quizá
+                # aceptada desde otro terminal): el índice debe reflejarlo
+                self.availability_index.occupy(*self._franja_de(resultado['reserva']))
+        
+        aceptadas = [r for r in resultados if r['resultado'] == modelo.ACEPTADA]
+        if aceptadas:
+            logger.info(f"Reservas aceptadas: {[r['id'] for r in aceptadas]}")
+        self.event_bus.publish(*self._eventos(aceptadas, ReservaAceptada))
+        return self._resumir(resultados, modelo.ACEPTADA, "aceptar")
     
-    def _obtener_id_cliente_por_reserva(self, id_reserva: int) -> int:
-        """Obtiene el ID del cliente de una reserva"""
+    def rechazar_reservas(self, ids_reserva: List[int]) -> List[Dict]:
+        """Rechaza varias reservas pendientes en una sola transacción.
+        
+        Args:
+            ids_reserva: IDs de las reservas a rechazar
+            
+        Returns:
+            Un diccionario por id (en el orden recibido) con 'id', 'exito',
+            'mensaje', 'resultado' y 'conflicto_con'
+        """
         try:
-            return self.reserva_model.obtener_id_cliente_por_reserva(id_reserva)
+            # Solo se rechazan reservas pendientes, que no ocupan franjas del índice
+            resultados = self.reserva_model.rechazar_reservas_lote(ids_reserva, self._mensaje_notificacion)
         except Exception as e:
-            logger.error(f"Error al obtener id_cliente: {e}")
-            return None
+            logger.error(f"Error inesperado al rechazar reservas: {e}")
+            return [self._resumen(i, False, "Error al rechazar la reserva") for i in ids_reserva]
+        
+        rechazadas = [r for r in resultados if r['resultado'] == self.reserva_model.RECHAZADA]
+        if rechazadas:
+            logger.info(f"Reservas rechazadas: {[r['id'] for r in rechazadas]}")
+        self.event_bus.publish(*self._eventos(rechazadas, ReservaRechazada))
+        return self._resumir(resultados, self.reserva_model.RECHAZADA, "rechazar")
+    
+    @staticmethod
+    def _eventos(resultados: List[Dict], tipo_evento) -> List[EventoReserva]:
+        """Eventos de dominio de las reservas procesadas con éxito."""
+        return [
+            tipo_evento(
+                id_reserva=r['id'],
+                id_cliente=r['reserva']['id_cliente'],
+                id_aparato=r['reserva']['id_aparato'],
+                aparato=r['reserva']['aparato'],
+                dia=r['reserva']['dia'],
+                hora_inicio=r['reserva']['hora_inicio']
+            )
+            for r in resultados
+        ]
+    
+    def _resumir(self, resultados: List[Dict], exito: str, accion: str) -> List[Dict]:
+        """Convierte los resultados del modelo en la respuesta del servicio."""
+        resumen = []
+        for resultado in resultados:
+            mensaje = resultado['mensaje']
+            if resultado['conflicto_con']:
+                mensaje = f"{mensaje} (reserva #{resultado['conflicto_con']})"
+            if resultado['resultado'] != exito:
+                logger.warning(f"No se pudo {accion} la reserva {resultado['id']}: {mensaje}")
+            resumen.append(self._resumen(resultado['id'], resultado['resultado'] == exito, mensaje,
+                                         resultado['resultado'], resultado['conflicto_con']))
+        return resumen
+    
+    @staticmethod
+    def _resumen(id_reserva: int, exito: bool, mensaje: str, resultado: str = 'error',
+                 conflicto_con: int = None) -> Dict:
+        return {
+            'id': id_reserva,
+            'exito': exito,
+            'mensaje': mensaje,
+            'resultado': resultado,
+            'conflicto_con': conflicto_con
+        }
     
     def obtener_reservas_pendientes(self) -> List[Dict]:
         """Obtiene todas las reservas pendientes.
@@ -269,4 +398,41 @@ class ReservationService:
         except Exception as e:
             logger.error(f"Error al obtener reservas pendientes: {e}")
             return []
-
+    
+    def obtener_pagina_reservas_pendientes(self, cursor: Optional[str] = None, tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página de reservas pendientes, de la más antigua a la más reciente.
+        
+        Args:
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            return self.reserva_model.obtener_pagina_pendientes(cursor, tamano)
+        except ValueError as e:
+            logger.warning(f"Cursor de reservas pendientes inválido: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de reservas pendientes: {e}")
+        return {'items': [], 'siguiente': None}
+    
+    def obtener_pagina_reservas_por_estado(self, estado: str, cursor: Optional[str] = None,
+                                           tamano: Optional[int] = None) -> Dict:
+        """Obtiene una página de reservas en un estado, de la más reciente a la más antigua.
+        
+        Args:
+            estado: 'pendiente', 'aceptada' o 'rechazada'
+            cursor: Token 'siguiente' de la página anterior (None = primera página)
+            tamano: Elementos por página
+            
+        Returns:
+            Diccionario con 'items' y 'siguiente' (None en la última página)
+        """
+        try:
+            return self.reserva_model.obtener_pagina_por_estado(estado, cursor, tamano)
+        except ValueError as e:
+            logger.warning(f"Página de reservas por estado inválida: {e}")
+        except Exception as e:
+            logger.error(f"Error al obtener página de reservas por estado: {e}")
+        return {'items': [], 'siguiente': None}
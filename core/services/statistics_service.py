@@ -0,0 +1,36 @@
+"""
+Servicio de Estadísticas - Cifras agregadas para el panel de administración.
+Responsabilidad única: Resumir el estado del gimnasio sin cargar las entidades.
+"""
+
+from typing import Optional
+import logging
+from infrastructure.dtos import EstadisticasDTO
+
+logger = logging.getLogger(__name__)
+
+
+class StatisticsService:
+    """Servicio especializado en estadísticas del gimnasio."""
+    
+    def __init__(self, estadisticas_model):
+        """Inicializa el servicio de estadísticas."""
+        self.estadisticas_model = estadisticas_model
+    
+    def obtener_estadisticas_generales(self) -> Optional[EstadisticasDTO]:
+        """Obtiene las cifras del panel de administración en una sola consulta.
+        
+        Returns:
+            EstadisticasDTO con los totales, o None si la consulta falla
+        """
+        try:
+            resumen = self.estadisticas_model.resumen_general()
+            ingresos = resumen['total_ingresos']
+            facturado = ingresos + resumen['deuda_total']
+            return EstadisticasDTO(
+                porcentaje_pago=(ingresos / facturado * 100) if facturado > 0 else 0,
+                **resumen
+            )
+        except Exception as e:
+            logger.error(f"Error al obtener estadísticas generales: {e}")
+            return None
@@ -81,6 +81,8 @@ class EstadisticasDTO:
     total_ingresos: float
     deuda_total: float
     porcentaje_pago: float
+    reservas_pendientes: int = 0
+    reservas_aceptadas: int = 0
 
     def get_resumen(self) -> str:
         """Obtiene un resumen de las estadísticas"""
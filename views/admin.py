@@ -2,7 +2,8 @@ import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime
 from typing import Any
-from views.components import crear_boton_admin, crear_stat_card
+from views.components import crear_boton_admin, crear_stat_card, recargar_seccion, VirtualList, KeyedList
+from views.registry import ViewRegistry
 
 
 def mostrar_dashboard_admin(app: Any):
@@ -817,9 +818,9 @@ def admin_eliminar_reserva(app: Any, id_reserva: int):
             messagebox.showerror("Error", mensaje)
 
 
-def contenido_admin_recibos(app: Any):
+def contenido_admin_recibos(app: Any, parent: Any):
     """Gestión de recibos con opción de crear facturas"""
-    header = ctk.CTkFrame(app.content_frame, fg_color="transparent")
+    header = ctk.CTkFrame(parent, fg_color="transparent")
     header.pack(fill="x", pady=(0, 20))
 
     ctk.CTkLabel(
@@ -842,81 +843,58 @@ def contenido_admin_recibos(app: Any):
         corner_radius=10
     ).pack(side="right")
 
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame, fg_color="transparent")
-    scroll_frame.pack(fill="both", expand=True, padx=0, pady=0)
-
-    recibos = app.controller.obtener_todos_recibos()
-
-    if not recibos:
-        ctk.CTkLabel(
-            scroll_frame,
-            text="No hay recibos en el sistema",
-            font=ctk.CTkFont(size=16),
-            text_color="#7a8492"
-        ).pack(pady=40)
-        return
-
-    for recibo in recibos:
-        mes_nombre = app.controller.obtener_nombre_mes(recibo['mes'])
-        
-        border_color = "#c41e3a" if recibo['estado'] == 'pendiente' else "#2dbe60"
-
-        card = ctk.CTkFrame(
-            scroll_frame,
+    # Lista de recibos (virtualizada: solo existen las filas visibles)
+    def crear_fila(parent):
+        fila = ctk.CTkFrame(
+            parent,
             fg_color="#1a1f3a",
             corner_radius=12,
-            border_width=2,
-            border_color=border_color
+            border_width=2
         )
-        card.pack(fill="x", pady=10, padx=0)
 
-        content = ctk.CTkFrame(card, fg_color="transparent")
+        content = ctk.CTkFrame(fila, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=20, pady=15)
 
-        titulo = f"📄 {recibo['cliente']} - {mes_nombre} {recibo['anio']}"
-        ctk.CTkLabel(
+        fila.titulo = ctk.CTkLabel(
             content,
-            text=titulo,
+            text="",
             font=ctk.CTkFont(size=12, weight="bold"),
             text_color="#ffffff"
-        ).pack(anchor="w")
+        )
+        fila.titulo.pack(anchor="w")
 
-        detalles = f"💰 €{recibo['monto']:.2f}"
-        ctk.CTkLabel(
+        fila.detalles = ctk.CTkLabel(
             content,
-            text=detalles,
+            text="",
             font=ctk.CTkFont(size=11),
             text_color="#7a8492"
-        ).pack(anchor="w", pady=(5, 0))
+        )
+        fila.detalles.pack(anchor="w", pady=(5, 0))
 
-        button_frame = ctk.CTkFrame(card, fg_color="transparent")
-        button_frame.pack(fill="x", padx=20, pady=(10, 0))
+        button_frame = ctk.CTkFrame(fila, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(0, 10))
 
-        if recibo['estado'] == 'pendiente':
-            ctk.CTkButton(
-                button_frame,
-                text="✅ Pagar",
-                command=lambda r=recibo: pagar_recibo_admin(app, r['id']),
-                width=80,
-                height=35,
-                font=ctk.CTkFont(size=11),
-                fg_color="#2dbe60",
-                hover_color="#229d47",
-                corner_radius=8
-            ).pack(side="left", padx=(0, 10))
-        else:
-            ctk.CTkLabel(
-                button_frame,
-                text="✅ PAGADO",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color="#2dbe60"
-            ).pack(side="left")
+        fila.pagar = ctk.CTkButton(
+            button_frame,
+            text="✅ Pagar",
+            width=80,
+            height=35,
+            font=ctk.CTkFont(size=11),
+            fg_color="#2dbe60",
+            hover_color="#229d47",
+            corner_radius=8
+        )
+        fila.pagado = ctk.CTkLabel(
+            button_frame,
+            text="✅ PAGADO",
+            font=ctk.CTkFont(size=11, weight="bold"),
+            text_color="#2dbe60"
+        )
 
         # Botón para descargar/ver factura
-        ctk.CTkButton(
+        fila.descargar = ctk.CTkButton(
             button_frame,
             text="📥 Descargar",
-            command=lambda r=recibo: descargar_factura(app, r['id']),
             width=100,
             height=35,
             font=ctk.CTkFont(size=11),
@@ -924,7 +902,38 @@ def contenido_admin_recibos(app: Any):
             text_color="#0a0e27",
             hover_color="#ffed4e",
             corner_radius=8
-        ).pack(side="right")
+        )
+        fila.descargar.pack(side="right")
+        return fila
+
+    def actualizar_fila(fila, recibo):
+        mes_nombre = app.controller.obtener_nombre_mes(recibo['mes'])
+        pendiente = recibo['estado'] == 'pendiente'
+
+        fila.configure(border_color="#c41e3a" if pendiente else "#2dbe60")
+        fila.titulo.configure(text=f"📄 {recibo['cliente']} - {mes_nombre} {recibo['anio']}")
+        fila.detalles.configure(text=f"💰 €{recibo['monto']:.2f}")
+        fila.descargar.configure(command=lambda: descargar_factura(app, recibo['id']))
+
+        if pendiente:
+            fila.pagado.pack_forget()
+            fila.pagar.configure(command=lambda: pagar_recibo_admin(app, recibo['id']))
+            fila.pagar.pack(side="left", padx=(0, 10))
+        else:
+            fila.pagar.pack_forget()
+            fila.pagado.pack(side="left")
+
+    lista = VirtualList(
+        parent, app,
+        cargar_pagina=lambda cursor: app.controller.obtener_pagina_recibos(cursor),
+        crear_fila=crear_fila,
+        actualizar_fila=actualizar_fila,
+        altura_fila=140,
+        separacion=20,
+        texto_vacio="No hay recibos en el sistema"
+    )
+    lista.pack(fill="both", expand=True)
+    return lista.refrescar
 
 
 def crear_factura_dialog(app: Any):
@@ -1332,88 +1341,98 @@ def nueva_reserva_admin_dialog(app: Any):
 
 
 def mostrar_contenido_admin(app: Any, seccion: str):
-    for widget in app.content_frame.winfo_children():
-        widget.destroy()
+    app.worker.cancel_all()
 
-    if seccion == "dashboard":
-        contenido_dashboard_admin(app)
-    elif seccion == "clientes":
-        contenido_admin_clientes(app)
-    elif seccion == "aparatos":
-        contenido_admin_aparatos(app)
-    elif seccion == "reservas":
-        contenido_admin_reservas(app)
-    elif seccion == "recibos":
-        contenido_admin_recibos(app)
-    elif seccion == "morosos":
-        contenido_admin_morosos(app)
-    elif seccion == "horarios":
+    # Las secciones se construyen una vez por panel y después solo se refrescan
+    if getattr(app, "views", None) is None or app.views.container is not app.content_frame:
         # reuse client horarios
         from .client import contenido_horarios
-        contenido_horarios(app)
 
+        app.views = ViewRegistry(app.content_frame)
+        # Sección -> (constructor, tablas cuyos cambios la refrescan)
+        secciones = {
+            "dashboard": (contenido_dashboard_admin, ("clientes", "aparatos", "reservas", "recibos", "pagos")),
+            "clientes": (contenido_admin_clientes, ("clientes",)),
+            "aparatos": (contenido_admin_aparatos, ("aparatos",)),
+            "reservas": (contenido_admin_reservas, ("reservas", "clientes", "aparatos")),
+            "recibos": (contenido_admin_recibos, ("recibos", "clientes")),
+            "morosos": (contenido_admin_morosos, ("recibos", "clientes")),
+            "horarios": (contenido_horarios, ("reservas", "aparatos")),
+        }
+        for nombre, (builder, tablas) in secciones.items():
+            app.views.register(nombre, lambda parent, b=builder: b(app, parent), tablas)
 
-def contenido_dashboard_admin(app: Any):
+    app.views.show(seccion)
+
+
+def contenido_dashboard_admin(app: Any, parent: Any):
     ctk.CTkLabel(
-        app.content_frame,
+        parent,
         text="📊 Panel de Control",
         font=ctk.CTkFont(size=32, weight="bold")
     ).pack(pady=20)
 
-    stats = app.controller.obtener_estadisticas_generales()
+    datos = ctk.CTkFrame(parent, fg_color="transparent")
+    datos.pack(fill="both", expand=True)
 
-    # Grid de estadísticas
-    stats_grid = ctk.CTkFrame(app.content_frame, fg_color="transparent")
-    stats_grid.pack(fill="both", expand=True, padx=20, pady=20)
+    def pintar(stats):
+        # Grid de estadísticas
+        stats_grid = ctk.CTkFrame(datos, fg_color="transparent")
+        stats_grid.pack(fill="both", expand=True, padx=20, pady=20)
 
-    # Fila 1
-    row1 = ctk.CTkFrame(stats_grid, fg_color="transparent")
-    row1.pack(fill="x", pady=10)
+        # Fila 1
+        row1 = ctk.CTkFrame(stats_grid, fg_color="transparent")
+        row1.pack(fill="x", pady=10)
 
-    crear_stat_card(row1, "👥", stats['total_clientes'], "Clientes").pack(side="left", fill="both", expand=True, padx=5)
-    crear_stat_card(row1, "🏋️", stats['total_aparatos'], "Aparatos").pack(side="left", fill="both", expand=True, padx=5)
-    crear_stat_card(row1, "📅", stats['total_reservas'], "Reservas").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row1, "👥", stats['total_clientes'], "Clientes").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row1, "🏋️", stats['total_aparatos'], "Aparatos").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row1, "📅", stats['total_reservas'], "Reservas").pack(side="left", fill="both", expand=True, padx=5)
 
-    # Fila 2
-    row2 = ctk.CTkFrame(stats_grid, fg_color="transparent")
-    row2.pack(fill="x", pady=10)
+        # Fila 2
+        row2 = ctk.CTkFrame(stats_grid, fg_color="transparent")
+        row2.pack(fill="x", pady=10)
 
-    crear_stat_card(row2, "📄", stats['total_recibos'], "Recibos Totales").pack(side="left", fill="both", expand=True, padx=5)
-    crear_stat_card(row2, "✅", stats['recibos_pagados'], "Recibos Pagados", "green").pack(side="left", fill="both", expand=True, padx=5)
-    crear_stat_card(row2, "⚠️", stats['total_morosos'], "Clientes Morosos", "orange").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row2, "📄", stats['total_recibos'], "Recibos Totales").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row2, "✅", stats['recibos_pagados'], "Recibos Pagados", "green").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row2, "⚠️", stats['total_morosos'], "Clientes Morosos", "orange").pack(side="left", fill="both", expand=True, padx=5)
 
-    # Fila 3 - Financiero
-    row3 = ctk.CTkFrame(stats_grid, fg_color="transparent")
-    row3.pack(fill="x", pady=10)
+        # Fila 3 - Financiero
+        row3 = ctk.CTkFrame(stats_grid, fg_color="transparent")
+        row3.pack(fill="x", pady=10)
 
-    crear_stat_card(row3, "💰", f"€{stats['total_ingresos']:.2f}", "Ingresos Totales", "green").pack(side="left", fill="both", expand=True, padx=5)
-    crear_stat_card(row3, "📉", f"€{stats['deuda_total']:.2f}", "Deuda Pendiente", "red").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row3, "💰", f"€{stats['total_ingresos']:.2f}", "Ingresos Totales", "green").pack(side="left", fill="both", expand=True, padx=5)
+        crear_stat_card(row3, "📉", f"€{stats['deuda_total']:.2f}", "Deuda Pendiente", "red").pack(side="left", fill="both", expand=True, padx=5)
 
-    # Botones de acción rápida
-    action_frame = ctk.CTkFrame(app.content_frame)
-    action_frame.pack(pady=30)
+        # Botones de acción rápida
+        action_frame = ctk.CTkFrame(datos)
+        action_frame.pack(pady=30)
 
-    ctk.CTkButton(
-        action_frame,
-        text="📄 Generar Recibos del Mes",
-        command=lambda: generar_recibos_dialog(app),
-        width=250,
-        height=50,
-        font=ctk.CTkFont(size=16, weight="bold"),
-        fg_color="green",
-        hover_color="darkgreen"
-    ).pack(side="left", padx=10)
+        ctk.CTkButton(
+            action_frame,
+            text="📄 Generar Recibos del Mes",
+            command=lambda: generar_recibos_dialog(app),
+            width=250,
+            height=50,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            fg_color="green",
+            hover_color="darkgreen"
+        ).pack(side="left", padx=10)
 
-    ctk.CTkButton(
-        action_frame,
-        text="⚠️ Ver Clientes Morosos",
-        command=lambda: mostrar_contenido_admin(app, "morosos"),
-        width=250,
-        height=50,
-        font=ctk.CTkFont(size=16, weight="bold"),
-        fg_color="orange",
-        hover_color="darkorange"
-    ).pack(side="left", padx=10)
+        ctk.CTkButton(
+            action_frame,
+            text="⚠️ Ver Clientes Morosos",
+            command=lambda: mostrar_contenido_admin(app, "morosos"),
+            width=250,
+            height=50,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            fg_color="orange",
+            hover_color="darkorange"
+        ).pack(side="left", padx=10)
+
+    def refrescar():
+        recargar_seccion(app, datos, app.controller.obtener_estadisticas_generales, pintar)
+
+    return refrescar
 
 
 def generar_recibos_dialog(app: Any):
@@ -1473,8 +1492,8 @@ def generar_recibos_dialog(app: Any):
     ).pack(pady=30)
 
 
-def contenido_admin_clientes(app: Any):
-    header = ctk.CTkFrame(app.content_frame, fg_color="transparent")
+def contenido_admin_clientes(app: Any, parent: Any):
+    header = ctk.CTkFrame(parent, fg_color="transparent")
     header.pack(fill="x", pady=20, padx=20)
 
     ctk.CTkLabel(
@@ -1491,46 +1510,37 @@ def contenido_admin_clientes(app: Any):
         height=40
     ).pack(side="right")
 
-    # Lista de clientes
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame)
-    scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-    clientes = app.controller.obtener_clientes()
-
-    if not clientes:
-        ctk.CTkLabel(
-            scroll_frame,
-            text="No hay clientes en el sistema",
-            font=ctk.CTkFont(size=16),
-            text_color="gray"
-        ).pack(pady=40)
-        return
-
-    for cliente in clientes:
-        card = ctk.CTkFrame(scroll_frame)
-        card.pack(fill="x", pady=5, padx=10)
+    # Lista de clientes (virtualizada: solo existen las filas visibles)
+    def crear_fila(parent):
+        fila = ctk.CTkFrame(parent)
+        fila.info = ctk.CTkLabel(fila, text="", font=ctk.CTkFont(size=13), justify="left")
+        fila.info.pack(side="left", pady=15, padx=20)
+        fila.eliminar = ctk.CTkButton(fila, text="❌", width=60, fg_color="red", hover_color="darkred")
+        return fila
 
+    def actualizar_fila(fila, cliente):
         tipo_emoji = "👑" if cliente['tipo'] == 'admin' else "👤"
-        info_text = f"{tipo_emoji} {cliente['nombre']} {cliente['apellido']}\n" \
-                    f"DNI: {cliente['dni']} | Tel: {cliente['telefono']} | Email: {cliente['email']}"
-
-        ctk.CTkLabel(
-            card,
-            text=info_text,
-            font=ctk.CTkFont(size=13),
-            justify="left"
-        ).pack(side="left", pady=15, padx=20)
-
+        fila.info.configure(
+            text=f"{tipo_emoji} {cliente['nombre']} {cliente['apellido']}\n"
+                 f"DNI: {cliente['dni']} | Tel: {cliente['telefono']} | Email: {cliente['email']}"
+        )
         # No permitir eliminar a usuarios admin (seguridad)
         if cliente['tipo'] != 'admin':
-            ctk.CTkButton(
-                card,
-                text="❌",
-                command=lambda c=cliente: eliminar_cliente(app, c['id']),
-                width=60,
-                fg_color="red",
-                hover_color="darkred"
-            ).pack(side="right", pady=10, padx=10)
+            fila.eliminar.configure(command=lambda: eliminar_cliente(app, cliente['id']))
+            fila.eliminar.pack(side="right", pady=10, padx=10)
+        else:
+            fila.eliminar.pack_forget()
+
+    lista = VirtualList(
+        parent, app,
+        cargar_pagina=lambda cursor: app.controller.obtener_pagina_clientes(cursor),
+        crear_fila=crear_fila,
+        actualizar_fila=actualizar_fila,
+        altura_fila=80,
+        texto_vacio="No hay clientes en el sistema"
+    )
+    lista.pack(fill="both", expand=True, padx=20, pady=10)
+    return lista.refrescar
 
 
 def nuevo_cliente_dialog(app: Any):
@@ -1592,8 +1602,8 @@ def nuevo_cliente_dialog(app: Any):
     ).pack(pady=20)
 
 
-def contenido_admin_aparatos(app: Any):
-    header = ctk.CTkFrame(app.content_frame, fg_color="transparent")
+def contenido_admin_aparatos(app: Any, parent: Any):
+    header = ctk.CTkFrame(parent, fg_color="transparent")
     header.pack(fill="x", pady=20, padx=20)
 
     ctk.CTkLabel(
@@ -1610,15 +1620,9 @@ def contenido_admin_aparatos(app: Any):
         height=40
     ).pack(side="right")
 
-    # Lista de aparatos
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame)
-    scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-    aparatos = app.controller.obtener_aparatos()
-
-    for aparato in aparatos:
-        card = ctk.CTkFrame(scroll_frame)
-        card.pack(fill="x", pady=5, padx=10)
+    # Lista de aparatos (se actualiza solo en las filas que cambian)
+    def crear_fila(parent, aparato):
+        card = ctk.CTkFrame(parent)
 
         info_text = f"🏋️ {aparato['nombre']}\n" \
                     f"Tipo: {aparato['tipo']} | {aparato['descripcion']}"
@@ -1633,11 +1637,21 @@ def contenido_admin_aparatos(app: Any):
         ctk.CTkButton(
             card,
             text="❌",
-            command=lambda a=aparato: eliminar_aparato(app, a['id']),
+            command=lambda: eliminar_aparato(app, aparato['id']),
             width=60,
             fg_color="red",
             hover_color="darkred"
         ).pack(side="right", pady=10, padx=10)
+        return card
+
+    lista = KeyedList(
+        parent, app,
+        cargar=app.controller.obtener_aparatos,
+        crear_fila=crear_fila,
+        texto_vacio="No hay aparatos en el sistema"
+    )
+    lista.pack(fill="both", expand=True, padx=20, pady=10)
+    return lista.refrescar
 
 
 def nuevo_aparato_dialog(app: Any):
@@ -1694,8 +1708,8 @@ def eliminar_aparato(app: Any, id_aparato: int):
             messagebox.showerror("Error", mensaje)
 
 
-def contenido_admin_reservas(app: Any):
-    header = ctk.CTkFrame(app.content_frame, fg_color="transparent")
+def contenido_admin_reservas(app: Any, parent: Any):
+    header = ctk.CTkFrame(parent, fg_color="transparent")
     header.pack(fill="x", pady=20, padx=20)
 
     ctk.CTkLabel(
@@ -1712,104 +1726,105 @@ def contenido_admin_reservas(app: Any):
         height=40
     ).pack(side="right")
 
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame)
-    scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
+    # Listas virtualizadas: solo existen las filas visibles
+    def crear_fila_pendiente(parent):
+        fila = ctk.CTkFrame(parent, fg_color="#3a3a3a")
+        fila.info = ctk.CTkLabel(fila, text="", font=ctk.CTkFont(size=13), justify="left")
+        fila.info.pack(side="left", pady=15, padx=20)
+
+        # Botones de aceptar y rechazar
+        buttons_frame = ctk.CTkFrame(fila, fg_color="transparent")
+        buttons_frame.pack(side="right", pady=10, padx=10)
+
+        fila.aceptar = ctk.CTkButton(
+            buttons_frame,
+            text="✅ Aceptar",
+            width=90,
+            fg_color="green",
+            hover_color="darkgreen"
+        )
+        fila.aceptar.pack(side="left", padx=5)
+
+        fila.rechazar = ctk.CTkButton(
+            buttons_frame,
+            text="❌ Rechazar",
+            width=90,
+            fg_color="red",
+            hover_color="darkred"
+        )
+        fila.rechazar.pack(side="left", padx=5)
+        return fila
+
+    def actualizar_fila_pendiente(fila, reserva):
+        fila.info.configure(
+            text=f"👤 {reserva['cliente']} | 🏋️ {reserva['aparato']}\n"
+                 f"📅 {reserva['dia']} | ⏰ {reserva['hora_inicio']} - {reserva['hora_fin']}"
+        )
+        fila.aceptar.configure(command=lambda: admin_aceptar_reserva(app, reserva['id']))
+        fila.rechazar.configure(command=lambda: admin_rechazar_reserva(app, reserva['id']))
+
+    def crear_fila_aceptada(parent):
+        fila = ctk.CTkFrame(parent)
+        fila.info = ctk.CTkLabel(fila, text="", font=ctk.CTkFont(size=13), justify="left")
+        fila.info.pack(side="left", pady=15, padx=20)
+        fila.eliminar = ctk.CTkButton(
+            fila,
+            text="🗑️ Eliminar",
+            width=100,
+            fg_color="red",
+            hover_color="darkred"
+        )
+        fila.eliminar.pack(side="right", pady=10, padx=10)
+        return fila
+
+    def actualizar_fila_aceptada(fila, reserva):
+        fila.info.configure(
+            text=f"👤 {reserva['cliente']} | 🏋️ {reserva['aparato']}\n"
+                 f"📅 {reserva['dia']} | ⏰ {reserva['hora_inicio']} - {reserva['hora_fin']}"
+        )
+        fila.eliminar.configure(command=lambda: admin_eliminar_reserva(app, reserva['id']))
 
     # Sección de Reservas Pendientes
     ctk.CTkLabel(
-        scroll_frame,
+        parent,
         text="⏳ RESERVAS PENDIENTES DE APROBACIÓN",
         font=ctk.CTkFont(size=14, weight="bold"),
         text_color="orange"
-    ).pack(pady=(20, 10), padx=10)
-
-    reservas_pendientes = app.controller.obtener_reservas_pendientes()
-    
-    if reservas_pendientes:
-        for reserva in reservas_pendientes:
-            card = ctk.CTkFrame(scroll_frame, fg_color="#3a3a3a")
-            card.pack(fill="x", pady=5, padx=10)
-
-            info_text = f"👤 {reserva['cliente']} | 🏋️ {reserva['aparato']}\n" \
-                        f"📅 {reserva['dia']} | ⏰ {reserva['hora_inicio']} - {reserva['hora_fin']}"
-
-            ctk.CTkLabel(
-                card,
-                text=info_text,
-                font=ctk.CTkFont(size=13),
-                justify="left"
-            ).pack(side="left", pady=15, padx=20)
-
-            # Botones de aceptar y rechazar
-            buttons_frame = ctk.CTkFrame(card, fg_color="transparent")
-            buttons_frame.pack(side="right", pady=10, padx=10)
-
-            ctk.CTkButton(
-                buttons_frame,
-                text="✅ Aceptar",
-                command=lambda r=reserva: admin_aceptar_reserva(app, r['id']),
-                width=90,
-                fg_color="green",
-                hover_color="darkgreen"
-            ).pack(side="left", padx=5)
-
-            ctk.CTkButton(
-                buttons_frame,
-                text="❌ Rechazar",
-                command=lambda r=reserva: admin_rechazar_reserva(app, r['id']),
-                width=90,
-                fg_color="red",
-                hover_color="darkred"
-            ).pack(side="left", padx=5)
-    else:
-        ctk.CTkLabel(
-            scroll_frame,
-            text="No hay reservas pendientes",
-            font=ctk.CTkFont(size=12),
-            text_color="gray"
-        ).pack(pady=20, padx=10)
+    ).pack(pady=(10, 5), padx=10)
+
+    pendientes = VirtualList(
+        parent, app,
+        cargar_pagina=lambda cursor: app.controller.obtener_pagina_reservas_pendientes(cursor),
+        crear_fila=crear_fila_pendiente,
+        actualizar_fila=actualizar_fila_pendiente,
+        altura_fila=80,
+        texto_vacio="No hay reservas pendientes"
+    )
+    pendientes.pack(fill="both", expand=True, padx=20, pady=5)
 
     # Sección de Reservas Aceptadas
     ctk.CTkLabel(
-        scroll_frame,
+        parent,
         text="✅ RESERVAS ACEPTADAS",
         font=ctk.CTkFont(size=14, weight="bold"),
         text_color="green"
-    ).pack(pady=(30, 10), padx=10)
-
-    reservas = app.controller.obtener_todas_reservas()
-    reservas_aceptadas = [r for r in reservas if r.get('estado') == 'aceptada']
-
-    if reservas_aceptadas:
-        for reserva in reservas_aceptadas:
-            card = ctk.CTkFrame(scroll_frame)
-            card.pack(fill="x", pady=5, padx=10)
-
-            info_text = f"👤 {reserva['cliente']} | 🏋️ {reserva['aparato']}\n" \
-                        f"📅 {reserva['dia']} | ⏰ {reserva['hora_inicio']} - {reserva['hora_fin']}"
+    ).pack(pady=(10, 5), padx=10)
+
+    aceptadas = VirtualList(
+        parent, app,
+        cargar_pagina=lambda cursor: app.controller.obtener_pagina_reservas_por_estado('aceptada', cursor),
+        crear_fila=crear_fila_aceptada,
+        actualizar_fila=actualizar_fila_aceptada,
+        altura_fila=80,
+        texto_vacio="No hay reservas aceptadas"
+    )
+    aceptadas.pack(fill="both", expand=True, padx=20, pady=5)
 
-            ctk.CTkLabel(
-                card,
-                text=info_text,
-                font=ctk.CTkFont(size=13),
-                justify="left"
-            ).pack(side="left", pady=15, padx=20)
+    def refrescar():
+        pendientes.refrescar()
+        aceptadas.refrescar()
 
-            ctk.CTkButton(
-                card,
-                text="🗑️ Eliminar",
-                command=lambda r=reserva: admin_eliminar_reserva(app, r['id']),
-                width=100,
-                fg_color="red",
-                hover_color="darkred"
-            ).pack(side="right", pady=10, padx=10)
-    else:
-        ctk.CTkLabel(
-            scroll_frame,
-            text="No hay reservas aceptadas",
-            font=ctk.CTkFont(size=12),
-            text_color="gray"
-        ).pack(pady=20, padx=10)
+    return refrescar
 
 
 def admin_aceptar_reserva(app: Any, id_reserva: int):
@@ -1841,30 +1856,15 @@ def admin_eliminar_reserva(app: Any, id_reserva: int):
             messagebox.showerror("Error", mensaje)
 
 
-def contenido_admin_morosos(app: Any):
+def contenido_admin_morosos(app: Any, parent: Any):
     ctk.CTkLabel(
-        app.content_frame,
+        parent,
         text="⚠️ Clientes Morosos",
         font=ctk.CTkFont(size=28, weight="bold")
     ).pack(pady=20)
 
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame)
-    scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-    morosos = app.controller.obtener_morosos()
-
-    if not morosos:
-        ctk.CTkLabel(
-            scroll_frame,
-            text="✅ No hay clientes morosos",
-            font=ctk.CTkFont(size=18),
-            text_color="green"
-        ).pack(pady=40)
-        return
-
-    for moroso in morosos:
-        card = ctk.CTkFrame(scroll_frame, border_width=2, border_color="orange")
-        card.pack(fill="x", pady=5, padx=10)
+    def crear_fila(parent, moroso):
+        card = ctk.CTkFrame(parent, border_width=2, border_color="orange")
 
         info_text = f"⚠️ {moroso['nombre']} {moroso['apellido']}\n" \
                     f"DNI: {moroso['dni']} | Tel: {moroso['telefono']}\n" \
@@ -1876,6 +1876,16 @@ def contenido_admin_morosos(app: Any):
             font=ctk.CTkFont(size=13),
             justify="left"
         ).pack(pady=15, padx=20)
+        return card
+
+    lista = KeyedList(
+        parent, app,
+        cargar=app.controller.obtener_morosos,
+        crear_fila=crear_fila,
+        texto_vacio="✅ No hay clientes morosos"
+    )
+    lista.pack(fill="both", expand=True, padx=20, pady=10)
+    return lista.refrescar
 
 
 def eliminar_cliente(app: Any, id_cliente: int):
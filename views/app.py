@@ -11,7 +11,9 @@ ctk.set_default_color_theme("blue")
 
 # Import views separated
 from .login import mostrar_login as mostrar_login_view, mostrar_registro as mostrar_registro_view
-from .components import crear_boton_menu, crear_boton_admin, crear_stat_card
+from .components import crear_boton_menu, crear_boton_admin, crear_stat_card, recargar_seccion, KeyedList
+from .registry import ViewRegistry
+from .worker import BackgroundWorker, AsyncController
 from . import admin as admin_module
 # Importar la vista de notificaciones del cliente (reutilizar implementación)
 from .client import contenido_notificaciones
@@ -20,11 +22,23 @@ from .client import contenido_notificaciones
 class GymApp(ctk.CTk):
     """Aplicación principal del gimnasio"""
 
+    # Milisegundos entre comprobaciones de cambios en la base de datos
+    INTERVALO_CAMBIOS = 2000
+
     def __init__(self):
         super().__init__()
 
         self.controller = GymController()
         self.current_frame: Optional[ctk.CTkFrame] = None
+        self.views: Optional[ViewRegistry] = None
+
+        # Consultas en segundo plano (los resultados vuelven al hilo de Tk)
+        self.worker = BackgroundWorker(self)
+        self.async_controller = AsyncController(self.controller, self.worker)
+
+        # Cambios de otros terminales: refrescan la sección visible si la afectan
+        self._comprobacion_cambios = None
+        self._vigilancia_cambios = self.after(self.INTERVALO_CAMBIOS, self._vigilar_cambios)
 
         # Configuración de la ventana
         self.title("GymForTheMoment - Sistema de Gestión")
@@ -46,8 +60,28 @@ class GymApp(ctk.CTk):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
 
+    def destroy(self):
+        """Detiene las tareas en segundo plano antes de cerrar la ventana"""
+        self.after_cancel(self._vigilancia_cambios)
+        self.worker.shutdown()
+        super().destroy()
+
+    def _vigilar_cambios(self):
+        """Comprueba en segundo plano si la base de datos cambió"""
+        if self._comprobacion_cambios is None or self._comprobacion_cambios.done():
+            self._comprobacion_cambios = self.worker.submit(
+                self.controller.comprobar_cambios, on_success=self._al_cambiar_tablas
+            )
+        self._vigilancia_cambios = self.after(self.INTERVALO_CAMBIOS, self._vigilar_cambios)
+
+    def _al_cambiar_tablas(self, tablas):
+        """Refresca la sección visible si depende de las tablas cambiadas"""
+        if tablas and self.views is not None and self.views.container.winfo_exists():
+            self.views.notify_changed(tablas)
+
     def limpiar_ventana(self):
         """Limpia todos los widgets de la ventana"""
+        self.worker.cancel_all()
         for widget in self.winfo_children():
             widget.destroy()
 
@@ -154,119 +188,127 @@ class GymApp(ctk.CTk):
 
     def mostrar_contenido_cliente(self, seccion: str):
         """Muestra el contenido según la sección seleccionada"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        if seccion == "inicio":
-            self.contenido_inicio_cliente()
-        elif seccion == "reservar":
-            self.contenido_reservar()
-        elif seccion == "mis_reservas":
-            self.contenido_mis_reservas()
-        elif seccion == "notificaciones":
+        self.worker.cancel_all()
+
+        # Las secciones se construyen una vez por panel y después solo se refrescan
+        if self.views is None or self.views.container is not self.content_frame:
+            self.views = ViewRegistry(self.content_frame)
+            self.views.register("inicio", self.contenido_inicio_cliente, ("reservas", "recibos"))
+            self.views.register("reservar", self.contenido_reservar, ("aparatos",))
+            self.views.register("mis_reservas", self.contenido_mis_reservas, ("reservas", "aparatos"))
             # Delegar a la implementación de notificaciones en views.client
-            contenido_notificaciones(self)
-        elif seccion == "pagos":
-            self.contenido_pagos()
-        elif seccion == "horarios":
-            self.contenido_horarios()
+            self.views.register("notificaciones", lambda parent: contenido_notificaciones(self, parent),
+                                ("notificaciones",))
+            self.views.register("pagos", self.contenido_pagos, ("recibos", "pagos"))
+            self.views.register("horarios", self.contenido_horarios, ("reservas", "aparatos"))
+
+        self.views.show(seccion)
 
-    def contenido_inicio_cliente(self):
+    def contenido_inicio_cliente(self, parent):
         """Contenido de inicio para cliente"""
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="🏋️ Bienvenido a GymForTheMoment",
             font=ctk.CTkFont(size=32, weight="bold")
         ).pack(pady=(20, 10))
 
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Gimnasio 24/7 - Lunes a Viernes",
             font=ctk.CTkFont(size=18)
         ).pack(pady=(0, 40))
 
-        # Tarjetas de información
-        info_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        info_frame.pack(fill="both", expand=True, padx=20)
-
-        # Obtener datos
-        mis_reservas = self.controller.obtener_mis_reservas()
-        mis_recibos = self.controller.obtener_mis_recibos_pendientes()
+        datos = ctk.CTkFrame(parent, fg_color="transparent")
+        datos.pack(fill="both", expand=True)
 
-        # Tarjeta reservas
-        card1 = ctk.CTkFrame(info_frame)
-        card1.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        def pintar(mis_reservas, mis_recibos):
+            # Tarjetas de información
+            info_frame = ctk.CTkFrame(datos, fg_color="transparent")
+            info_frame.pack(fill="both", expand=True, padx=20)
 
-        ctk.CTkLabel(card1, text="📅", font=ctk.CTkFont(size=48)).pack(pady=(20, 10))
-        ctk.CTkLabel(
-            card1,
-            text=f"{len(mis_reservas)}",
-            font=ctk.CTkFont(size=42, weight="bold")
-        ).pack()
-        ctk.CTkLabel(
-            card1,
-            text="Reservas Activas",
-            font=ctk.CTkFont(size=16)
-        ).pack(pady=(0, 20))
+            # Tarjeta reservas
+            card1 = ctk.CTkFrame(info_frame)
+            card1.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
-        # Tarjeta pagos
-        card2 = ctk.CTkFrame(info_frame)
-        card2.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+            ctk.CTkLabel(card1, text="📅", font=ctk.CTkFont(size=48)).pack(pady=(20, 10))
+            ctk.CTkLabel(
+                card1,
+                text=f"{len(mis_reservas)}",
+                font=ctk.CTkFont(size=42, weight="bold")
+            ).pack()
+            ctk.CTkLabel(
+                card1,
+                text="Reservas Activas",
+                font=ctk.CTkFont(size=16)
+            ).pack(pady=(0, 20))
 
-        ctk.CTkLabel(card2, text="💳", font=ctk.CTkFont(size=48)).pack(pady=(20, 10))
-        ctk.CTkLabel(
-            card2,
-            text=f"{len(mis_recibos)}",
-            font=ctk.CTkFont(size=42, weight="bold"),
-            text_color="orange" if len(mis_recibos) > 0 else "green"
-        ).pack()
-        ctk.CTkLabel(
-            card2,
-            text="Pagos Pendientes",
-            font=ctk.CTkFont(size=16)
-        ).pack(pady=(0, 20))
+            # Tarjeta pagos
+            card2 = ctk.CTkFrame(info_frame)
+            card2.pack(side="left", fill="both", expand=True, padx=10, pady=10)
 
-        # Botones de acción rápida
-        action_frame = ctk.CTkFrame(self.content_frame)
-        action_frame.pack(pady=30, padx=20)
+            ctk.CTkLabel(card2, text="💳", font=ctk.CTkFont(size=48)).pack(pady=(20, 10))
+            ctk.CTkLabel(
+                card2,
+                text=f"{len(mis_recibos)}",
+                font=ctk.CTkFont(size=42, weight="bold"),
+                text_color="orange" if len(mis_recibos) > 0 else "green"
+            ).pack()
+            ctk.CTkLabel(
+                card2,
+                text="Pagos Pendientes",
+                font=ctk.CTkFont(size=16)
+            ).pack(pady=(0, 20))
 
-        ctk.CTkButton(
-            action_frame,
-            text="📅 Nueva Reserva",
-            command=lambda: self.mostrar_contenido_cliente("reservar"),
-            width=200,
-            height=50,
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(side="left", padx=10)
+            # Botones de acción rápida
+            action_frame = ctk.CTkFrame(datos)
+            action_frame.pack(pady=30, padx=20)
 
-        if len(mis_recibos) > 0:
             ctk.CTkButton(
                 action_frame,
-                text="💰 Pagar Ahora",
-                command=lambda: self.mostrar_contenido_cliente("pagos"),
+                text="📅 Nueva Reserva",
+                command=lambda: self.mostrar_contenido_cliente("reservar"),
                 width=200,
                 height=50,
-                font=ctk.CTkFont(size=16, weight="bold"),
-                fg_color="orange",
-                hover_color="darkorange"
+                font=ctk.CTkFont(size=16, weight="bold")
             ).pack(side="left", padx=10)
 
-    def contenido_reservar(self):
+            if len(mis_recibos) > 0:
+                ctk.CTkButton(
+                    action_frame,
+                    text="💰 Pagar Ahora",
+                    command=lambda: self.mostrar_contenido_cliente("pagos"),
+                    width=200,
+                    height=50,
+                    font=ctk.CTkFont(size=16, weight="bold"),
+                    fg_color="orange",
+                    hover_color="darkorange"
+                ).pack(side="left", padx=10)
+
+        def refrescar():
+            recargar_seccion(
+                self, datos,
+                lambda: (self.controller.obtener_mis_reservas(), self.controller.obtener_mis_recibos_pendientes()),
+                lambda resultado: pintar(*resultado)
+            )
+
+        return refrescar
+
+    def contenido_reservar(self, parent):
         """Contenido para hacer reservas"""
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="📅 Nueva Reserva",
             font=ctk.CTkFont(size=28, weight="bold")
         ).pack(pady=20)
 
         # Frame de formulario
-        form_frame = ctk.CTkFrame(self.content_frame)
+        form_frame = ctk.CTkFrame(parent)
         form_frame.pack(pady=20, padx=100, fill="both", expand=True)
 
         # Aparato
         ctk.CTkLabel(form_frame, text="Seleccione el aparato:", font=ctk.CTkFont(size=14)).pack(pady=(20, 5))
-        aparatos = self.controller.obtener_aparatos()
-        aparato_names = [f"{a['nombre']} - {a['tipo']}" for a in aparatos]
+        aparatos = []
+        aparato_names = []
         aparato_combo = ctk.CTkComboBox(form_frame, values=aparato_names, width=400, height=40)
         aparato_combo.pack(pady=5)
 
@@ -321,32 +363,26 @@ class GymApp(ctk.CTk):
             font=ctk.CTkFont(size=16, weight="bold")
         ).pack(pady=30)
 
-    def contenido_mis_reservas(self):
+        def refrescar():
+            def pintar(lista):
+                aparatos[:] = lista
+                aparato_names[:] = [f"{a['nombre']} - {a['tipo']}" for a in lista]
+                aparato_combo.configure(values=aparato_names)
+
+            self.async_controller.obtener_aparatos(on_success=pintar, owner=form_frame)
+
+        return refrescar
+
+    def contenido_mis_reservas(self, parent):
         """Contenido de mis reservas"""
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="📋 Mis Reservas",
             font=ctk.CTkFont(size=28, weight="bold")
         ).pack(pady=20)
 
-        reservas = self.controller.obtener_mis_reservas()
-
-        if not reservas:
-            ctk.CTkLabel(
-                self.content_frame,
-                text="No tienes reservas activas",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            ).pack(pady=40)
-            return
-
-        # Scrollable frame
-        scroll_frame = ctk.CTkScrollableFrame(self.content_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-        for reserva in reservas:
-            card = ctk.CTkFrame(scroll_frame)
-            card.pack(fill="x", pady=5, padx=10)
+        def crear_fila(parent, reserva):
+            card = ctk.CTkFrame(parent)
 
             info_text = f"🏋️ {reserva['aparato']} ({reserva['tipo']})\n" \
                        f"📅 {reserva['dia']} | ⏰ {reserva['hora_inicio']} - {reserva['hora_fin']}"
@@ -366,6 +402,16 @@ class GymApp(ctk.CTk):
                 fg_color="red",
                 hover_color="darkred"
             ).pack(side="right", pady=10, padx=20)
+            return card
+
+        lista = KeyedList(
+            parent, self,
+            cargar=self.controller.obtener_mis_reservas,
+            crear_fila=crear_fila,
+            texto_vacio="No tienes reservas activas"
+        )
+        lista.pack(fill="both", expand=True, padx=20, pady=10)
+        return lista.refrescar
 
     def cancelar_reserva(self, id_reserva: int):
         """Cancela una reserva"""
@@ -377,32 +423,16 @@ class GymApp(ctk.CTk):
             else:
                 messagebox.showerror("Error", mensaje)
 
-    def contenido_pagos(self):
+    def contenido_pagos(self, parent):
         """Contenido de pagos"""
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="💳 Gestión de Pagos",
             font=ctk.CTkFont(size=28, weight="bold")
         ).pack(pady=20)
 
-        recibos = self.controller.obtener_mis_recibos()
-
-        if not recibos:
-            ctk.CTkLabel(
-                self.content_frame,
-                text="No hay recibos disponibles",
-                font=ctk.CTkFont(size=16),
-                text_color="gray"
-            ).pack(pady=40)
-            return
-
-        # Scrollable frame
-        scroll_frame = ctk.CTkScrollableFrame(self.content_frame)
-        scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-        for recibo in recibos:
-            card = ctk.CTkFrame(scroll_frame)
-            card.pack(fill="x", pady=5, padx=10)
+        def crear_fila(parent, recibo):
+            card = ctk.CTkFrame(parent)
 
             mes_nombre = self.controller.obtener_nombre_mes(recibo['mes'])
             info_text = f"📄 Recibo {mes_nombre} {recibo['anio']}\n" \
@@ -431,6 +461,16 @@ class GymApp(ctk.CTk):
                     font=ctk.CTkFont(size=12, weight="bold"),
                     text_color="green"
                 ).pack(side="right", pady=15, padx=20)
+            return card
+
+        lista = KeyedList(
+            parent, self,
+            cargar=self.controller.obtener_mis_recibos,
+            crear_fila=crear_fila,
+            texto_vacio="No hay recibos disponibles"
+        )
+        lista.pack(fill="both", expand=True, padx=20, pady=10)
+        return lista.refrescar
 
     def pagar_recibo(self, id_recibo: int):
         """Procesa el pago de un recibo"""
@@ -442,16 +482,16 @@ class GymApp(ctk.CTk):
             else:
                 messagebox.showerror("Error", mensaje)
 
-    def contenido_horarios(self):
+    def contenido_horarios(self, parent):
         """Contenido de horarios disponibles"""
         ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="🕐 Horarios Ocupados",
             font=ctk.CTkFont(size=28, weight="bold")
         ).pack(pady=20)
 
         # Selector de día
-        dia_frame = ctk.CTkFrame(self.content_frame)
+        dia_frame = ctk.CTkFrame(parent)
         dia_frame.pack(pady=10)
 
         ctk.CTkLabel(dia_frame, text="Seleccione el día:", font=ctk.CTkFont(size=14)).pack(side="left", padx=10)
@@ -466,15 +506,10 @@ class GymApp(ctk.CTk):
         dia_combo.pack(side="left", padx=10)
 
         # Frame para mostrar ocupación
-        ocupacion_frame = ctk.CTkScrollableFrame(self.content_frame)
+        ocupacion_frame = ctk.CTkScrollableFrame(parent)
         ocupacion_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        def mostrar_ocupacion():
-            for widget in ocupacion_frame.winfo_children():
-                widget.destroy()
-
-            ocupacion = self.controller.obtener_ocupacion_dia(dia_var.get())
-
+        def pintar(ocupacion):
             if not ocupacion:
                 ctk.CTkLabel(
                     ocupacion_frame,
@@ -498,6 +533,10 @@ class GymApp(ctk.CTk):
                     justify="left"
                 ).pack(pady=15, padx=20)
 
+        def mostrar_ocupacion():
+            dia = dia_var.get()
+            recargar_seccion(self, ocupacion_frame, lambda: self.controller.obtener_ocupacion_dia(dia), pintar)
+
         ctk.CTkButton(
             dia_frame,
             text="🔍 Ver Ocupación",
@@ -505,7 +544,7 @@ class GymApp(ctk.CTk):
             width=150
         ).pack(side="left", padx=10)
 
-        mostrar_ocupacion()
+        return mostrar_ocupacion
 
     def cerrar_sesion(self):
         """Cierra la sesión del usuario"""
@@ -518,9 +557,6 @@ class GymApp(ctk.CTk):
 
     def mostrar_contenido_admin(self, seccion: str):
         """Muestra el contenido según la sección del admin (delegado a views.admin)"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
         admin_module.mostrar_contenido_admin(self, seccion)
 
 
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import Any
+from views.components import recargar_seccion, KeyedList
 
 
 def mostrar_dashboard_cliente(app: Any):
@@ -987,31 +988,15 @@ def contenido_mis_reservas(app: Any):
             ).pack(side="right", pady=10, padx=5)
 
 
-def contenido_notificaciones(app: Any):
+def contenido_notificaciones(app: Any, parent: Any):
     ctk.CTkLabel(
-        app.content_frame,
+        parent,
         text="🔔 Notificaciones",
         font=ctk.CTkFont(size=28, weight="bold")
     ).pack(pady=20)
 
-    notificaciones = app.controller.obtener_mis_notificaciones()
-
-    if not notificaciones:
-        ctk.CTkLabel(
-            app.content_frame,
-            text="No tienes notificaciones",
-            font=ctk.CTkFont(size=16),
-            text_color="gray"
-        ).pack(pady=40)
-        return
-
-    # Scrollable frame
-    scroll_frame = ctk.CTkScrollableFrame(app.content_frame)
-    scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-    for notif in notificaciones:
-        card = ctk.CTkFrame(scroll_frame)
-        card.pack(fill="x", pady=5, padx=10)
+    def crear_fila(parent, notif):
+        card = ctk.CTkFrame(parent)
 
         # Determinar color según tipo
         if notif['tipo'] == 'aceptada':
@@ -1063,6 +1048,16 @@ def contenido_notificaciones(app: Any):
             fg_color="#b22222",
             hover_color="#a11a1a"
         ).pack(side="right", pady=10, padx=5)
+        return card
+
+    lista = KeyedList(
+        parent, app,
+        cargar=app.controller.obtener_mis_notificaciones,
+        crear_fila=crear_fila,
+        texto_vacio="No tienes notificaciones"
+    )
+    lista.pack(fill="both", expand=True, padx=20, pady=10)
+    return lista.refrescar
 
 
 def aceptar_notificacion(app: Any, id_notificacion: int):
@@ -1182,15 +1177,15 @@ def pagar_recibo(app: Any, id_recibo: int):
             messagebox.showerror("Error", mensaje)
 
 
-def contenido_horarios(app: Any):
+def contenido_horarios(app: Any, parent: Any):
     ctk.CTkLabel(
-        app.content_frame,
+        parent,
         text="🕐 Horarios Ocupados",
         font=ctk.CTkFont(size=28, weight="bold")
     ).pack(pady=20)
 
     # Selector de día
-    dia_frame = ctk.CTkFrame(app.content_frame)
+    dia_frame = ctk.CTkFrame(parent)
     dia_frame.pack(pady=10)
 
     ctk.CTkLabel(dia_frame, text="Seleccione el día:", font=ctk.CTkFont(size=14)).pack(side="left", padx=10)
@@ -1205,15 +1200,10 @@ def contenido_horarios(app: Any):
     dia_combo.pack(side="left", padx=10)
 
     # Frame para mostrar ocupación
-    ocupacion_frame = ctk.CTkScrollableFrame(app.content_frame)
+    ocupacion_frame = ctk.CTkScrollableFrame(parent)
     ocupacion_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-    def mostrar_ocupacion():
-        for widget in ocupacion_frame.winfo_children():
-            widget.destroy()
-
-        ocupacion = app.controller.obtener_ocupacion_dia(dia_var.get())
-
+    def pintar(ocupacion):
         if not ocupacion:
             ctk.CTkLabel(
                 ocupacion_frame,
@@ -1237,6 +1227,10 @@ def contenido_horarios(app: Any):
                 justify="left"
             ).pack(pady=15, padx=20)
 
+    def mostrar_ocupacion():
+        dia = dia_var.get()
+        recargar_seccion(app, ocupacion_frame, lambda: app.controller.obtener_ocupacion_dia(dia), pintar)
+
     ctk.CTkButton(
         dia_frame,
         text="🔍 Ver Ocupación",
@@ -1244,4 +1238,4 @@ def contenido_horarios(app: Any):
         width=150
     ).pack(side="left", padx=10)
 
-    mostrar_ocupacion()
+    return mostrar_ocupacion
@@ -52,3 +52,360 @@ def crear_stat_card(parent, icono, valor, texto, color="blue"):
     ).pack(pady=(0, 15))
 
     return card
+
+
+def crear_indicador_carga(parent, texto="⏳ Cargando..."):
+    label = ctk.CTkLabel(
+        parent,
+        text=texto,
+        font=ctk.CTkFont(size=14),
+        text_color="gray"
+    )
+    label.pack(pady=40)
+    return label
+
+
+def recargar_seccion(app, frame, cargar, pintar):
+    for widget in frame.winfo_children():
+        widget.destroy()
+    cargando = crear_indicador_carga(frame)
+
+    def entregar(datos):
+        cargando.destroy()
+        pintar(datos)
+
+    return app.worker.submit(cargar, on_success=entregar, owner=frame)
+
+
+class VirtualList(ctk.CTkFrame):
+    """Lista virtualizada para tablas grandes.
+
+    Solo existen los widgets de las filas visibles (más una de margen): al
+    desplazarse se reutilizan con los datos de otra fila. Las filas se
+    piden por páginas en segundo plano (``app.worker``) a medida que el
+    desplazamiento se acerca al final de lo cargado. La primera página se
+    pide al llamar a ``recargar()``; ``refrescar()`` vuelve a pedir lo
+    cargado hasta la zona visible y solo repinta las filas cuyo elemento
+    ha cambiado.
+
+    Args:
+        parent: Widget contenedor
+        app: Aplicación (usa ``app.worker`` para cargar las páginas)
+        cargar_pagina: ``f(cursor) -> {'items', 'siguiente'}``, se ejecuta en el pool
+        crear_fila: ``f(parent) -> widget`` que construye una fila vacía
+        actualizar_fila: ``f(widget, item)`` que muestra un elemento en una fila
+        altura_fila: Alto en píxeles de cada fila (incluida la separación)
+        separacion: Espacio vertical entre filas
+        texto_vacio: Mensaje cuando no hay elementos
+    """
+
+    def __init__(self, parent, app, cargar_pagina, crear_fila, actualizar_fila,
+                 altura_fila=70, separacion=10,
+                 texto_vacio="No hay elementos", **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(parent, **kwargs)
+        self.app = app
+        self.cargar_pagina = cargar_pagina
+        self.crear_fila = crear_fila
+        self.actualizar_fila = actualizar_fila
+        self.altura_fila = altura_fila
+        self.separacion = separacion
+        self.texto_vacio = texto_vacio
+
+        self.items = []
+        self._limites = []  # elementos acumulados tras cada página
+        self._filas = []
+        self._top = 0
+        self._siguiente = None
+        self._completa = True  # no se pide nada hasta recargar()
+        self._cargando = False
+        self._peticion = 0
+
+        self._area = ctk.CTkFrame(self, fg_color="transparent")
+        self._area.pack(side="left", fill="both", expand=True)
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+        self._estado = ctk.CTkLabel(self._area, text="", font=ctk.CTkFont(size=16), text_color="gray")
+
+        self._area.bind("<Configure>", lambda _: self._redibujar())
+        self._bind_rueda(self._area)
+        self._redibujar()
+
+    def recargar(self):
+        """Descarta lo cargado y vuelve a pedir la primera página."""
+        self.items = []
+        self._limites = []
+        self._top = 0
+        self._siguiente = None
+        self._completa = False
+        self._cargando = False
+        self._peticion += 1
+        self._cargar_siguiente()
+        self._redibujar()
+
+    def refrescar(self):
+        """Actualiza lo mostrado conservando la posición de desplazamiento.
+
+        Se vuelven a pedir, en una sola tarea, las páginas que cubren hasta
+        la última fila visible; las posteriores se descartan y se pedirán
+        de nuevo al desplazarse. Las filas visibles cuyo elemento no ha
+        cambiado no se tocan.
+        """
+        if not self._limites:
+            self.recargar()
+            return
+
+        ultima_visible = (self._top + self._area.winfo_height()) // self.altura_fila + 1
+        paginas = next(
+            (i + 1 for i, limite in enumerate(self._limites) if limite >= ultima_visible),
+            len(self._limites)
+        )
+
+        def cargar():
+            resultado, cursor = [], None
+            for _ in range(paginas):
+                pagina = self.cargar_pagina(cursor)
+                resultado.append(pagina)
+                cursor = pagina.get('siguiente')
+                if cursor is None:
+                    break
+            return resultado
+
+        self._peticion += 1
+        self._cargando = True
+        peticion = self._peticion
+        self.app.worker.submit(
+            cargar,
+            on_success=lambda resultado: self._recibir_paginas(peticion, resultado),
+            on_error=lambda error: self._error_pagina(peticion, error),
+            owner=self
+        )
+
+    # Carga de páginas
+    def _cargar_siguiente(self):
+        if self._cargando or self._completa:
+            return
+        self._cargando = True
+        peticion = self._peticion
+        self.app.worker.submit(
+            self.cargar_pagina, self._siguiente,
+            on_success=lambda pagina: self._recibir_pagina(peticion, pagina),
+            on_error=lambda error: self._error_pagina(peticion, error),
+            owner=self
+        )
+
+    def _recibir_pagina(self, peticion, pagina):
+        # Respuesta de una carga anterior a recargar()/refrescar(): se descarta
+        if peticion != self._peticion:
+            return
+        self._cargando = False
+        self._anadir_pagina(pagina)
+        self._redibujar()
+
+    def _recibir_paginas(self, peticion, paginas):
+        if peticion != self._peticion:
+            return
+        self._cargando = False
+        self.items = []
+        self._limites = []
+        for pagina in paginas:
+            self._anadir_pagina(pagina)
+        if not paginas:
+            self._siguiente, self._completa = None, True
+        maximo = max(0, len(self.items) * self.altura_fila - self._area.winfo_height())
+        self._top = min(self._top, maximo)
+        self._redibujar()
+
+    def _anadir_pagina(self, pagina):
+        self.items.extend(pagina.get('items', []))
+        self._limites.append(len(self.items))
+        self._siguiente = pagina.get('siguiente')
+        self._completa = self._siguiente is None
+
+    def _error_pagina(self, peticion, error):
+        if peticion != self._peticion:
+            return
+        self._cargando = False
+        self._completa = True
+        self._redibujar()
+
+    # Desplazamiento
+    def _bind_rueda(self, widget):
+        widget.bind("<MouseWheel>", self._on_rueda)
+        widget.bind("<Button-4>", lambda _: self._desplazar(-self.altura_fila))
+        widget.bind("<Button-5>", lambda _: self._desplazar(self.altura_fila))
+        for hijo in widget.winfo_children():
+            self._bind_rueda(hijo)
+
+    def _on_rueda(self, event):
+        self._desplazar(-self.altura_fila if event.delta > 0 else self.altura_fila)
+
+    def _on_scrollbar(self, accion, *args):
+        if accion == "moveto":
+            self._desplazar_a(float(args[0]) * len(self.items) * self.altura_fila)
+        elif accion == "scroll":
+            paso = self.altura_fila if args[1] == "units" else self._area.winfo_height()
+            self._desplazar(int(args[0]) * paso)
+
+    def _desplazar(self, pixeles):
+        self._desplazar_a(self._top + pixeles)
+
+    def _desplazar_a(self, top):
+        maximo = max(0, len(self.items) * self.altura_fila - self._area.winfo_height())
+        top = int(min(max(0, top), maximo))
+        if top != self._top:
+            self._top = top
+            self._redibujar()
+
+    # Dibujo
+    def _redibujar(self):
+        alto = self._area.winfo_height()
+        necesarias = alto // self.altura_fila + 2
+        while len(self._filas) < necesarias:
+            fila = self.crear_fila(self._area)
+            fila.item_actual = None
+            self._bind_rueda(fila)
+            self._filas.append(fila)
+
+        primera = self._top // self.altura_fila
+        desfase = self._top % self.altura_fila
+        for i, fila in enumerate(self._filas):
+            indice = primera + i
+            if i >= necesarias or indice >= len(self.items):
+                fila.place_forget()
+                fila.item_actual = None
+                continue
+            item = self.items[indice]
+            if fila.item_actual != item:
+                self.actualizar_fila(fila, item)
+                fila.item_actual = item
+            fila.place(x=0, y=i * self.altura_fila - desfase + self.separacion // 2,
+                       relwidth=1, height=self.altura_fila - self.separacion)
+
+        if self.items:
+            self._estado.place_forget()
+        else:
+            self._estado.configure(text="⏳ Cargando..." if not self._completa else self.texto_vacio)
+            self._estado.place(relx=0.5, y=40, anchor="n")
+
+        total = len(self.items) * self.altura_fila
+        if total > 0 and alto > 0:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + alto) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+        # Pedir la siguiente página al acercarse al final de lo cargado
+        if not self._completa and primera + 2 * necesarias >= len(self.items):
+            self._cargar_siguiente()
+
+
+class KeyedList(ctk.CTkScrollableFrame):
+    """Lista que se actualiza por diferencias según la clave de cada elemento.
+
+    Al recibir un nuevo resultado solo se crean las filas nuevas, se
+    reconstruyen las que han cambiado y se destruyen las que ya no están;
+    el resto se conserva tal cual (como mucho se reordena). Pensada para
+    listas de tamaño moderado; para tablas grandes, ``VirtualList``.
+
+    Args:
+        parent: Widget contenedor
+        app: Aplicación (usa ``app.worker`` para cargar los datos)
+        cargar: ``f() -> list`` que obtiene los elementos, se ejecuta en el pool
+        crear_fila: ``f(parent, item) -> widget`` que construye la fila (sin empaquetarla)
+        clave: ``f(item)`` que identifica cada elemento (por defecto ``item['id']``)
+        texto_vacio: Mensaje cuando no hay elementos
+        empaquetado: Opciones de ``pack`` de cada fila
+    """
+
+    def __init__(self, parent, app, cargar, crear_fila, clave=lambda item: item['id'],
+                 texto_vacio="No hay elementos", empaquetado=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.app = app
+        self.cargar = cargar
+        self.crear_fila = crear_fila
+        self.clave = clave
+        self.empaquetado = empaquetado or {"fill": "x", "pady": 5, "padx": 10}
+
+        self._filas = {}  # clave -> (item, widget)
+        self._orden = []
+        self._peticion = 0
+        self._vacio = ctk.CTkLabel(self, text="⏳ Cargando...", font=ctk.CTkFont(size=16), text_color="gray")
+        self._vacio.pack(pady=40)
+        self.texto_vacio = texto_vacio
+
+    def refrescar(self):
+        """Pide los elementos en segundo plano y aplica las diferencias."""
+        self._peticion += 1
+        peticion = self._peticion
+        self.app.worker.submit(
+            self.cargar,
+            on_success=lambda items: self._recibir(peticion, items),
+            owner=self
+        )
+
+    def _recibir(self, peticion, items):
+        # Respuesta de un refresco anterior: se descarta
+        if peticion == self._peticion:
+            self.actualizar(items)
+
+    def actualizar(self, items):
+        """Sincroniza las filas con ``items``.
+
+        Returns:
+            Diccionario con las filas 'insertadas', 'actualizadas' y 'eliminadas'
+        """
+        nuevos = {}
+        for item in items:
+            nuevos[self.clave(item)] = item
+        orden = list(nuevos)
+        cambios = {'insertadas': 0, 'actualizadas': 0, 'eliminadas': 0}
+
+        for clave in self._orden:
+            if clave not in nuevos:
+                self._filas.pop(clave)[1].destroy()
+                cambios['eliminadas'] += 1
+
+        colocar = set()
+        for clave in orden:
+            item = nuevos[clave]
+            actual = self._filas.get(clave)
+            if actual is not None and actual[0] == item:
+                continue
+            if actual is not None:
+                actual[1].destroy()
+                cambios['actualizadas'] += 1
+            else:
+                cambios['insertadas'] += 1
+            self._filas[clave] = (item, self.crear_fila(self, item))
+            colocar.add(clave)
+
+        conservadas = [clave for clave in orden if clave not in colocar]
+        if conservadas != [clave for clave in self._orden if clave in nuevos and clave not in colocar]:
+            # Cambió el orden relativo: se reempaqueta todo sin recrear nada
+            for clave in conservadas:
+                self._filas[clave][1].pack_forget()
+            colocar = set(orden)
+
+        anterior = None
+        for i, clave in enumerate(orden):
+            widget = self._filas[clave][1]
+            if clave in colocar:
+                if anterior is not None:
+                    widget.pack(after=anterior, **self.empaquetado)
+                else:
+                    siguiente = next(
+                        (self._filas[k][1] for k in orden[i + 1:] if k not in colocar), None
+                    )
+                    if siguiente is not None:
+                        widget.pack(before=siguiente, **self.empaquetado)
+                    else:
+                        widget.pack(**self.empaquetado)
+            anterior = widget
+        self._orden = orden
+
+        if orden:
+            self._vacio.pack_forget()
+        else:
+            self._vacio.configure(text=self.texto_vacio)
+            self._vacio.pack(pady=40)
+        return cambios
@@ -0,0 +1,114 @@
+"""
+Registro de vistas - Secciones persistentes dentro del área de contenido.
+Responsabilidad única: Construir cada sección una vez y alternar entre ellas.
+
+Cada sección se construye la primera vez que se muestra dentro de su propio
+frame; al navegar solo se oculta la actual y se muestra la elegida. El
+constructor de la sección puede devolver un *refresh hook* que vuelve a
+cargar los datos sin recrear los widgets; se llama cada vez que la sección
+pasa a primer plano.
+
+Cada sección declara además las tablas de las que depende; cuando el
+monitor de cambios informa de que alguna cambió (p. ej. desde otro
+terminal), solo se refresca la sección visible si la afecta.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+import logging
+
+import customtkinter as ctk
+
+logger = logging.getLogger(__name__)
+
+Builder = Callable[[Any], Optional[Callable[[], None]]]
+
+
+class ViewRegistry:
+    """Secciones construidas una sola vez y mostradas u ocultadas al navegar."""
+
+    def __init__(self, container: Any):
+        """Inicializa el registro.
+
+        Args:
+            container: Frame en el que se apilan las secciones
+        """
+        self.container = container
+        self._builders: Dict[str, Builder] = {}
+        self._frames: Dict[str, Any] = {}
+        self._refresh: Dict[str, Optional[Callable[[], None]]] = {}
+        self._tables: Dict[str, FrozenSet[str]] = {}
+        self.current: Optional[str] = None
+
+    def register(self, name: str, builder: Builder, tables: Iterable[str] = ()) -> None:
+        """Registra una sección.
+
+        Args:
+            name: Identificador de la sección
+            builder: ``f(parent)`` que construye la sección en ``parent`` y
+                devuelve opcionalmente su función de refresco
+            tables: Tablas cuyos cambios obligan a refrescarla
+        """
+        self._builders[name] = builder
+        self._tables[name] = frozenset(tables)
+
+    def show(self, name: str, refresh: bool = True) -> None:
+        """Muestra una sección, construyéndola si es la primera vez.
+
+        Args:
+            name: Identificador de la sección
+            refresh: Si se llama al refresh hook de la sección
+        """
+        if name not in self._builders:
+            raise KeyError(f"Sección no registrada: {name}")
+
+        if name not in self._frames:
+            frame = ctk.CTkFrame(self.container, fg_color="transparent")
+            self._frames[name] = frame
+            self._refresh[name] = self._builders[name](frame)
+
+        if self.current != name:
+            if self.current in self._frames:
+                self._frames[self.current].pack_forget()
+            self._frames[name].pack(fill="both", expand=True)
+            self.current = name
+
+        hook = self._refresh.get(name)
+        if refresh and hook is not None:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"Error al refrescar la sección {name}: {e}")
+
+    def refresh(self, name: Optional[str] = None) -> None:
+        """Refresca una sección ya construida (por defecto la visible)."""
+        hook = self._refresh.get(name or self.current)
+        if hook is not None:
+            hook()
+
+    def notify_changed(self, tables: Iterable[str]) -> bool:
+        """Refresca la sección visible si depende de alguna de las tablas.
+
+        Las ocultas no se tocan: se refrescan igualmente al mostrarlas.
+
+        Returns:
+            True si se refrescó la sección visible
+        """
+        if self.current is None or self._tables.get(self.current, frozenset()).isdisjoint(tables):
+            return False
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Error al refrescar la sección {self.current}: {e}")
+            return False
+        return True
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Destruye una sección (o todas) para que se reconstruya al mostrarla."""
+        nombres = [name] if name else list(self._frames)
+        for nombre in nombres:
+            frame = self._frames.pop(nombre, None)
+            self._refresh.pop(nombre, None)
+            if frame is not None:
+                frame.destroy()
+            if self.current == nombre:
+                self.current = None
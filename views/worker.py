@@ -0,0 +1,154 @@
+"""
+Ejecución en segundo plano - Llamadas al controlador fuera del hilo de Tk.
+Responsabilidad única: Mantener la interfaz fluida mientras se consultan datos.
+
+Tk solo admite llamadas desde su hilo principal. Las tareas se ejecutan en un
+pool de hilos acotado y sus resultados se encolan; el hilo de Tk los recoge
+con ``after()`` y ejecuta allí los callbacks. Al navegar a otra sección se
+cancelan las tareas de la vista anterior para que sus resultados no se
+pinten sobre widgets destruidos.
+"""
+
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWorker:
+    """Pool de hilos acotado con entrega de resultados en el hilo de Tk."""
+
+    def __init__(self, root: Any, max_workers: int = 4, poll_interval: int = 30):
+        """Inicializa el pool.
+
+        Args:
+            root: Ventana Tk que recibe los callbacks (``after``)
+            max_workers: Hilos como máximo ejecutando llamadas
+            poll_interval: Milisegundos entre comprobaciones de resultados
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-worker")
+        self._resultados: 'queue.Queue[Tuple[Future, int, Any]]' = queue.Queue()
+        self._pendientes: Set[Future] = set()
+        self._generacion = 0
+        self._sondeando = False
+        self._cerrado = False
+
+    def submit(self, func: Callable, *args,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               owner: Any = None, **kwargs) -> Future:
+        """Ejecuta ``func(*args, **kwargs)`` en segundo plano.
+
+        Debe llamarse desde el hilo de Tk.
+
+        Args:
+            func: Función a ejecutar en el pool
+            on_success: Recibe el resultado en el hilo de Tk
+            on_error: Recibe la excepción en el hilo de Tk (por defecto se registra)
+            owner: Widget del que depende el callback; si ya no existe, se omite
+
+        Returns:
+            Future de la llamada (``cancel()`` descarta también el callback)
+        """
+        if self._cerrado:
+            raise RuntimeError("El pool de tareas está cerrado")
+
+        generacion = self._generacion
+        future = self._executor.submit(func, *args, **kwargs)
+        self._pendientes.add(future)
+        future.add_done_callback(
+            lambda f: self._resultados.put((f, generacion, (on_success, on_error, owner)))
+        )
+        self._programar_sondeo()
+        return future
+
+    def cancel_all(self) -> int:
+        """Cancela las tareas lanzadas hasta ahora (p. ej. al cambiar de vista).
+
+        Las que aún no han empezado no llegan a ejecutarse; las que están en
+        curso terminan, pero su callback se descarta.
+
+        Returns:
+            Número de tareas afectadas
+        """
+        self._generacion += 1
+        afectadas = len(self._pendientes)
+        for future in list(self._pendientes):
+            future.cancel()
+        self._pendientes.clear()
+        return afectadas
+
+    @property
+    def pending(self) -> int:
+        """Tareas de la vista actual aún sin entregar."""
+        return len(self._pendientes)
+
+    def shutdown(self) -> None:
+        """Cancela lo pendiente y detiene el pool sin esperar a lo que está en curso."""
+        self._cerrado = True
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _programar_sondeo(self) -> None:
+        if not self._sondeando:
+            self._sondeando = True
+            self.root.after(self.poll_interval, self._entregar)
+
+    def _entregar(self) -> None:
+        """Ejecuta en el hilo de Tk los callbacks de las tareas terminadas."""
+        self._sondeando = False
+        while True:
+            try:
+                future, generacion, (on_success, on_error, owner) = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            self._pendientes.discard(future)
+            if self._cerrado or generacion != self._generacion or future.cancelled():
+                continue
+            if owner is not None and not owner.winfo_exists():
+                continue
+
+            error = future.exception()
+            try:
+                if error is None:
+                    if on_success is not None:
+                        on_success(future.result())
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    logger.error(f"Error en tarea en segundo plano: {error}")
+            except Exception as e:
+                logger.error(f"Error en callback de tarea en segundo plano: {e}")
+
+        if self._pendientes and not self._cerrado:
+            self._programar_sondeo()
+
+
+class AsyncController:
+    """Fachada que expone los métodos del controlador como llamadas en segundo plano.
+
+    ``async_controller.obtener_clientes(on_success=pintar)`` ejecuta
+    ``controller.obtener_clientes()`` en el pool y entrega la lista a
+    ``pintar`` en el hilo de Tk. Devuelve el ``Future`` de la llamada.
+    """
+
+    def __init__(self, controller: Any, worker: BackgroundWorker):
+        """Inicializa la fachada."""
+        self._controller = controller
+        self._worker = worker
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        metodo = getattr(self._controller, name)
+        if not callable(metodo):
+            raise AttributeError(f"'{name}' no es un método del controlador")
+
+        def llamar(*args, on_success=None, on_error=None, owner=None, **kwargs) -> Future:
+            return self._worker.submit(
+                metodo, *args, on_success=on_success, on_error=on_error, owner=owner, **kwargs
+            )
+        llamar.__name__ = name
+        return llamar